@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Importable building blocks for the Archimedes scripts.
+
+Description:
+The scripts in the parent directory are self-contained programs. The
+modules of this package collect the pieces which are shared between
+them, e.g. alternative number types and reference values of Pi.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.double_double
+'''
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
@@ -0,0 +1,262 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Calculation of Pi with archimedes.netz from asyncio.
+
+Description:
+The script archimedes_netz_lto shows its progress by writing the
+iteration with escape codes to the terminal. A service using asyncio
+needs the progress as data and must not block its event loop. Here the
+class AsyncPi runs PiComputation of archimedes.netz in a process pool.
+Each submitted job publishes events through an async iterator:
+
+    status      "progress", "done" or "cancelled"
+    iteration   last calculated iteration
+    digits      estimated correct places (PiComputation.estimated_digits)
+    elapsed     seconds since the start of the job
+    eta         estimated seconds until the last iteration
+    result      Pi as string (only with status "done")
+
+Every iteration takes about the same time, since the precision is
+fixed. So the ETA is the mean time per iteration times the remaining
+iterations.
+
+A job is cancelled cooperatively. The worker checks an event in every
+iteration, stops the recurrence and reports "cancelled". The process
+pool stays usable for other jobs. Cancelling the task which iterates the
+events cancels the job as well.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.aio
+    python3 -m archimedes.aio --places 5000 --method 0
+    python3 -m archimedes.aio --places 20000 --cancel 2.0
+
+    async with AsyncPi() as service:
+        job = service.submit(1000)
+        async for event in job.events():
+            print(event["iteration"], event["digits"], event["eta"])
+        acstr = await job.result()
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-arguments
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+import asyncio
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+# Import the modules of the package.
+from archimedes.netz import PiComputation, init_values, correct_digits, reference_digits
+
+# Define the default number of iterations between two progress events.
+REPORT = 10
+
+# Define the seconds between two checks of a silent worker.
+POLL = 0.5
+
+# ----------------------------------------------------------------------
+# Function _event()
+# ----------------------------------------------------------------------
+def _event(status, computation, start, result=None):
+    '''Return an event of a computation as dictionary.'''
+    elapsed = perf_counter() - start
+    done = computation.i + 1
+    remaining = computation.iteration - computation.i
+    eta = elapsed/done*remaining if done > 0 else None
+    return {"status": status, "iteration": computation.i,
+            "digits": computation.estimated_digits(), "elapsed": elapsed,
+            "eta": eta, "result": result}
+
+# ----------------------------------------------------------------------
+# Function run_job()
+# ----------------------------------------------------------------------
+def run_job(places, precision, iteration, method, messages, stop, report=REPORT):
+    '''Run a computation in a worker process. Put the events into the
+    queue messages and stop if the event stop is set. Return Pi as
+    string or None if cancelled.'''
+    start = perf_counter()
+    computation = PiComputation(places, precision, iteration, method=method)
+    computation.reset()
+    while computation.i < computation.iteration:
+        # Stop the recurrence if the job is cancelled.
+        if stop.is_set():
+            messages.put(_event("cancelled", computation, start))
+            return None
+        computation.step()
+        if computation.i % report == 0:
+            messages.put(_event("progress", computation, start))
+    # Calculate the Archimedes constant and report the result.
+    acstr = str(computation.constant())
+    messages.put(_event("done", computation, start, acstr))
+    return acstr
+
+# ----------------------------------------------------------------------
+# Class PiJob
+# ----------------------------------------------------------------------
+class PiJob:
+    '''A computation submitted to AsyncPi.'''
+
+    def __init__(self, future, messages, stop, places, precision, iteration, method):
+        # Store the future of the worker and the communication.
+        self._future = future
+        self._messages = messages
+        self._stop = stop
+        self.places = places
+        self.precision = precision
+        self.iteration = iteration
+        self.method = method
+        self.last = None
+
+    async def _get(self):
+        '''Wait for the next event or return None after POLL seconds.'''
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, self._messages.get, True, POLL)
+        except queue.Empty:
+            return None
+
+    async def events(self):
+        '''Iterate the events until the job is done or cancelled.'''
+        try:
+            while self.last is None or self.last["status"] == "progress":
+                event = await self._get()
+                if event is None:
+                    # Raise the error of a worker which died silently.
+                    if self._future.done():
+                        self._future.result()
+                        return
+                    continue
+                self.last = event
+                yield event
+        except asyncio.CancelledError:
+            # Cancel the job with the task iterating the events.
+            self.cancel()
+            raise
+
+    def cancel(self):
+        '''Ask the worker to stop the recurrence.'''
+        self._stop.set()
+
+    def done(self):
+        '''Return True if the worker has finished.'''
+        return self._future.done()
+
+    async def result(self):
+        '''Wait for the worker and return Pi as string or None if the
+        job has been cancelled.'''
+        return await self._future
+
+# ----------------------------------------------------------------------
+# Class AsyncPi
+# ----------------------------------------------------------------------
+class AsyncPi:
+    '''Process pool for computations of Pi used from asyncio.'''
+
+    def __init__(self, workers=None):
+        # Store the number of workers, the pool is created by start().
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+        self._manager = None
+        self._jobs = []
+
+    async def start(self):
+        '''Start the process pool and the manager of the queues.'''
+        loop = asyncio.get_running_loop()
+        self._manager = await loop.run_in_executor(None, self._start_manager)
+        self._executor = ProcessPoolExecutor(self.workers)
+        return self
+
+    @staticmethod
+    def _start_manager():
+        '''Create and start a manager for queues and events.'''
+        manager = multiprocessing.Manager()
+        return manager
+
+    async def close(self):
+        '''Cancel all jobs and shut down the pool and the manager.'''
+        for job in self._jobs:
+            if not job.done():
+                job.cancel()
+        loop = asyncio.get_running_loop()
+        if self._executor is not None:
+            await loop.run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+        if self._manager is not None:
+            await loop.run_in_executor(None, self._manager.shutdown)
+            self._manager = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def submit(self, places, method=0, precision=None, iteration=None, report=REPORT):
+        '''Submit a computation and return its PiJob.'''
+        # Predict precision and iteration if not given.
+        if precision is None or iteration is None:
+            predicted = init_values(places, method=method)
+            precision = precision or predicted[0]
+            iteration = iteration or predicted[1]
+        messages = self._manager.Queue()
+        stop = self._manager.Event()
+        future = asyncio.wrap_future(self._executor.submit(
+            run_job, places, precision, iteration, method, messages, stop, report))
+        job = PiJob(future, messages, stop, places, precision, iteration, method)
+        self._jobs.append(job)
+        return job
+
+# ----------------------------------------------------------------------
+# Coroutine demo()
+# ----------------------------------------------------------------------
+async def demo(places, method, cancel=None, report=REPORT):
+    '''Calculate Pi, print the events and cancel after some seconds.'''
+    async with AsyncPi(workers=1) as service:
+        job = service.submit(places, method=method, report=report)
+        if cancel is not None:
+            asyncio.get_running_loop().call_later(cancel, job.cancel)
+        async for event in job.events():
+            eta = "-" if event["eta"] is None else "{0:.2f}".format(event["eta"])
+            print("{status:<9s} | {iteration:>9d} | {digits:>7d} | {elapsed:>11.2f} | ".format(
+                **event) + "{0:>8s}".format(eta))
+        acstr = await job.result()
+    # Return Pi as string or None.
+    return acstr
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Calculation of Pi from asyncio.")
+    parser.add_argument("--places", type=int, default=1000)
+    parser.add_argument("--method", type=int, default=0)
+    parser.add_argument("--report", type=int, default=50)
+    parser.add_argument("--cancel", type=float, help="cancel after seconds")
+    args = parser.parse_args(argv)
+    # Print the header of the events.
+    print("{0:<9s} | {1:>9s} | {2:>7s} | {3:>11s} | {4:>8s}".format(
+        "Status", "Iteration", "Digits", "Elapsed [s]", "ETA [s]"))
+    print("{0}".format(57*"-"))
+    # Run the computation.
+    acstr = asyncio.run(demo(args.places, args.method, args.cancel, args.report))
+    # Print the correct places if the reference is long enough.
+    if acstr is not None and args.places <= 10000:
+        _, number = correct_digits(acstr[:args.places+2], reference_digits())
+        print("\nMatching places calculated:", number)
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
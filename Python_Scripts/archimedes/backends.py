@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Pluggable number types for the recurrences.
+
+Description:
+A backend bundles a number type with the handling of its precision. The
+generators of archimedes.sequences are written once for all number
+types. A backend provides
+
+    number(value)               create a number from int, float or str
+    context(places, iteration)  context manager setting the precision
+    to_string(x, places)        string of x with the requested places
+
+The precision of the hardware based number types is fixed, they support
+a limited number of places only (see max_places).
+
+Usage:
+    backend = BACKENDS["decimal"]
+    with backend.context(100, 170):
+        x = backend.number(3).sqrt()
+        print(backend.to_string(x, 100))
+'''
+# pylint: disable=invalid-name
+# pylint: disable=unused-argument
+# pylint: disable=too-few-public-methods
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import math
+from contextlib import nullcontext
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import getcontext, localcontext, ROUND_HALF_DOWN
+
+# Import the number types of the package.
+from archimedes.double_double import DoubleDouble, QuadDouble
+from archimedes.fixed_point import FixedPoint, fixedcontext
+
+# ----------------------------------------------------------------------
+# Class FloatBackend
+# ----------------------------------------------------------------------
+class FloatBackend:
+    '''Hardware floats.'''
+    name = "float"
+    max_places = 15
+
+    def number(self, value):
+        '''Create a number.'''
+        return float(value)
+
+    def context(self, places, iteration=0):
+        '''The precision of floats is fixed.'''
+        return nullcontext()
+
+    def to_string(self, x, places):
+        '''Return x with the requested places.'''
+        return repr(float(x))[:places+2]
+
+# ----------------------------------------------------------------------
+# Class DoubleDoubleBackend
+# ----------------------------------------------------------------------
+class DoubleDoubleBackend(FloatBackend):
+    '''Double-double numbers from archimedes.double_double.'''
+    name = "double-double"
+    max_places = 31
+
+    def number(self, value):
+        '''Create a number.'''
+        return DoubleDouble(value)
+
+    def to_string(self, x, places):
+        '''Return x with the requested places.'''
+        return str(x)[:places+2]
+
+# ----------------------------------------------------------------------
+# Class QuadDoubleBackend
+# ----------------------------------------------------------------------
+class QuadDoubleBackend(DoubleDoubleBackend):
+    '''Quad-double numbers from archimedes.double_double.'''
+    name = "quad-double"
+    max_places = 62
+
+    def number(self, value):
+        '''Create a number.'''
+        return QuadDouble(value)
+
+# ----------------------------------------------------------------------
+# Class DecimalBackend
+# ----------------------------------------------------------------------
+class DecimalBackend:
+    '''Numbers of the standard Python module decimal.'''
+    name = "decimal"
+    max_places = None
+
+    def __init__(self, guard=10, rounding=ROUND_HALF_DOWN):
+        # Store the number of guard digits and the rounding method.
+        self.guard = guard
+        self.rounding = rounding
+
+    def number(self, value):
+        '''Create a number.'''
+        return D(value)
+
+    def context(self, places, iteration=0):
+        '''Set the precision to places plus guard digits.'''
+        ctx = getcontext().copy()
+        ctx.prec = places + self.guard
+        ctx.rounding = self.rounding
+        return localcontext(ctx)
+
+    def to_string(self, x, places):
+        '''Return x with the requested places.'''
+        return str(x)[:places+2]
+
+# ----------------------------------------------------------------------
+# Class FixedPointBackend
+# ----------------------------------------------------------------------
+class FixedPointBackend:
+    '''Binary fixed point numbers from archimedes.fixed_point.'''
+    name = "fixed point"
+    max_places = None
+
+    def __init__(self, guard=64):
+        # Store the number of guard bits.
+        self.guard = guard
+
+    def number(self, value):
+        '''Create a number.'''
+        return FixedPoint(value)
+
+    def context(self, places, iteration=0):
+        '''Set the fraction bits to the places plus one bit per
+        iteration for the shrinking edges plus guard bits.'''
+        bits = math.ceil(places*math.log2(10)) + iteration + self.guard
+        return fixedcontext(bits)
+
+    def to_string(self, x, places):
+        '''Return x with the requested places.'''
+        return x.to_string(places)
+
+# Define the dictionary with the available backends.
+BACKENDS = {"float": FloatBackend(),
+            "dd": DoubleDoubleBackend(),
+            "qd": QuadDoubleBackend(),
+            "decimal": DecimalBackend(),
+            "fixed": FixedPointBackend()}
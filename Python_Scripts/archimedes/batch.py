@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Batched evaluation of the Archimedes recurrences using NumPy.
+
+Description:
+The scripts start from the hexagon and a single radius. Here the
+recurrences of Archimedes (edges), Pfaff (perimeters) and Gregory
+(areas) are run for many starting polygons and radii at once. Each
+column of the returned tables belongs to one pair of polygon and
+radius, each row to one iteration.
+
+The calculation is done either in float or in double-double
+arithmetic. The double-double tables are DoubleDouble objects whose
+hi and lo parts are 2-D arrays.
+
+The start values of the polygons are calculated algebraically from
+square roots. Sine and cosine are not used, since they assume that Pi
+is already known. Supported are the polygons with 3, 4, 5, 6, 8, 10
+and 12 edges.
+
+The recurrence of Archimedes for the edges is used in the form
+                 r⋅s
+    s₂ₙ = ─────────────────────
+          ___________________
+         ╱     2     ________
+       ╲╱  2⋅r + r⋅╲╱4⋅r² - s²
+
+which is algebraically the same as the known form with the difference
+of two roots, but does not lose places by cancellation.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.batch
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-locals
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import time
+
+# Import the module numpy.
+import numpy as np
+
+# Import the double-double numbers.
+from archimedes.double_double import DoubleDouble
+from archimedes.reference import pi_digits, correct_digits
+
+# Define the tuple with the supported recurrences.
+RECURRENCES = ("archimedes", "pfaff", "gregory")
+
+# Define the tuple with the supported starting polygons.
+POLYGONS = (3, 4, 5, 6, 8, 10, 12)
+
+# ----------------------------------------------------------------------
+# Function _sqrt()
+# ----------------------------------------------------------------------
+def _sqrt(x):
+    '''Square root of a float array or of a double-double array.'''
+    # Use the method of the number type if there is one.
+    if isinstance(x, DoubleDouble):
+        return x.sqrt()
+    # Return the NumPy square root.
+    return np.sqrt(x)
+
+# ----------------------------------------------------------------------
+# Function polygon_constants()
+# ----------------------------------------------------------------------
+def polygon_constants(n, num):
+    '''Return tan(π/n) and sin(π/n) as algebraic expressions.
+
+    num is the number type, e.g. float or DoubleDouble.
+    '''
+    # Define the square root of the number type.
+    if num is float:
+        sq = lambda x: float(x)**0.5
+    else:
+        sq = lambda x: num(x).sqrt()
+    # Define the required square roots.
+    r2, r3, r5 = sq(2), sq(3), sq(5)
+    # Calculate the values depending on the number of edges.
+    if n == 3:
+        return r3, r3/2
+    if n == 4:
+        return num(1), r2/2
+    if n == 5:
+        return sq(5 - 2*r5), sq(10 - 2*r5)/4
+    if n == 6:
+        return 1/r3, num(1)/2
+    if n == 8:
+        return r2 - 1, sq(2 - r2)/2
+    if n == 10:
+        return sq(25 - 10*r5)/5, (r5 - 1)/4
+    if n == 12:
+        return 2 - r3, (r2*r3 - r2)/4
+    # Raise an error for an unsupported polygon.
+    raise ValueError("Unsupported starting polygon: {0}".format(n))
+
+# ----------------------------------------------------------------------
+# Function _columns()
+# ----------------------------------------------------------------------
+def _columns(polygons, radii, arith):
+    '''Create the column vectors of edges, radii, tan and sin values.'''
+    # Build the cartesian product polygon x radius.
+    cols = [(n, r) for n in polygons for r in radii]
+    edges = np.array([float(n) for n, _ in cols])
+    if arith == "float":
+        consts = {n: polygon_constants(n, float) for n in polygons}
+        radius = np.array([float(r) for _, r in cols])
+        tan = np.array([consts[n][0] for n, _ in cols])
+        sin = np.array([consts[n][1] for n, _ in cols])
+    elif arith == "dd":
+        consts = {n: polygon_constants(n, DoubleDouble) for n in polygons}
+        radius = DoubleDouble(np.array([DoubleDouble(r).hi for _, r in cols]),
+                              np.array([DoubleDouble(r).lo for _, r in cols]))
+        tan = DoubleDouble(np.array([consts[n][0].hi for n, _ in cols]),
+                           np.array([consts[n][0].lo for n, _ in cols]))
+        sin = DoubleDouble(np.array([consts[n][1].hi for n, _ in cols]),
+                           np.array([consts[n][1].lo for n, _ in cols]))
+    else:
+        raise ValueError("Unknown arithmetic: {0}".format(arith))
+    # Return the column vectors.
+    return edges, radius, tan, sin
+
+# ----------------------------------------------------------------------
+# Function _stack()
+# ----------------------------------------------------------------------
+def _stack(rows):
+    '''Stack the rows of a table to a 2-D array.'''
+    # Stack the parts of double-double numbers separately.
+    if isinstance(rows[0], DoubleDouble):
+        return DoubleDouble(np.stack([x.hi for x in rows]),
+                            np.stack([x.lo for x in rows]))
+    # Return the stacked float array.
+    return np.stack(rows)
+
+# ----------------------------------------------------------------------
+# Function batch_tables()
+# ----------------------------------------------------------------------
+def batch_tables(recurrence="pfaff", polygons=POLYGONS, radii=(1,),
+                 iteration=20, arith="float"):
+    '''Run a recurrence for all pairs of starting polygon and radius.
+
+    Arguments:
+        recurrence (str): "archimedes", "pfaff" or "gregory"
+        polygons (tuple): numbers of edges of the starting polygons
+        radii (tuple): radii of the circle
+        iteration (int): number of iterations
+        arith (str): "float" or "dd" (double-double)
+
+    Returns:
+        dict: polygons, radii (column labels) as well as edges, lower,
+        upper and estimate as tables with iteration+1 rows.
+
+    The lower and the upper bound as well as the estimate (arithmetic
+    mean of both) are approximations of Pi, i.e. they are divided by
+    the radius respectively by the squared radius.
+    '''
+    # Create the column vectors.
+    n, r, t, s = _columns(polygons, radii, arith)
+    # Initialise the start values of the recurrence.
+    if recurrence == "archimedes":
+        a, b = 2*r*t, 2*r*s            # outer and inner edge
+        scale = lambda k: n*2**k/(2*r)
+    elif recurrence == "pfaff":
+        a, b = n*r*t, n*r*s            # half of outer and inner perimeter
+        scale = lambda k: 1/r
+    elif recurrence == "gregory":
+        a, b = n*r*r*t, n*r*r*s*s/t    # outer and inner area
+        scale = lambda k: 1/(r*r)
+    else:
+        raise ValueError("Unknown recurrence: {0}".format(recurrence))
+    # Initialise the lists for the rows of the tables.
+    edges, lower, upper, estimate = [], [], [], []
+    # Run an iteration from 0 to iteration plus 1.
+    for k in range(0, iteration+1):
+        # No iteration on first loop.
+        if k > 0:
+            if recurrence == "archimedes":
+                b = r*b/_sqrt(2*r*r + r*_sqrt(4*r*r - b*b))
+                a = b/_sqrt(1 - (b/(2*r))*(b/(2*r)))
+            elif recurrence == "pfaff":
+                a = (2*a*b)/(a + b)
+                b = _sqrt(b*a)
+            else:
+                b = _sqrt(a*b)
+                a = (2*a*b)/(a + b)
+        # Store the row of the tables.
+        f = scale(k)
+        edges.append(n*2**k)
+        lower.append(b*f)
+        upper.append(a*f)
+        estimate.append((a + b)*f/2)
+    # Return the tables.
+    return {"polygons": np.array([p for p in polygons for _ in radii]),
+            "radii": np.array([float(x) for _ in polygons for x in radii]),
+            "edges": np.stack(edges),
+            "lower": _stack(lower),
+            "upper": _stack(upper),
+            "estimate": _stack(estimate)}
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Get the reference value of Pi.
+    refpi = pi_digits(40)
+    radii = (0.5, 1, 2, 10)
+    # Print a summary for all recurrences.
+    for arith, iteration in (("float", 26), ("dd", 52)):
+        for recurrence in RECURRENCES:
+            start = time.perf_counter()
+            table = batch_tables(recurrence, POLYGONS, radii, iteration, arith)
+            elapsed = time.perf_counter() - start
+            print("\n{0} ({1}, {2} iterations, {3} columns, {4:.4f} s)".format(
+                recurrence, arith, iteration, len(table["polygons"]), elapsed))
+            print("{0:<6s} | {1:<6s} | {2:<6s} | {3:<s}".format(
+                "Edges", "Radius", "Places", "Pi"))
+            print("{0}".format(60*"-"))
+            est = table["estimate"]
+            for j in range(0, len(table["polygons"]), len(radii)):
+                if arith == "dd":
+                    value = str(DoubleDouble(est.hi[-1, j], est.lo[-1, j]))
+                else:
+                    value = repr(float(est[-1, j]))
+                _, places = correct_digits(value, refpi)
+                print("{0:<6d} | {1:<6g} | {2:<6d} | {3:<s}".format(
+                    int(table["polygons"][j]), table["radii"][j], places, value))
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
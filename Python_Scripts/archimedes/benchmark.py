@@ -0,0 +1,221 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Benchmark of the methods with a stored baseline.
+
+Description:
+Every method runs with Decimal numbers until its estimate of Pi has the
+requested number of correct places. The precision is the one predicted
+by init_values() of archimedes.calibration for the method, so that the
+times are the ones of a real calculation. Recorded are
+
+    time        best wall-clock time of the repeated runs in seconds
+    iteration   number of iterations needed
+    precision   used decimal precision
+    peak        peak of the traced memory in bytes
+    correct     number of correct places
+
+The iteration is determined once by comparing every estimate with the
+reference. The timed runs then only calculate up to this iteration, so
+the comparison is not part of the time. The peak memory is measured in
+an extra run, since tracemalloc slows the calculation down.
+
+The results are written as JSON. If a baseline is given, the results
+are compared with it. A regression is flagged if the time or the peak
+memory grows by more than the threshold, if more iterations are needed
+or if less places are correct. The baseline benchmark_baseline.json was
+recorded with the default settings, times from other computers are only
+roughly comparable.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.benchmark
+    python3 -m archimedes.benchmark --places 100 1000 --output results.json
+    python3 -m archimedes.benchmark --baseline archimedes/benchmark_baseline.json
+    python3 -m archimedes.benchmark --output archimedes/benchmark_baseline.json
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+# Import the modules of the package.
+from archimedes.backends import DecimalBackend
+from archimedes.calibration import load_models, init_values
+from archimedes.reference import pi_digits, correct_digits
+from archimedes.sequences import sequence, last
+
+# Define the tuple with the benchmarked methods.
+METHODS = ("inner_polygon", "outer_polygon", "inner_from_outer_method0",
+           "inner_from_outer_method1", "inner_from_outer_method2",
+           "inner_from_outer_method3", "pfaff", "gregory", "snellius", "doerrie",
+           "netz", "aitken")
+
+# Define the default places and the allowed relative slowdown.
+PLACES = (100, 1000)
+THRESHOLD = 0.25
+
+# Define the version of the JSON layout.
+FORMAT = 1
+
+# ----------------------------------------------------------------------
+# Function find_iteration()
+# ----------------------------------------------------------------------
+def find_iteration(method, places, backend, maxiter=None):
+    '''Return the first iteration with the requested correct places and
+    the number of correct places reached.'''
+    # Limit the number of iterations.
+    if maxiter is None:
+        maxiter = 4*places + 40
+    refpi = pi_digits(places)
+    correct = 0
+    # Run the recurrence until the goal or the maximum is reached.
+    with backend.context(places, maxiter):
+        for i, _, _, _, estimate in sequence(method, backend.number):
+            _, correct = correct_digits(backend.to_string(estimate, places), refpi)
+            if correct >= places or i >= maxiter:
+                break
+    # Return the iteration and the correct places.
+    return i, correct
+
+# ----------------------------------------------------------------------
+# Function _calculate()
+# ----------------------------------------------------------------------
+def _calculate(method, places, iteration, backend):
+    '''Calculate the estimate of the given iteration as string.'''
+    with backend.context(places, iteration):
+        row = last(sequence(method, backend.number), iteration)
+        return backend.to_string(row[4], places)
+
+# ----------------------------------------------------------------------
+# Function method_precision()
+# ----------------------------------------------------------------------
+def method_precision(method, places, models=None):
+    '''Return the precision of a method, the calibrated one if possible.'''
+    if models is None:
+        models = load_models()
+    # Use the generous precision of the calibration as fallback.
+    if method not in models:
+        return 2*places + 20
+    return init_values(places, method, models)[0]
+
+# ----------------------------------------------------------------------
+# Function benchmark()
+# ----------------------------------------------------------------------
+def benchmark(method, places, repeat=3, models=None):
+    '''Benchmark a method and return a result dictionary.'''
+    # Use the predicted precision of the method.
+    backend = DecimalBackend(guard=method_precision(method, places, models) - places)
+    iteration, correct = find_iteration(method, places, backend)
+    # Measure the best time of the repeated runs.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calculate(method, places, iteration, backend)
+        best = min(best, time.perf_counter() - start)
+    # Measure the peak memory in a separate run.
+    tracemalloc.start()
+    _calculate(method, places, iteration, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Return the result.
+    return {"method": method, "places": places, "time": best,
+            "iteration": iteration, "precision": places + backend.guard,
+            "peak": peak, "correct": correct}
+
+# ----------------------------------------------------------------------
+# Function run_suite()
+# ----------------------------------------------------------------------
+def run_suite(methods=METHODS, places_list=PLACES, repeat=3, verbose=True):
+    '''Benchmark all methods for all places and return the suite.'''
+    results = []
+    models = load_models()
+    for places in places_list:
+        for method in methods:
+            res = benchmark(method, places, repeat=repeat, models=models)
+            results.append(res)
+            if verbose:
+                print("{method:<24s} | {places:>6d} | {time:>10.4f} | {iteration:>9d} | "
+                      "{precision:>9d} | {peak:>10d} | {correct:>7d}".format(**res))
+    # Return the results with a description of the system.
+    return {"format": FORMAT, "python": platform.python_version(),
+            "machine": platform.machine(), "results": results}
+
+# ----------------------------------------------------------------------
+# Function compare()
+# ----------------------------------------------------------------------
+def compare(suite, baseline, threshold=THRESHOLD):
+    '''Compare a suite with a baseline and return the regressions.'''
+    # Index the baseline by method and places.
+    base = {(r["method"], r["places"]): r for r in baseline["results"]}
+    regressions = []
+    for res in suite["results"]:
+        ref = base.get((res["method"], res["places"]))
+        if ref is None:
+            continue
+        # Check time and memory against the threshold.
+        for key in ("time", "peak"):
+            if ref[key] > 0 and res[key] > ref[key]*(1 + threshold):
+                regressions.append((res["method"], res["places"], key, ref[key], res[key]))
+        # Check iterations and correct places exactly.
+        if res["iteration"] > ref["iteration"]:
+            regressions.append((res["method"], res["places"], "iteration",
+                                ref["iteration"], res["iteration"]))
+        if res["correct"] < ref["correct"]:
+            regressions.append((res["method"], res["places"], "correct",
+                                ref["correct"], res["correct"]))
+    # Return the list of regressions.
+    return regressions
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Benchmark of the methods.")
+    parser.add_argument("--places", type=int, nargs="+", default=list(PLACES))
+    parser.add_argument("--methods", nargs="+", default=list(METHODS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+    # Print the header of the table.
+    print("{0:<24s} | {1:>6s} | {2:>10s} | {3:>9s} | {4:>9s} | {5:>10s} | {6:>7s}".format(
+        "Method", "Places", "Time [s]", "Iteration", "Precision", "Peak [B]", "Correct"))
+    print("{0}".format(95*"-"))
+    # Run the suite and write the results.
+    suite = run_suite(args.methods, args.places, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(suite, fh, indent=2)
+            fh.write("\n")
+    # Compare with the baseline.
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(suite, baseline, args.threshold)
+        print("\nComparison with {0} (threshold {1:.0%}):".format(args.baseline, args.threshold))
+        for method, places, key, old, new in regressions:
+            print("REGRESSION {0:<24s} | {1:>6d} | {2:<9s} | {3} -> {4}".format(
+                method, places, key, old, new))
+        if not regressions:
+            print("No regressions.")
+        # Signal regressions by the exit code.
+        return 1 if regressions else 0
+    # End of function. Return 0.
+    return 0
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Most correct places of Pi within a wall-clock budget.
+
+Description:
+The script archimedes_netz_lto calculates a requested number of places.
+Often the time is given instead, e.g. "whatever can be calculated in 10
+minutes". Here the places are chosen for a budget of seconds:
+
+    1. A quick calibration measures the seconds per iteration and the
+       seconds of the refinement (mean and string conversion) for a
+       geometric ladder of places. The ladder stops when a probe needs
+       more than PROBE_SHARE of the budget.
+    2. For both costs a power law t = c*places^k is fitted
+       (archimedes.scaling.fit_power_law).
+    3. The predicted time of places is the iterations of init_values()
+       (with its safety margin) times the cost per iteration plus the
+       cost of the refinement. The largest places with a predicted time
+       below SAFETY times the remaining budget are bisected.
+    4. The calculation runs with a deadline. If it falls behind, it
+       stops at the deadline. In any case the result is cut to the
+       places estimated from the gap of the perimeters
+       (PiComputation.estimated_digits()), which are certified.
+
+The time of the calibration is part of the budget.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.budget --budget 10
+    python3 -m archimedes.budget --budget 600 --method 0
+
+    places, precision, iteration = plan(600)
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+from time import perf_counter
+
+# Import the modules of the package.
+from archimedes.netz import PiComputation, init_values, correct_digits, reference_digits
+from archimedes.scaling import fit_power_law
+
+# Define the places of the first probe and the factor of the ladder.
+LADDER = (500, 2)
+
+# Define the iterations measured per probe.
+SAMPLES = 10
+
+# Define the share of the budget a single probe may use.
+PROBE_SHARE = 0.02
+
+# Define the share of the remaining budget which is planned.
+SAFETY = 0.8
+
+# Define the smallest number of places.
+MINIMUM = 10
+
+# ----------------------------------------------------------------------
+# Function probe()
+# ----------------------------------------------------------------------
+def probe(places, method=0, samples=SAMPLES):
+    '''Return the seconds per iteration and the seconds of refinement
+    and string conversion for the places.'''
+    computation = PiComputation(places, method=method)
+    computation.reset()
+    # Measure some iterations after the first one.
+    computation.step()
+    t0 = perf_counter()
+    for _ in range(samples):
+        computation.step()
+    t1 = perf_counter()
+    str(computation.constant())
+    t2 = perf_counter()
+    return (t1 - t0)/samples, t2 - t1
+
+# ----------------------------------------------------------------------
+# Function calibrate()
+# ----------------------------------------------------------------------
+def calibrate(budget, method=0, ladder=LADDER):
+    '''Probe a ladder of places and return the fitted power laws of the
+    cost per iteration and of the refinement.'''
+    places, factor = ladder
+    rungs, steps, finals = [], [], []
+    while True:
+        t0 = perf_counter()
+        step, final = probe(places, method)
+        rungs.append(places)
+        steps.append(step)
+        finals.append(final)
+        # Stop if the next probe would need too much of the budget.
+        if len(rungs) >= 3 and (perf_counter() - t0)*factor**2 > PROBE_SHARE*budget:
+            break
+        places *= factor
+    # Fit the costs over the places.
+    return {"step": fit_power_law(rungs, steps), "final": fit_power_law(rungs, finals),
+            "rungs": rungs}
+
+# ----------------------------------------------------------------------
+# Function predict_time()
+# ----------------------------------------------------------------------
+def predict_time(places, model, method=0):
+    '''Return the predicted seconds of a calculation with the places.'''
+    _, iteration = init_values(places, method=method)
+    c, k = model["step"]
+    cf, kf = model["final"]
+    return (iteration + 1)*c*places**k + cf*places**kf
+
+# ----------------------------------------------------------------------
+# Function plan()
+# ----------------------------------------------------------------------
+def plan(budget, method=0, model=None):
+    '''Return places, precision and iteration of the largest calculation
+    which fits into the budget including the calibration.'''
+    start = perf_counter()
+    if model is None:
+        model = calibrate(budget, method)
+    available = SAFETY*(budget - (perf_counter() - start))
+    # Bisect the largest places with a predicted time in the budget.
+    low, high = MINIMUM, 2*MINIMUM
+    while predict_time(high, model, method) <= available:
+        low, high = high, 2*high
+    while high - low > 1:
+        middle = (low + high)//2
+        if predict_time(middle, model, method) <= available:
+            low = middle
+        else:
+            high = middle
+    precision, iteration = init_values(low, method=method)
+    return low, precision, iteration
+
+# ----------------------------------------------------------------------
+# Function run_budget()
+# ----------------------------------------------------------------------
+def run_budget(budget, method=0, progress=False):
+    '''Calculate the most places within the budget and return a
+    dictionary with the plan, the result and the times.'''
+    start = perf_counter()
+    deadline = start + budget
+    places, precision, iteration = plan(budget, method)
+    planned = perf_counter() - start
+    # Calculate with the deadline.
+    computation = PiComputation(places, precision, iteration, method=method)
+    acstr, i = computation.run(progress=progress, deadline=deadline)
+    # Cut the result to the estimated correct places, also if not stopped.
+    certified = computation.estimated_digits()
+    return {"places": places, "precision": precision, "iteration": iteration,
+            "used_iteration": i, "stopped": computation.stopped, "certified": certified,
+            "result": acstr[:certified+2], "calibration": planned,
+            "time": perf_counter() - start}
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Most places of Pi within a budget.")
+    parser.add_argument("--budget", type=float, default=10.0, help="seconds")
+    parser.add_argument("--method", type=int, default=0)
+    args = parser.parse_args(argv)
+    # Run the calculation.
+    res = run_budget(args.budget, args.method)
+    # Print the plan and the result.
+    print("Budget: {0:.2f} s".format(args.budget))
+    print("Calibration: {0:.2f} s".format(res["calibration"]))
+    print("Planned places:", res["places"])
+    print("Precision:", res["precision"])
+    print("Predicted iteration:", res["iteration"])
+    print("Used iteration:", res["used_iteration"])
+    print("Stopped at deadline:", res["stopped"])
+    print("Certified places:", res["certified"])
+    print("Time: {0:.2f} s".format(res["time"]))
+    if res["certified"] <= 10000:
+        _, number = correct_digits(res["result"], reference_digits())
+        print("Matching places calculated:", number)
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
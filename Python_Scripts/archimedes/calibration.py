@@ -0,0 +1,284 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Calibration of the minimal precision and iteration per method.
+
+Description:
+The scripts use hand-tuned pairs of precision and iteration, e.g. 202
+and 165 for 100 places with the original inner polygon. The function
+init_values() of archimedes_netz_lto predicts them by
+
+    precision = 1.00*places + 16
+    iteration = 0.56*places + 8
+
+which is only valid for the method of Netz. Here the minimal values are
+searched for every method of archimedes.sequences:
+
+1. With a generous precision of 2*places + 20 the recurrence runs until
+   the estimate has the requested places. This is the minimal iteration,
+   since fewer iterations can not be compensated by precision.
+2. The minimal precision for this iteration is searched by bisection.
+   Instead of one probe per step, one probe per worker is run in
+   parallel, i.e. the interval is divided into workers + 1 parts.
+
+The measured pairs of all calibrated places are fitted by a straight
+line. The line is shifted up to the largest deviation, so that none of
+the calibrated pairs lies above it. The models are stored as JSON and
+used by init_values() of this module and of archimedes_netz_lto.
+
+The calibrated pairs are minimal, one place is lost with one iteration
+or one digit less. init_values() therefore predicts the values for
+GUARD_PLACES more places and adds GUARD_DIGITS to the precision. The
+lines are only fitted between the smallest and the largest calibrated
+places (calibrated_range()). Outside of this range the margin grows by
+EXTRAPOLATION places per place and archimedes.netz uses at least the
+base values of archimedes_netz_lto.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.calibration [places ...]
+    python3 -m archimedes.calibration 50 100 200 400 800
+'''
+# pylint: disable=invalid-name
+# pylint: disable=import-outside-toplevel
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import json
+import math
+import os
+import sys
+from functools import lru_cache, partial
+
+# Import the modules of the package.
+from archimedes.backends import DecimalBackend
+from archimedes.reference import pi_digits, correct_digits
+from archimedes.sequences import SEQUENCES, sequence, last
+
+# Define the default places of the calibration.
+PLACES = (50, 100, 200, 400, 800)
+
+# Define the file with the calibrated models.
+CALIBRATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "calibration.json")
+
+# Define the hand-tuned pairs of the scripts (places, precision, iteration).
+HAND_TUNED = {"inner_polygon": (100, 202, 165),   # decimal_archimedes_original
+              "gregory": (100, 102, 166),         # gregory
+              "snellius": (100, 102, 83),         # archimedes_snellius_dec
+              "doerrie": (100, 102, 82),          # archimedes_doerrie_dec
+              "doerrie_snellius": (100, 102, 81), # archimedes_doerrie_snellius_dec
+              "netz": (100, 102, 54),             # archimedes_netz_dec
+              "aitken": (100, 152, 84)}           # archimedes_aitken_script_dec
+
+# Define the version of the JSON layout.
+FORMAT = 1
+
+# Define the safety margin of init_values(). The values are predicted for
+# GUARD_PLACES more places and the precision gets GUARD_DIGITS more digits.
+GUARD_PLACES = 4
+GUARD_DIGITS = 4
+
+# Define the additional margin per place outside of the calibrated places.
+EXTRAPOLATION = 0.01
+
+# ----------------------------------------------------------------------
+# Function probe()
+# ----------------------------------------------------------------------
+def probe(method, places, iteration, precision):
+    '''Return the correct places of the estimate of the given iteration
+    calculated with the given precision.'''
+    backend = DecimalBackend(guard=precision - places)
+    with backend.context(places, iteration):
+        row = last(sequence(method, backend.number), iteration)
+        string = backend.to_string(row[4], places)
+    return correct_digits(string, pi_digits(places))[1]
+
+# ----------------------------------------------------------------------
+# Function minimal_iteration()
+# ----------------------------------------------------------------------
+def minimal_iteration(method, places, precision, maxiter=None):
+    '''Return the first iteration with the requested correct places or
+    None if it is not reached.'''
+    if maxiter is None:
+        maxiter = 4*places + 40
+    backend = DecimalBackend(guard=precision - places)
+    refpi = pi_digits(places)
+    with backend.context(places, maxiter):
+        for i, _, _, _, estimate in sequence(method, backend.number):
+            if correct_digits(backend.to_string(estimate, places), refpi)[1] >= places:
+                return i
+            if i >= maxiter:
+                return None
+    return None
+
+# ----------------------------------------------------------------------
+# Function minimal_precision()
+# ----------------------------------------------------------------------
+def minimal_precision(method, places, iteration, low, high, executor=None, workers=1):
+    '''Return the minimal precision in (low, high] for the iteration.
+
+    The precision low must fail and high must succeed.
+    '''
+    # Divide the interval until it can not be divided anymore.
+    while high - low > 1:
+        # Choose up to one probe per worker.
+        step = max((high - low)//(workers + 1), 1)
+        points = list(range(low + step, high, step))[:workers]
+        # Run the probes in parallel or one after the other.
+        check = partial(probe, method, places, iteration)
+        results = list(executor.map(check, points) if executor else map(check, points))
+        # Shrink the interval to the first succeeding probe.
+        for precision, correct in zip(points, results):
+            if correct >= places:
+                high = precision
+                break
+            low = precision
+    # Return the minimal precision.
+    return high
+
+# ----------------------------------------------------------------------
+# Function calibrate()
+# ----------------------------------------------------------------------
+def calibrate(method, places, executor=None, workers=1):
+    '''Return the minimal precision and iteration of a method.'''
+    # Search the minimal iteration with a generous precision.
+    high = 2*places + 20
+    iteration = minimal_iteration(method, places, high)
+    if iteration is None:
+        return None
+    # Make sure the lower end of the interval fails.
+    low = places
+    if probe(method, places, iteration, low) >= places:
+        return {"places": places, "precision": low, "iteration": iteration}
+    # Search the minimal precision.
+    precision = minimal_precision(method, places, iteration, low, high, executor, workers)
+    return {"places": places, "precision": precision, "iteration": iteration}
+
+# ----------------------------------------------------------------------
+# Function fit_envelope()
+# ----------------------------------------------------------------------
+def fit_envelope(xs, ys):
+    '''Fit y = a*x + b and shift it up to the largest deviation.'''
+    n = len(xs)
+    if n == 1:
+        return [0.0, float(ys[0])]
+    mx, my = sum(xs)/n, sum(ys)/n
+    a = sum((x - mx)*(y - my) for x, y in zip(xs, ys))/sum((x - mx)**2 for x in xs)
+    b = max(y - a*x for x, y in zip(xs, ys))
+    return [a, b]
+
+# ----------------------------------------------------------------------
+# Function calibrate_all()
+# ----------------------------------------------------------------------
+def calibrate_all(methods=tuple(SEQUENCES), places_list=PLACES, workers=None, verbose=True):
+    '''Calibrate all methods and return the models.'''
+    # Import the process pool here, it is not needed by init_values().
+    from concurrent.futures import ProcessPoolExecutor
+    workers = workers or os.cpu_count() or 1
+    models = {}
+    # Use a process pool for the parallel probes.
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        for method in methods:
+            points = []
+            for places in places_list:
+                res = calibrate(method, places, executor, workers)
+                if res is None:
+                    continue
+                points.append([res["places"], res["precision"], res["iteration"]])
+                if verbose:
+                    print("{0:<25s} | {places:>6d} | {precision:>9d} | {iteration:>9d}".format(
+                        method, **res))
+            if points:
+                xs = [p[0] for p in points]
+                models[method] = {"precision": fit_envelope(xs, [p[1] for p in points]),
+                                  "iteration": fit_envelope(xs, [p[2] for p in points]),
+                                  "points": points}
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    # Return the models.
+    return {"format": FORMAT, "places": list(places_list), "methods": models}
+
+# ----------------------------------------------------------------------
+# Function load_models()
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=4)
+def load_models(path=CALIBRATION_FILE):
+    '''Load the calibrated models or return an empty dictionary.
+
+    The file is read only once per path, the models must not be changed.
+    '''
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)["methods"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+# ----------------------------------------------------------------------
+# Function calibrated_range()
+# ----------------------------------------------------------------------
+def calibrated_range(model):
+    '''Return the smallest and the largest calibrated places of a model.'''
+    places = [p[0] for p in model["points"]]
+    return min(places), max(places)
+
+# ----------------------------------------------------------------------
+# Function init_values()
+# ----------------------------------------------------------------------
+def init_values(places, method="netz", models=None, guard=GUARD_PLACES):
+    '''Predict the precision and iteration of a method with a safety
+    margin. guard=0 predicts the minimal values.'''
+    if models is None:
+        models = load_models()
+    model = models[method]
+    # Calibrated places without margin are returned as measured.
+    if guard == 0:
+        for p, precision, iteration in model["points"]:
+            if p == places:
+                return precision, iteration
+    # Otherwise use the fitted lines for guard more places rounded up.
+    (ap, bp), (ai, bi) = model["precision"], model["iteration"]
+    target = places + guard
+    # Widen the margin with the distance to the calibrated places.
+    if guard:
+        low, high = calibrated_range(model)
+        target += math.ceil(EXTRAPOLATION*max(low - places, places - high, 0))
+    extra = GUARD_DIGITS if guard else 0
+    return math.ceil(ap*target + bp) + extra, math.ceil(ai*target + bi)
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(places_list):
+    '''Main script function.'''
+    # Print the header of the table.
+    print("{0:<25s} | {1:>6s} | {2:>9s} | {3:>9s}".format(
+        "Method", "Places", "Precision", "Iteration"))
+    print("{0}".format(58*"-"))
+    # Calibrate and store the models.
+    calibration = calibrate_all(places_list=places_list)
+    with open(CALIBRATION_FILE, "w", encoding="utf-8") as fh:
+        json.dump(calibration, fh, indent=2)
+        fh.write("\n")
+    load_models.cache_clear()
+    print("\nModels written to", CALIBRATION_FILE)
+    # Compare the models with the hand-tuned values of the scripts.
+    print("\n{0:<25s} | {1:>6s} | {2:>15s} | {3:>15s}".format(
+        "Method", "Places", "Hand-tuned", "Calibrated"))
+    print("{0}".format(70*"-"))
+    for method, (places, precision, iteration) in HAND_TUNED.items():
+        if method in calibration["methods"]:
+            calibrated = init_values(places, method, calibration["methods"], guard=0)
+            print("{0:<25s} | {1:>6d} | {2:>7d}/{3:<7d} | {4:>7d}/{5:<7d}".format(
+                method, places, precision, iteration, *calibrated))
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main([int(arg) for arg in sys.argv[1:]] or PLACES)
@@ -0,0 +1,254 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Operation counts per correct place for all recurrences.
+
+Description:
+The recurrences use different numbers of square roots, divisions and
+multiplications per iteration and gain different numbers of places per
+iteration. The time of a run depends on the computer, the counted
+operations do not. Therefore the number of operations per correct place
+is used to compare the efficiency of the methods.
+
+The counting backend wraps the numbers of another backend. Each
+operation on a wrapped number is tallied in a Counter. Counted are
+
+    add   addition and subtraction
+    mul   multiplication
+    div   division
+    pow   power operator
+    sqrt  square root
+    cbrt  cubic root
+
+A call of the cubic root counts once, regardless of how many operations
+Halley's method needs internally.
+
+The generators calculate the bounds and the estimate of every row,
+although a calculation only needs the estimate of the last row. Every
+counted number therefore keeps the operation which created it and its
+operands. Only the operations the estimate of the last row depends on
+are counted (dependencies()), i.e. the steps of the recurrence and one
+refinement. The bounds and estimates of the other rows, e.g. Aitken's
+extrapolation of every row, are not counted.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.counting [places]
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import sys
+from collections import Counter
+
+# Import the modules of the package.
+from archimedes.backends import DecimalBackend
+from archimedes.numeric import sqrt, cbrt
+from archimedes.reference import pi_digits, correct_digits
+from archimedes.sequences import SEQUENCES, sequence
+
+# Define the tuple with the counted operations.
+OPERATIONS = ("sqrt", "cbrt", "div", "mul", "pow", "add")
+
+# Define the default number of places.
+PLACES = 200
+
+# ----------------------------------------------------------------------
+# Class Counted
+# ----------------------------------------------------------------------
+class Counted:
+    '''Number which counts the operations applied to it and remembers
+    the operation and the operands it was created from.'''
+    __slots__ = ("v", "counter", "operation", "operands")
+
+    def __init__(self, v, counter, operation=None, operands=()):
+        # Store the wrapped value, the counter and the origin.
+        self.v = v
+        self.counter = counter
+        self.operation = operation
+        self.operands = operands
+
+    def _wrap(self, v, operation, other=None):
+        '''Count an operation and wrap its result.'''
+        self.counter[operation] += 1
+        operands = (self, other) if isinstance(other, Counted) else (self,)
+        return Counted(v, self.counter, operation, operands)
+
+    @staticmethod
+    def _value(other):
+        '''Return the wrapped value of the other operand.'''
+        return other.v if isinstance(other, Counted) else other
+
+    def __add__(self, other):
+        return self._wrap(self.v + self._value(other), "add", other)
+
+    def __radd__(self, other):
+        return self._wrap(self._value(other) + self.v, "add", other)
+
+    def __sub__(self, other):
+        return self._wrap(self.v - self._value(other), "add", other)
+
+    def __rsub__(self, other):
+        return self._wrap(self._value(other) - self.v, "add", other)
+
+    def __mul__(self, other):
+        return self._wrap(self.v*self._value(other), "mul", other)
+
+    def __rmul__(self, other):
+        return self._wrap(self._value(other)*self.v, "mul", other)
+
+    def __truediv__(self, other):
+        return self._wrap(self.v/self._value(other), "div", other)
+
+    def __rtruediv__(self, other):
+        return self._wrap(self._value(other)/self.v, "div", other)
+
+    def __pow__(self, exponent):
+        return self._wrap(self.v**self._value(exponent), "pow", exponent)
+
+    def __neg__(self):
+        return Counted(-self.v, self.counter, None, (self,))
+
+    def __pos__(self):
+        return Counted(+self.v, self.counter, None, (self,))
+
+    def __abs__(self):
+        return Counted(abs(self.v), self.counter, None, (self,))
+
+    def __eq__(self, other):
+        return self.v == self._value(other)
+
+    def __lt__(self, other):
+        return self.v < self._value(other)
+
+    def __le__(self, other):
+        return self.v <= self._value(other)
+
+    def __gt__(self, other):
+        return self.v > self._value(other)
+
+    def __ge__(self, other):
+        return self.v >= self._value(other)
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(self.v)
+
+    def __str__(self):
+        return str(self.v)
+
+    def sqrt(self):
+        '''Return the square root.'''
+        return self._wrap(sqrt(self.v), "sqrt")
+
+    def cbrt(self):
+        '''Return the cubic root.'''
+        return self._wrap(cbrt(self.v), "cbrt")
+
+# ----------------------------------------------------------------------
+# Function dependencies()
+# ----------------------------------------------------------------------
+def dependencies(x):
+    '''Return the counted operations a number depends on. Each
+    operation is counted once, even if its result is used repeatedly.'''
+    counts = Counter()
+    seen = set()
+    stack = [x]
+    # Walk through the operands without recursion.
+    while stack:
+        y = stack.pop()
+        if id(y) in seen:
+            continue
+        seen.add(id(y))
+        if y.operation is not None:
+            counts[y.operation] += 1
+        stack.extend(y.operands)
+    return counts
+
+# ----------------------------------------------------------------------
+# Class CountingBackend
+# ----------------------------------------------------------------------
+class CountingBackend:
+    '''Backend wrapping the numbers of another backend into Counted.'''
+
+    def __init__(self, backend):
+        # Store the wrapped backend and create the counter.
+        self.backend = backend
+        self.name = "counting " + backend.name
+        self.max_places = backend.max_places
+        self.counter = Counter()
+
+    def reset(self):
+        '''Reset the counter.'''
+        self.counter.clear()
+
+    def number(self, value):
+        '''Create a counted number.'''
+        return Counted(self.backend.number(value), self.counter)
+
+    def context(self, places, iteration=0):
+        '''Use the context of the wrapped backend.'''
+        return self.backend.context(places, iteration)
+
+    def to_string(self, x, places):
+        '''Return x with the requested places.'''
+        return self.backend.to_string(x.v, places)
+
+# ----------------------------------------------------------------------
+# Function count_operations()
+# ----------------------------------------------------------------------
+def count_operations(method, places, backend=None, maxiter=None):
+    '''Run a recurrence until its estimate has the requested number of
+    correct places and return the counted operations.'''
+    # Use Decimal numbers with twice the places as default. Then also
+    # the recurrences which lose places by cancellation reach the goal.
+    if backend is None:
+        backend = DecimalBackend(guard=places + 10)
+    if maxiter is None:
+        maxiter = 4*places + 40
+    counting = CountingBackend(backend)
+    refpi = pi_digits(places)
+    correct = 0
+    # Run the recurrence until the goal or the maximum is reached.
+    with counting.context(places, maxiter):
+        for i, _, _, _, estimate in sequence(method, counting.number):
+            _, correct = correct_digits(counting.to_string(estimate, places), refpi)
+            if correct >= places or i >= maxiter:
+                break
+    # Count only the operations of the recurrence and the last estimate.
+    counts = dict(dependencies(estimate))
+    # Return the result.
+    return {"method": method, "places": places, "iteration": i,
+            "correct": correct, "counts": counts}
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(places):
+    '''Main script function.'''
+    # Print the header of the table.
+    print("Operations per correct place for {0} places:\n".format(places))
+    print("{0:<25s} | {1:>5s} | {2:>7s} | ".format("Method", "Iter", "Correct")
+          + " | ".join("{0:>6s}".format(op) for op in OPERATIONS)
+          + " | {0:>6s}".format("total"))
+    print("{0}".format(108*"-"))
+    # Count the operations for all recurrences.
+    for method in SEQUENCES:
+        res = count_operations(method, places)
+        counts, correct = res["counts"], max(res["correct"], 1)
+        total = sum(counts.get(op, 0) for op in OPERATIONS if op != "add")
+        print("{0:<25s} | {1:>5d} | {2:>7d} | ".format(method, res["iteration"], res["correct"])
+              + " | ".join("{0:>6.2f}".format(counts.get(op, 0)/correct) for op in OPERATIONS)
+              + " | {0:>6.2f}".format(total/correct))
+    print("\nThe total is the sum of all operations except add.")
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else PLACES)
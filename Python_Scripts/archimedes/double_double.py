@@ -0,0 +1,622 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Double-double and quad-double arithmetic for the Archimedes algorithm.
+
+Description:
+The float scripts are limited to 13-15 correct places of Pi. Using the
+standard Python module decimal overcomes the limitation, but every
+operation is then done in software. In between there are numbers which
+are represented as unevaluated sum of two (double-double) or four
+(quad-double) floats. The arithmetic is built on the error-free
+transformations TwoSum and TwoProd. The square root is compensated by
+one correction step.
+
+A double-double gives about 31 and a quad-double about 62 significant
+places. The inner polygon, the outer polygon and the perimeter (Pfaff)
+recurrences are implemented for both number types. The edge of the inner
+polygon is calculated without the cancelling difference of the squares
+of the original script.
+
+The double-double functions contain no branches. Using NumPy arrays as
+hi and lo parts, one calculates a whole array of numbers at once.
+
+Limitations:
+The range of values is the one of floats. The edge number 6*2^i has to
+fit into a float, like in the float scripts. The quad-double type works
+with scalars only.
+
+Every operation on the scalar numbers is a handful of Python calls, so
+they are slower than decimal with the same places, which is implemented
+in C. main() compares them: on the test system the double-double
+recurrence takes about 4 times and the quad-double recurrence about 100
+times the time of Decimal numbers with 32 respectively 64 digits. Only
+the double-double numbers with NumPy arrays (archimedes.batch), which
+calculate many numbers per operation, are faster than decimal.
+
+See also:
+T. J. Dekker, A floating-point technique for extending the available
+precision, Numerische Mathematik 18, 1971
+Y. Hida, X. S. Li, D. H. Bailey, Library for double-double and
+quad-double arithmetic, 2007
+J. R. Shewchuk, Adaptive precision floating-point arithmetic and fast
+robust geometric predicates, 1997
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.double_double
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-locals
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import math
+import sys
+import time
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import localcontext
+
+# Import the reference values of Pi.
+from archimedes.reference import pi_digits, correct_digits
+
+# Splitter for Dekker's product (2^27 + 1).
+SPLITTER = 134217729.0
+
+# Number of iterations used by the main script function.
+ITERATION = 60
+
+# ----------------------------------------------------------------------
+# Function _is_array()
+# ----------------------------------------------------------------------
+def _is_array(x):
+    '''Return True if x is a NumPy array.
+
+    The optional module numpy is not imported here. If it has not been
+    imported by the caller, x can not be an array.
+    '''
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(x, np.ndarray)
+
+# ----------------------------------------------------------------------
+# Function _sqrt()
+# ----------------------------------------------------------------------
+def _sqrt(x):
+    '''Return the square root of a float or of a NumPy array.'''
+    # Use numpy only for arrays.
+    if _is_array(x):
+        return sys.modules["numpy"].sqrt(x)
+    # Return the float square root.
+    return math.sqrt(x)
+
+# ----------------------------------------------------------------------
+# Error-free transformations
+# ----------------------------------------------------------------------
+def two_sum(a, b):
+    '''Return s and e with s = fl(a + b) and s + e = a + b exactly.'''
+    s = a + b
+    bb = s - a
+    e = (a - (s - bb)) + (b - bb)
+    return s, e
+
+def quick_two_sum(a, b):
+    '''Like two_sum() under the condition |a| >= |b|.'''
+    s = a + b
+    e = b - (s - a)
+    return s, e
+
+def split(a):
+    '''Split a into a high and a low part with 26 bits each.'''
+    t = SPLITTER*a
+    hi = t - (t - a)
+    lo = a - hi
+    return hi, lo
+
+def two_prod(a, b):
+    '''Return p and e with p = fl(a*b) and p + e = a*b exactly.'''
+    p = a*b
+    ah, al = split(a)
+    bh, bl = split(b)
+    e = ((ah*bh - p) + ah*bl + al*bh) + al*bl
+    return p, e
+
+# ----------------------------------------------------------------------
+# Double-double arithmetic on hi and lo parts
+# ----------------------------------------------------------------------
+def dd_add(ah, al, bh, bl):
+    '''Add two double-double numbers.'''
+    s1, s2 = two_sum(ah, bh)
+    t1, t2 = two_sum(al, bl)
+    s2 += t1
+    s1, s2 = quick_two_sum(s1, s2)
+    s2 += t2
+    return quick_two_sum(s1, s2)
+
+def dd_mul(ah, al, bh, bl):
+    '''Multiply two double-double numbers.'''
+    p1, p2 = two_prod(ah, bh)
+    p2 += ah*bl + al*bh
+    return quick_two_sum(p1, p2)
+
+def dd_div(ah, al, bh, bl):
+    '''Divide two double-double numbers by long division.'''
+    # First quotient digit and remainder.
+    q1 = ah/bh
+    ph, pl = dd_mul(bh, bl, q1, 0.0*q1)
+    rh, rl = dd_add(ah, al, -ph, -pl)
+    # Second quotient digit and remainder.
+    q2 = rh/bh
+    ph, pl = dd_mul(bh, bl, q2, 0.0*q2)
+    rh, rl = dd_add(rh, rl, -ph, -pl)
+    # Third quotient digit.
+    q3 = rh/bh
+    q1, q2 = quick_two_sum(q1, q2)
+    return dd_add(q1, q2, q3, 0.0*q3)
+
+def dd_sqrt(ah, al):
+    '''Compensated square root of a positive double-double number.'''
+    # Square root of the leading part.
+    s = _sqrt(ah)
+    # Correct the square root by the exact residual.
+    p, e = two_prod(s, s)
+    r = (((ah - p) - e) + al)/(2*s)
+    return quick_two_sum(s, r)
+
+# ----------------------------------------------------------------------
+# Class DoubleDouble
+# ----------------------------------------------------------------------
+class DoubleDouble:
+    '''Number represented as unevaluated sum hi + lo of two floats.
+
+    The parts can also be NumPy arrays of the same shape. Then every
+    operation works elementwise on all numbers at once.
+    '''
+    __slots__ = ("hi", "lo")
+
+    # Let NumPy arrays as left operand defer to the reflected operators.
+    __array_ufunc__ = None
+
+    def __init__(self, hi=0.0, lo=0.0):
+        # Store floats and arrays as they are.
+        if isinstance(hi, float) or _is_array(hi):
+            self.hi, self.lo = hi, lo
+        elif isinstance(hi, DoubleDouble):
+            self.hi, self.lo = hi.hi, hi.lo
+        else:
+            # Convert int, str and Decimal exactly using decimal.
+            with localcontext() as ctx:
+                ctx.prec = 40
+                d = D(hi)
+                self.hi = float(d)
+                self.lo = float(d - D(self.hi))
+
+    @classmethod
+    def from_array(cls, values):
+        '''Create a vector of double-double numbers from floats.'''
+        # Import the optional module numpy.
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        hi = np.asarray(values, dtype=float)
+        return cls(hi, np.zeros_like(hi))
+
+    @staticmethod
+    def _coerce(other):
+        '''Convert the other operand into a double-double number.'''
+        if isinstance(other, DoubleDouble):
+            return other
+        return DoubleDouble(other)
+
+    def __add__(self, other):
+        o = self._coerce(other)
+        return DoubleDouble(*dd_add(self.hi, self.lo, o.hi, o.lo))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = self._coerce(other)
+        return DoubleDouble(*dd_add(self.hi, self.lo, -o.hi, -o.lo))
+
+    def __rsub__(self, other):
+        o = self._coerce(other)
+        return DoubleDouble(*dd_add(o.hi, o.lo, -self.hi, -self.lo))
+
+    def __mul__(self, other):
+        o = self._coerce(other)
+        return DoubleDouble(*dd_mul(self.hi, self.lo, o.hi, o.lo))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        o = self._coerce(other)
+        return DoubleDouble(*dd_div(self.hi, self.lo, o.hi, o.lo))
+
+    def __rtruediv__(self, other):
+        o = self._coerce(other)
+        return DoubleDouble(*dd_div(o.hi, o.lo, self.hi, self.lo))
+
+    def __pow__(self, exponent):
+        # Only integer exponents are supported (square and multiply).
+        if not isinstance(exponent, int) or exponent < 0:
+            return NotImplemented
+        result, base = DoubleDouble(1.0 + 0.0*self.hi, 0.0*self.lo), self
+        while exponent:
+            if exponent & 1:
+                result = result*base
+            base = base*base
+            exponent >>= 1
+        return result
+
+    def __neg__(self):
+        return DoubleDouble(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        # Multiply with the sign of hi, without a branch for arrays.
+        sign = (self.hi >= 0)*2.0 - 1.0
+        return DoubleDouble(sign*self.hi, sign*self.lo)
+
+    def __eq__(self, other):
+        o = self._coerce(other)
+        return (self.hi == o.hi) & (self.lo == o.lo)
+
+    def __lt__(self, other):
+        o = self._coerce(other)
+        return (self.hi < o.hi) | ((self.hi == o.hi) & (self.lo < o.lo))
+
+    def __le__(self, other):
+        o = self._coerce(other)
+        return (self.hi < o.hi) | ((self.hi == o.hi) & (self.lo <= o.lo))
+
+    def __gt__(self, other):
+        return self._coerce(other) < self
+
+    def __ge__(self, other):
+        return self._coerce(other) <= self
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(self.hi + self.lo)
+
+    def to_decimal(self):
+        '''Return the exact value of a scalar as Decimal.'''
+        with localcontext() as ctx:
+            ctx.prec = 800
+            return D(self.hi) + D(self.lo)
+
+    def __str__(self):
+        # Print 32 significant digits.
+        with localcontext() as ctx:
+            ctx.prec = 32
+            return str(+self.to_decimal())
+
+    def __repr__(self):
+        return "DoubleDouble({!r}, {!r})".format(self.hi, self.lo)
+
+    def sqrt(self):
+        '''Return the square root.'''
+        return DoubleDouble(*dd_sqrt(self.hi, self.lo))
+
+    def cbrt(self):
+        '''Return the cubic root of a positive number.'''
+        # Start with the float cubic root and apply one Newton step.
+        y = DoubleDouble(self.hi**(1/3), 0.0*self.lo)
+        return y - (y*y*y - self)/(3*y*y)
+
+# ----------------------------------------------------------------------
+# Expansion arithmetic used by the quad-double numbers
+# ----------------------------------------------------------------------
+def _grow_expansion(expansion, b):
+    '''Add a float exactly to an expansion of increasing magnitude.'''
+    result = []
+    q = b
+    for e in expansion:
+        q, h = two_sum(q, e)
+        if h:
+            result.append(h)
+    result.append(q)
+    return result
+
+def _qd_from_terms(terms):
+    '''Round the exact sum of floats to the four leading components.'''
+    # Sum up all terms exactly.
+    expansion = []
+    for t in terms:
+        if t:
+            expansion = _grow_expansion(expansion, t)
+    # Compress the expansion from top to bottom.
+    parts = []
+    q = 0.0
+    for e in reversed(expansion):
+        q, h = quick_two_sum(q, e) if abs(q) >= abs(e) else quick_two_sum(e, q)
+        if h:
+            parts.append(q)
+            q = h
+    parts.append(q)
+    # Renormalise once more and keep four components.
+    parts = [p for p in parts if p] or [0.0]
+    result = []
+    q = parts[0]
+    for e in parts[1:]:
+        q, h = two_sum(q, e)
+        if h:
+            result.append(q)
+            q = h
+    result.append(q)
+    result = (result + [0.0, 0.0, 0.0, 0.0])[:4]
+    return tuple(result)
+
+# ----------------------------------------------------------------------
+# Class QuadDouble
+# ----------------------------------------------------------------------
+class QuadDouble:
+    '''Number represented as unevaluated sum of four floats.'''
+    __slots__ = ("c",)
+
+    def __init__(self, value=0.0):
+        # Store a tuple of four components as it is.
+        if isinstance(value, tuple):
+            self.c = value
+        elif isinstance(value, QuadDouble):
+            self.c = value.c
+        elif isinstance(value, DoubleDouble):
+            self.c = _qd_from_terms([value.hi, value.lo])
+        else:
+            # Convert int, float, str and Decimal using decimal.
+            with localcontext() as ctx:
+                ctx.prec = 80
+                d = D(value)
+                parts = []
+                for _ in range(4):
+                    f = float(d)
+                    parts.append(f)
+                    d -= D(f)
+            self.c = _qd_from_terms(parts)
+
+    @staticmethod
+    def _coerce(other):
+        '''Convert the other operand into a quad-double number.'''
+        if isinstance(other, QuadDouble):
+            return other
+        return QuadDouble(other)
+
+    def __add__(self, other):
+        return QuadDouble(_qd_from_terms(self.c + self._coerce(other).c))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = self._coerce(other)
+        return QuadDouble(_qd_from_terms(self.c + tuple(-x for x in o.c)))
+
+    def __rsub__(self, other):
+        return self._coerce(other) - self
+
+    def __mul__(self, other):
+        a, b = self.c, self._coerce(other).c
+        terms = []
+        # Products of order 0 to 3 are calculated exactly.
+        for i in range(4):
+            for j in range(4 - i):
+                terms.extend(two_prod(a[i], b[j]))
+        # Products of order 4 are only needed roughly.
+        terms.append(a[1]*b[3] + a[2]*b[2] + a[3]*b[1])
+        return QuadDouble(_qd_from_terms(terms))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        b = self._coerce(other)
+        # Long division with five quotient digits.
+        r = self
+        q = []
+        for _ in range(5):
+            qi = r.c[0]/b.c[0]
+            q.append(qi)
+            r = r - b*qi
+        return QuadDouble(_qd_from_terms(q))
+
+    def __rtruediv__(self, other):
+        return self._coerce(other)/self
+
+    def __pow__(self, exponent):
+        # Only integer exponents are supported (square and multiply).
+        if not isinstance(exponent, int) or exponent < 0:
+            return NotImplemented
+        result, base = QuadDouble(1), self
+        while exponent:
+            if exponent & 1:
+                result = result*base
+            base = base*base
+            exponent >>= 1
+        return result
+
+    def __neg__(self):
+        return QuadDouble(tuple(-x for x in self.c))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        # Multiply with the sign of the leading component.
+        sign = (self.c[0] >= 0)*2.0 - 1.0
+        return QuadDouble(tuple(sign*x for x in self.c))
+
+    def __eq__(self, other):
+        return (self - other).c[0] == 0.0
+
+    def __lt__(self, other):
+        return (self - other).c[0] < 0.0
+
+    def __le__(self, other):
+        return (self - other).c[0] <= 0.0
+
+    def __gt__(self, other):
+        return (self - other).c[0] > 0.0
+
+    def __ge__(self, other):
+        return (self - other).c[0] >= 0.0
+
+    __hash__ = None
+
+    def __float__(self):
+        return self.c[0]
+
+    def to_decimal(self):
+        '''Return the exact value as Decimal.'''
+        with localcontext() as ctx:
+            ctx.prec = 1600
+            return sum((D(x) for x in self.c), D(0))
+
+    def __str__(self):
+        # Print 64 significant digits.
+        with localcontext() as ctx:
+            ctx.prec = 64
+            return str(+self.to_decimal())
+
+    def __repr__(self):
+        return "QuadDouble({!r})".format(self.c)
+
+    def sqrt(self):
+        '''Return the square root of a positive number.'''
+        # Start with the double-double square root and refine by Newton.
+        h, l = dd_sqrt(self.c[0], self.c[1])
+        x = QuadDouble((h, l, 0.0, 0.0))
+        for _ in range(2):
+            x = x + (self - x*x)/(2*x)
+        return x
+
+    def cbrt(self):
+        '''Return the cubic root of a positive number.'''
+        # Start with the float cubic root and refine by Newton.
+        x = QuadDouble(self.c[0]**(1/3))
+        for _ in range(3):
+            x = x - (x*x*x - self)/(3*x*x)
+        return x
+
+# ----------------------------------------------------------------------
+# Function inner_polygon()
+# ----------------------------------------------------------------------
+def inner_polygon(num, iteration=5):
+    '''Archimedes algorithm for calculating the perimeter of the inner
+    regular polygon using the number type num.'''
+    # Start values 6-gon (hexagon) for the calculation of the inner polygon.
+    AC = num(3).sqrt()
+    AB = num(2)
+    BC = num(1)
+    # Run a for loop in the range from 0 to the value of iteration.
+    for i in range(0, iteration+1):
+        # Calculate the number of edges.
+        n = 6*2**i
+        # No iteration on first loop.
+        if i == 0:
+            # Calculate the approximation for pi.
+            ac = (BC*n)/2
+        else:
+            # Calculate the length of the hypotenuse and the length of the edge.
+            # BD = sqrt(AB^2 - AD^2) cancels, since AD tends to AB. With the
+            # tangent BC/(AB + AC) of the half angle BD follows without it.
+            AD = AB/((BC*BC/((AB + AC)*(AB + AC))) + 1).sqrt()
+            BD = AD*BC/(AB + AC)
+            # Store the values for the next iteration.
+            BC = BD
+            AC = AD
+            # Calculate the approximation for pi.
+            ac = (BD*n)/2
+    # Return the approximation of Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function outer_polygon()
+# ----------------------------------------------------------------------
+def outer_polygon(num, iteration=5):
+    '''Archimedes algorithm for calculating the perimeter of the outer
+    regular polygon using the number type num.'''
+    # Start values 6-gon (hexagon), OA = 1 -> unit circle.
+    OA = num(1)
+    OC = OA*2*num(3).sqrt()/3
+    AC = OA/num(3).sqrt()
+    # Run a for loop in the range from 0 to the value of iteration plus 1.
+    for i in range(0, iteration+1):
+        # Calculate the number of edges.
+        n = 6*2**i
+        # No iteration on first loop.
+        if i == 0:
+            # Calculate the approximation for pi.
+            ac = AC*n
+        else:
+            # Calculate the length of the hypotenuse and the length of the edge.
+            AD = AC*OA/(OA + OC)
+            OD = (OA*OA + AD*AD).sqrt()
+            # Store the values for the next iteration.
+            AC = AD
+            OC = OD
+            # Calculate the approximation for pi.
+            ac = AD*n
+    # Return the approximation of Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function perimeter()
+# ----------------------------------------------------------------------
+def perimeter(num, iteration=5, r=1):
+    '''Archimedes algorithm in the formulation of Pfaff using the number
+    type num. Returns the lower bound, the upper bound and the arithmetic
+    mean of both divided by the radius.'''
+    # Define the start values.
+    a0 = num(r)*2*num(3).sqrt()   # half of the outer perimeter
+    b0 = num(r)*3                 # half of the inner perimeter
+    a1, b1 = a0, b0
+    # Run an iteration from 1 to iteration.
+    for _ in range(1, iteration+1):
+        # Calculate the half of inner and outer perimeter.
+        a1 = (2*a0*b0)/(a0 + b0)
+        b1 = (b0*a1).sqrt()
+        # Store the old values for the next loop.
+        a0, b0 = a1, b1
+    # Return lower bound, upper bound and arithmetic mean.
+    return b1/r, a1/r, (a1 + b1)/(2*r)
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(iteration):
+    '''Main script function.'''
+    # Get the reference value of Pi.
+    refpi = pi_digits(70)
+    print("{0:<14s} | {1:<9s} | {2:<9s} | {3:<s}".format(
+        "Number type", "Places", "Time [s]", "Pi"))
+    print("{0}".format(100*"-"))
+    # Run the Pfaff recurrence with float, double-double and quad-double
+    # and with Decimal numbers of the same significant places.
+    for name, num, count, prec in (("float", float, 30, None),
+                                   ("double-double", DoubleDouble, iteration, None),
+                                   ("decimal 32", D, iteration, 32),
+                                   ("quad-double", QuadDouble, 2*iteration, None),
+                                   ("decimal 64", D, 2*iteration, 64)):
+        start = time.perf_counter()
+        if num is float:
+            a0, b0 = 2*math.sqrt(3), 3.0
+            for _ in range(count):
+                a0 = (2*a0*b0)/(a0 + b0)
+                b0 = math.sqrt(b0*a0)
+            ac = repr((a0 + b0)/2)
+        else:
+            with localcontext() as ctx:
+                ctx.prec = prec or ctx.prec
+                ac = str(perimeter(num, iteration=count)[2])
+        elapsed = time.perf_counter() - start
+        _, places = correct_digits(ac, refpi)
+        print("{0:<14s} | {1:<9d} | {2:<9.6f} | {3:<s}".format(name, places, elapsed, ac))
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main(ITERATION)
@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Binary fixed point numbers based on Python integers.
+
+Description:
+A fixed point number is an integer mantissa m with the value
+m/2^bits. The number of fraction bits is taken from a context, which is
+set with fixedcontext(). Addition and subtraction are exact, the other
+operations are rounded to the nearest number. The square root uses the
+integer square root of the standard Python module math.
+
+Since the numbers have a fixed absolute accuracy, small values like the
+half edge of a polygon with 6*2^i edges lose i bits of their relative
+accuracy. The number of fraction bits has to be chosen accordingly.
+
+Usage:
+    with fixedcontext(400):
+        x = FixedPoint(3).sqrt()
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fractions import Fraction
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+
+# Import the modules of the package.
+from archimedes.radix import fixed_to_string
+
+# Number of fraction bits of newly created numbers.
+_BITS = ContextVar("fraction_bits", default=64)
+
+# ----------------------------------------------------------------------
+# Function fixedcontext()
+# ----------------------------------------------------------------------
+@contextmanager
+def fixedcontext(bits):
+    '''Set the number of fraction bits for the enclosed block.'''
+    # Set the context variable and restore it afterwards.
+    token = _BITS.set(bits)
+    try:
+        yield bits
+    finally:
+        _BITS.reset(token)
+
+# ----------------------------------------------------------------------
+# Function _round_shift()
+# ----------------------------------------------------------------------
+def _round_shift(m, shift):
+    '''Shift an integer to the right and round to nearest.'''
+    return (m + (1 << (shift - 1))) >> shift if shift > 0 else m << -shift
+
+# ----------------------------------------------------------------------
+# Function _round_div()
+# ----------------------------------------------------------------------
+def _round_div(a, b):
+    '''Divide two integers and round to nearest.'''
+    return (2*a + b)//(2*b)
+
+# ----------------------------------------------------------------------
+# Function _icbrt()
+# ----------------------------------------------------------------------
+def _icbrt(n):
+    '''Integer cubic root of a non-negative integer.'''
+    # Start above the root and apply Newton until it decreases no more.
+    if n < 2:
+        return n
+    x = 1 << ((n.bit_length() + 2)//3)
+    while True:
+        y = (2*x + n//(x*x))//3
+        if y >= x:
+            return x
+        x = y
+
+# ----------------------------------------------------------------------
+# Class FixedPoint
+# ----------------------------------------------------------------------
+class FixedPoint:
+    '''Fixed point number m/2^bits.'''
+    __slots__ = ("m", "bits")
+
+    def __init__(self, value=0, bits=None):
+        # Get the number of fraction bits from the context.
+        if bits is None:
+            bits = _BITS.get()
+        self.bits = bits
+        # Convert the value into the mantissa.
+        if isinstance(value, FixedPoint):
+            self.m = _round_shift(value.m, value.bits - bits)
+        elif isinstance(value, int):
+            self.m = value << bits
+        else:
+            f = Fraction(D(value)) if isinstance(value, str) else Fraction(value)
+            self.m = _round_div(f.numerator << bits, f.denominator)
+
+    @classmethod
+    def _raw(cls, m, bits):
+        '''Create a number from a mantissa without conversion.'''
+        x = cls.__new__(cls)
+        x.m, x.bits = m, bits
+        return x
+
+    def _mantissa(self, other):
+        '''Return the mantissa of the other operand.'''
+        if isinstance(other, FixedPoint):
+            return other.m if other.bits == self.bits else FixedPoint(other, self.bits).m
+        return FixedPoint(other, self.bits).m
+
+    def __add__(self, other):
+        return self._raw(self.m + self._mantissa(other), self.bits)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._raw(self.m - self._mantissa(other), self.bits)
+
+    def __rsub__(self, other):
+        return self._raw(self._mantissa(other) - self.m, self.bits)
+
+    def __mul__(self, other):
+        # Multiplication by an integer is exact.
+        if isinstance(other, int):
+            return self._raw(self.m*other, self.bits)
+        return self._raw(_round_shift(self.m*self._mantissa(other), self.bits), self.bits)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # Division by an integer needs no shift.
+        if isinstance(other, int):
+            return self._raw(_round_div(self.m, other), self.bits)
+        return self._raw(_round_div(self.m << self.bits, self._mantissa(other)), self.bits)
+
+    def __rtruediv__(self, other):
+        return self._raw(_round_div(self._mantissa(other) << self.bits, self.m), self.bits)
+
+    def __pow__(self, exponent):
+        # Only integer exponents are supported (square and multiply).
+        if not isinstance(exponent, int) or exponent < 0:
+            return NotImplemented
+        result, base = FixedPoint(1, self.bits), self
+        while exponent:
+            if exponent & 1:
+                result = result*base
+            base = base*base
+            exponent >>= 1
+        return result
+
+    def __neg__(self):
+        return self._raw(-self.m, self.bits)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self._raw(abs(self.m), self.bits)
+
+    def __eq__(self, other):
+        return self.m == self._mantissa(other)
+
+    def __lt__(self, other):
+        return self.m < self._mantissa(other)
+
+    def __le__(self, other):
+        return self.m <= self._mantissa(other)
+
+    def __gt__(self, other):
+        return self.m > self._mantissa(other)
+
+    def __ge__(self, other):
+        return self.m >= self._mantissa(other)
+
+    def __hash__(self):
+        return hash(Fraction(self.m, 1 << self.bits))
+
+    def __float__(self):
+        return float(Fraction(self.m, 1 << self.bits))
+
+    def sqrt(self):
+        '''Return the square root of a non-negative number.'''
+        return self._raw(math.isqrt(self.m << self.bits), self.bits)
+
+    def cbrt(self):
+        '''Return the cubic root of a non-negative number.'''
+        return self._raw(_icbrt(self.m << (2*self.bits)), self.bits)
+
+    def to_string(self, places=None, base=10):
+        '''Return the value truncated to the given number of places in
+        the base 10, 2, 8 or 16.'''
+        # Use all places which are covered by the fraction bits.
+        if places is None:
+            places = int(self.bits*math.log(2, base))
+        # Convert the scaled mantissa by divide and conquer, without the
+        # limits and the quadratic time of the int to str conversion.
+        return fixed_to_string(self.m, self.bits, places, base)
+
+    def __str__(self):
+        return self.to_string()
+
+    def __repr__(self):
+        return "FixedPoint({0}, bits={1})".format(self.to_string(), self.bits)
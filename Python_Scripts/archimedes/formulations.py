@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Comparison of the inner_from_outer formulations on all backends.
+
+Description:
+The scripts inner_from_outer_method0 to inner_from_outer_method3 are
+limited to floats. Here the four geometric formulations run on every
+backend of archimedes.backends (float, double-double, quad-double,
+Decimal and integer fixed point). For each formulation and backend the
+number of correct places per second of calculation is reported, so the
+formulations are directly comparable.
+
+The estimate of Pi is the arithmetic mean of the lower and the upper
+bound. Its error decreases by a factor of four per iteration, i.e. each
+iteration gives about 0.6 places.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.formulations [places ...]
+    python3 -m archimedes.formulations 100 1000 10000
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import math
+import sys
+import time
+
+# Import the modules of the package.
+from archimedes.backends import BACKENDS
+from archimedes.reference import pi_digits, correct_digits
+from archimedes.sequences import sequence, last
+
+# Define the tuple with the compared formulations.
+METHODS = ("inner_from_outer_method0",
+           "inner_from_outer_method1",
+           "inner_from_outer_method2",
+           "inner_from_outer_method3")
+
+# Define the default places of the comparison.
+PLACES = (100, 1000)
+
+# ----------------------------------------------------------------------
+# Function predict_iteration()
+# ----------------------------------------------------------------------
+def predict_iteration(places):
+    '''Predict the iterations for the mean of both bounds.'''
+    # The error is about 0.07/4^i.
+    return math.ceil((places + 2)/math.log10(4))
+
+# ----------------------------------------------------------------------
+# Function run()
+# ----------------------------------------------------------------------
+def run(method, backend, places, iteration=None):
+    '''Run a formulation on a backend and return a result dictionary.'''
+    # Limit the places to the ones of the backend.
+    if backend.max_places is not None:
+        places = min(places, backend.max_places)
+    if iteration is None:
+        iteration = predict_iteration(places)
+    # Run the recurrence with the precision of the backend.
+    start = time.perf_counter()
+    with backend.context(places, iteration):
+        row = last(sequence(method, backend.number), iteration)
+        string = backend.to_string(row[4], places)
+    elapsed = time.perf_counter() - start
+    # Count the correct places.
+    _, correct = correct_digits(string, pi_digits(places))
+    # Return the result.
+    return {"method": method, "backend": backend.name, "places": places,
+            "iteration": iteration, "time": elapsed, "correct": correct,
+            "rate": correct/elapsed if elapsed > 0 else float("inf")}
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(places_list):
+    '''Main script function.'''
+    # Print the header of the table.
+    print("{0:<25s} | {1:<13s} | {2:>6s} | {3:>9s} | {4:>7s} | {5:>10s} | {6:>12s}".format(
+        "Method", "Backend", "Places", "Iteration", "Correct", "Time [s]", "Places/s"))
+    print("{0}".format(99*"-"))
+    # Run the hardware based backends once.
+    for key in ("float", "dd", "qd"):
+        for method in METHODS:
+            res = run(method, BACKENDS[key], BACKENDS[key].max_places)
+            print("{method:<25s} | {backend:<13s} | {places:>6d} | {iteration:>9d} | "
+                  "{correct:>7d} | {time:>10.4f} | {rate:>12.1f}".format(**res))
+    # Run the software based backends for all places.
+    for places in places_list:
+        for key in ("decimal", "fixed"):
+            for method in METHODS:
+                res = run(method, BACKENDS[key], places)
+                print("{method:<25s} | {backend:<13s} | {places:>6d} | {iteration:>9d} | "
+                      "{correct:>7d} | {time:>10.4f} | {rate:>12.1f}".format(**res))
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main([int(arg) for arg in sys.argv[1:]] or PLACES)
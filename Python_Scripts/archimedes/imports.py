@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Import time and side effects of the modules and scripts.
+
+Description:
+The modules of the package and the scripts should be importable without
+calculating anything, e.g. from a notebook or a test. Every module and
+every script is imported in a fresh Python process and checked for
+
+    time      wall-clock time of the import in milliseconds
+    output    characters printed during the import
+    context   change of the precision or rounding of the decimal context
+
+The start of the interpreter is not part of the time. The first import
+compiles the byte code and is not measured. A module fails if it prints
+something, changes the decimal context or needs more than LIMIT
+milliseconds. The command-line tools in TOOLS import argparse, the
+process pools or numpy and have no time limit. Modules which import
+packages not installed on the system are reported as skipped.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.imports
+    python3 -m archimedes.imports --limit 10
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+import glob
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
+# Define the directory with the scripts.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Define the allowed import time in milliseconds.
+LIMIT = 5.0
+
+# Define the command-line tools without time limit.
+TOOLS = ("archimedes.aio", "archimedes.batch", "archimedes.benchmark", "archimedes.budget",
+         "archimedes.imports", "archimedes.race", "archimedes.sweep", "archimedes.verify")
+
+# Define the scripts which can not be imported without a display.
+SKIP = ("archimedes_inner_polygon_ui.py",)
+
+# Define the code which runs in the fresh process.
+PROBE = '''
+import contextlib, decimal, importlib, importlib.util, io, json, os, sys, time
+target = sys.argv[1]
+before = (decimal.getcontext().prec, decimal.getcontext().rounding)
+buffer = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(buffer):
+    if target.endswith(".py"):
+        sys.path.insert(0, os.path.dirname(target))
+        spec = importlib.util.spec_from_file_location("probe", target)
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+    else:
+        importlib.import_module(target)
+elapsed = time.perf_counter() - start
+after = (decimal.getcontext().prec, decimal.getcontext().rounding)
+print(json.dumps({"time": 1000*elapsed, "output": len(buffer.getvalue()),
+                  "context": before != after}))
+'''
+
+# ----------------------------------------------------------------------
+# Function targets()
+# ----------------------------------------------------------------------
+def targets():
+    '''Return the names of the package modules and the script paths.'''
+    modules = ["archimedes"] + ["archimedes." + m.name for m in
+                                pkgutil.iter_modules([os.path.join(ROOT, "archimedes")])]
+    scripts = sorted(glob.glob(os.path.join(ROOT, "*.py"))
+                     + glob.glob(os.path.join(ROOT, "new_approaches", "*.py"))
+                     + glob.glob(os.path.join(ROOT, "new_approaches", "dec", "*.py")))
+    scripts = [s for s in scripts if os.path.basename(s) not in SKIP]
+    return modules + scripts
+
+# ----------------------------------------------------------------------
+# Function measure()
+# ----------------------------------------------------------------------
+def measure(target, repeat=3):
+    '''Import a module or a script in fresh processes and return the
+    best time, the printed characters and the change of the context.'''
+    best = None
+    # Allow writing the byte code, the first run compiles it.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    for run in range(repeat + 1):
+        proc = subprocess.run([sys.executable, "-c", PROBE, target], cwd=ROOT, env=env,
+                              capture_output=True, text=True, timeout=600, check=False)
+        if proc.returncode != 0:
+            reason = (proc.stderr.strip().splitlines() or ["error"])[-1]
+            return {"target": target, "status": "skipped", "reason": reason}
+        res = json.loads(proc.stdout.strip().splitlines()[-1])
+        if run == 0:
+            continue
+        if best is None or res["time"] < best["time"]:
+            best = res
+    best.update(target=target, status="ok")
+    return best
+
+# ----------------------------------------------------------------------
+# Function check()
+# ----------------------------------------------------------------------
+def check(res, limit=LIMIT):
+    '''Return the list of problems of a measurement.'''
+    problems = []
+    if res["status"] != "ok":
+        return problems
+    if res["output"]:
+        problems.append("prints")
+    if res["context"]:
+        problems.append("context")
+    if res["time"] > limit and res["target"] not in TOOLS:
+        problems.append("slow")
+    return problems
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Import time of the modules.")
+    parser.add_argument("--limit", type=float, default=LIMIT)
+    parser.add_argument("targets", nargs="*", help="modules or scripts")
+    args = parser.parse_args(argv)
+    # Print the header of the table.
+    print("{0:<58s} | {1:>9s} | {2:<7s}".format("Module", "Time [ms]", "Result"))
+    print("{0}".format(82*"-"))
+    # Measure all modules and scripts.
+    failures = 0
+    for target in args.targets or targets():
+        res = measure(target)
+        name = os.path.relpath(target, ROOT) if target.endswith(".py") else target
+        if res["status"] != "ok":
+            print("{0:<58s} | {1:>9s} | skipped ({2})".format(name, "-", res["reason"][:40]))
+            continue
+        problems = check(res, args.limit)
+        failures += bool(problems)
+        print("{0:<58s} | {1:>9.2f} | {2}".format(name, res["time"],
+                                                 ", ".join(problems) or "ok"))
+    # Signal failures by the exit code.
+    print("\n{0} failures (limit {1} ms)".format(failures, args.limit))
+    return 1 if failures else 0
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    sys.exit(main())
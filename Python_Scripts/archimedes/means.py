@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Means of the half perimeters as estimate of Pi.
+
+Description:
+The script archimedes_netz_lto calculates the Archimedes constant from
+the half of the outer perimeter a1 and the half of the inner perimeter
+b1 with one of several means. Here these means are collected with their
+weights as parameters, so that variants like the weights 2/3 to 6/7 of
+the "Spin-off" table can be evaluated on the same perimeters.
+
+All means divide by the radius r. Decimal numbers, floats and the
+numbers of this package can be used.
+
+    netz                    (w⋅H + C)/(w + 1), H = 3⋅a₁⋅b₁/(2⋅a₁ + b₁),
+                            C = ∛(a₁⋅b₁²)
+    netz_doerrie_geometric  (H^w ⋅ C)^(1/(w + 1))
+    doerrie                 (H + C)/2
+    snellius                (a₁ + 2⋅b₁)/3
+    arithmetic              (a₁ + b₁)/2
+    weighted_arithmetic     (a₁ + w⋅b₁)/(w + 1)
+    heronian                (a₁ + √(a₁⋅b₁) + b₁)/3
+    power                   ((a₁^p + b₁^p)/2)^(1/p)
+
+The weight w is the weight of the lower estimate, e.g. w = 4 gives the
+weights 4/5 and 1/5 of the method of Netz.
+
+evaluate_all() calculates many means of the same perimeters at once.
+The subexpressions a₁⋅b₁, a₁ + b₁, H and the cubic root C are calculated
+only once, so all means cost little more than the most expensive one.
+The operations are done in the order of the methods of archimedes.netz,
+so the estimates of Decimal numbers agree with them in every digit.
+
+Usage:
+    ac = MEANS["netz"](a1, b1, r, weight=4)
+    estimates = evaluate_all(a1, b1, r, [("netz", 4), ("snellius", None)])
+'''
+# pylint: disable=invalid-name
+# pylint: disable=unused-argument
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import the modules of the package.
+from archimedes.numeric import sqrt, cbrt
+
+# ----------------------------------------------------------------------
+# Function netz_mean()
+# ----------------------------------------------------------------------
+def netz_mean(a1, b1, r=1, weight=4):
+    '''Weighted arithmetic mean of the refinement of Dörrie (Netz).'''
+    a2 = (3*a1*b1)/(2*a1 + b1)
+    b2 = cbrt(a1*b1*b1)
+    return (weight*a2 + b2)/((weight + 1)*r)
+
+# ----------------------------------------------------------------------
+# Function netz_doerrie_geometric_mean()
+# ----------------------------------------------------------------------
+def netz_doerrie_geometric_mean(a1, b1, r=1, weight=4):
+    '''Weighted geometric mean of the refinement of Dörrie.'''
+    a2 = (3*a1*b1)/(2*a1 + b1)
+    b2 = cbrt(a1*b1*b1)
+    # Create the exponent in the number type of the arguments.
+    exponent = 1/(b2*0 + weight + 1)
+    return (a2**weight*b2)**exponent/r
+
+# ----------------------------------------------------------------------
+# Function doerrie_mean()
+# ----------------------------------------------------------------------
+def doerrie_mean(a1, b1, r=1, weight=None):
+    '''Arithmetic mean of the refinement of Dörrie.'''
+    return netz_mean(a1, b1, r, weight=1)
+
+# ----------------------------------------------------------------------
+# Function snellius_mean()
+# ----------------------------------------------------------------------
+def snellius_mean(a1, b1, r=1, weight=None):
+    '''Weighted arithmetic mean of Snellius.'''
+    return (a1 + 2*b1)/(3*r)
+
+# ----------------------------------------------------------------------
+# Function arithmetic_mean()
+# ----------------------------------------------------------------------
+def arithmetic_mean(a1, b1, r=1, weight=None):
+    '''Arithmetic mean of both bounds.'''
+    return (a1 + b1)/(2*r)
+
+# ----------------------------------------------------------------------
+# Function weighted_arithmetic_mean()
+# ----------------------------------------------------------------------
+def weighted_arithmetic_mean(a1, b1, r=1, weight=4):
+    '''Weighted arithmetic mean with the weight of the lower bound.'''
+    return (a1 + weight*b1)/((weight + 1)*r)
+
+# ----------------------------------------------------------------------
+# Function heronian_mean()
+# ----------------------------------------------------------------------
+def heronian_mean(a1, b1, r=1, weight=None):
+    '''Heronian mean of both bounds.'''
+    return (a1 + sqrt(a1*b1) + b1)/(3*r)
+
+# ----------------------------------------------------------------------
+# Function power_mean()
+# ----------------------------------------------------------------------
+def power_mean(a1, b1, r=1, p=1):
+    '''Power mean of both bounds with the exponent p.'''
+    # Create the exponent in the number type of the arguments.
+    exponent = 1/(b1*0 + p)
+    return ((a1**p + b1**p)/2)**exponent/r
+
+# Define the dictionary with the means in the order of the methods of
+# archimedes_netz_lto.
+MEANS = {"netz": netz_mean,
+         "netz_doerrie_geometric": netz_doerrie_geometric_mean,
+         "doerrie": doerrie_mean,
+         "snellius": snellius_mean,
+         "arithmetic": arithmetic_mean,
+         "weighted_arithmetic": weighted_arithmetic_mean,
+         "heronian": heronian_mean,
+         "power": power_mean}
+
+# Define the means which have a weight.
+WEIGHTED = ("netz", "netz_doerrie_geometric", "weighted_arithmetic")
+
+# Define the default weights of the weighted means.
+DEFAULT_WEIGHT = {"netz": 4, "netz_doerrie_geometric": 4, "weighted_arithmetic": 4}
+
+# Define the list of all means with their default weights.
+DEFAULT_GRID = [(name, DEFAULT_WEIGHT.get(name)) for name in MEANS]
+
+# ----------------------------------------------------------------------
+# Function evaluate_all()
+# ----------------------------------------------------------------------
+def evaluate_all(a1, b1, r=1, grid=None):
+    '''Return the estimates of all (mean, weight) pairs of the grid.
+
+    The shared subexpressions are calculated once per pair of
+    perimeters and only if one of the requested means needs them.
+    '''
+    if grid is None:
+        grid = DEFAULT_GRID
+    names = {name for name, _ in grid}
+    # Calculate the shared subexpressions.
+    ab = a1*b1
+    total = a1 + b1
+    if names & {"netz", "netz_doerrie_geometric", "doerrie"}:
+        h = (3*a1*b1)/(2*a1 + b1)
+        c = cbrt(ab*b1)
+    if "heronian" in names:
+        g = sqrt(ab)
+    # Evaluate the requested means.
+    result = {}
+    for name, weight in grid:
+        if name == "netz":
+            ac = (weight*h + c)/((weight + 1)*r)
+        elif name == "doerrie":
+            ac = (h + c)/(2*r)
+        elif name == "netz_doerrie_geometric":
+            ac = (h**weight*c)**(1/(c*0 + weight + 1))/r
+        elif name == "snellius":
+            ac = (a1 + 2*b1)/(3*r)
+        elif name == "arithmetic":
+            ac = total/(2*r)
+        elif name == "weighted_arithmetic":
+            ac = (a1 + weight*b1)/((weight + 1)*r)
+        elif name == "heronian":
+            ac = (a1 + g + b1)/(3*r)
+        elif name == "power":
+            p = 1 if weight is None else weight
+            ac = ((a1**p + b1**p)/2)**(1/(b1*0 + p))/r
+        else:
+            raise KeyError(name)
+        result[(name, weight)] = ac
+    # Return the estimates.
+    return result
@@ -0,0 +1,209 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Peak memory and allocation sites per phase of a calculation.
+
+Description:
+The memory profiler uses the standard Python module tracemalloc. A
+calculation is split into phases, e.g.
+
+    iteration     recurrence of the perimeters
+    refinement    calculation of the Archimedes constant
+    formatting    conversion to strings and printing
+    verification  comparison with the reference value
+
+For each phase the peak of the traced memory above the memory at the
+start of the phase and the source lines with the largest growth of
+allocated memory are reported. Phases with the same name are merged.
+The peak of a phase is exact with Python 3.9 and later
+(tracemalloc.reset_peak()), before it is the peak since the start of
+tracing.
+
+All numbers and strings of a calculation grow linearly with the number
+of places, but each phase has a fixed overhead as well. The phases can
+therefore be measured for several sizes (resize()). The projection fits
+a straight line through the peaks of all sizes of a phase, the slope is
+the memory per place. A phase measured for one size only is scaled by
+the places including its overhead and marked with *. A Decimal with n
+places needs about n/19*8 bytes, a string n bytes.
+
+Tracing slows a calculation down considerably. Only use it to check the
+memory, not to measure times.
+
+Usage:
+    from archimedes.profiling import phase
+    memory = MemoryProfiler(places)
+    with phase(memory, "iteration"):
+        ...
+    memory.resize(places//4)
+    with phase(memory, "iteration"):
+        ...
+    memory.print_report()
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import localcontext
+
+# Define the places of the projection.
+PROJECTION = (10**4, 10**5, 10**6, 10**7)
+
+# ----------------------------------------------------------------------
+# Function object_sizes()
+# ----------------------------------------------------------------------
+def object_sizes(places):
+    '''Return the size in bytes of a Decimal and a string with the given
+    number of places.'''
+    with localcontext() as ctx:
+        ctx.prec = places + 1
+        number = D(1)/D(7)
+    return {"decimal": sys.getsizeof(number), "string": sys.getsizeof("3." + places*"1")}
+
+# ----------------------------------------------------------------------
+# Function fit_line()
+# ----------------------------------------------------------------------
+def fit_line(xs, ys):
+    '''Return slope and intercept of the least squares line.'''
+    n = len(xs)
+    mx, my = sum(xs)/n, sum(ys)/n
+    sxx = sum((x - mx)**2 for x in xs)
+    slope = sum((x - mx)*(y - my) for x, y in zip(xs, ys))/sxx
+    return slope, my - slope*mx
+
+# ----------------------------------------------------------------------
+# Function _format_bytes()
+# ----------------------------------------------------------------------
+def _format_bytes(size):
+    '''Return a size in bytes as human readable string.'''
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return "{0:.1f} {1}".format(size, unit)
+        size /= 1024
+    return "{0:.1f} GiB".format(size)
+
+# ----------------------------------------------------------------------
+# Class MemoryProfiler
+# ----------------------------------------------------------------------
+class MemoryProfiler:
+    '''Measure the peak memory and the allocation sites per phase.'''
+
+    def __init__(self, places, top=5, frames=1):
+        # Store the places and the number of reported sites.
+        self.places = places
+        self.size = places
+        self.top = top
+        self.frames = frames
+        self.phases = []
+
+    def resize(self, places):
+        '''Measure the following phases for a calculation of the places.'''
+        self.size = places
+
+    @staticmethod
+    def _snapshot():
+        '''Take a snapshot without the allocations of the profiler.'''
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),
+             tracemalloc.Filter(False, __file__)))
+
+    @contextmanager
+    def phase(self, name):
+        '''Measure the enclosed block as phase with the given name.'''
+        # Start tracing if not done yet.
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        before = self._snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        try:
+            yield self
+        finally:
+            # Get the peak and the sites with the largest growth.
+            current, peak = tracemalloc.get_traced_memory()
+            stats = self._snapshot().compare_to(before, "lineno")
+            sites = [s for s in stats if s.size_diff > 0][:self.top]
+            peak = max(peak - start, 0)
+            # Keep the peaks of the other sizes for the projection.
+            for p in self.phases:
+                if p["phase"] == name:
+                    p["peaks"][self.size] = max(p["peaks"].get(self.size, 0), peak)
+                    break
+            else:
+                p = {"phase": name, "peak": 0, "retained": 0, "sites": [],
+                     "peaks": {self.size: peak}}
+                self.phases.append(p)
+            # Merge repeated phases with the same name of the places.
+            if self.size == self.places:
+                p["peak"] = max(p["peak"], peak)
+                p["retained"] += current - start
+                p["sites"] = sorted(p["sites"] + sites,
+                                    key=lambda s: -s.size_diff)[:self.top]
+
+    def stop(self):
+        '''Stop tracing.'''
+        tracemalloc.stop()
+
+    def line(self, p):
+        '''Return bytes per place and fixed bytes of a phase. A phase of
+        one size has no fixed bytes.'''
+        sizes = sorted(p["peaks"])
+        if len(sizes) < 2:
+            return p["peaks"][sizes[0]]/sizes[0], 0
+        return fit_line(sizes, [p["peaks"][n] for n in sizes])
+
+    def projection(self, places):
+        '''Return the projected peak in bytes per phase for the places.'''
+        result = {}
+        for p in self.phases:
+            slope, intercept = self.line(p)
+            result[p["phase"]] = max(slope*places + intercept, 0)
+        return result
+
+    def print_report(self, projection=PROJECTION):
+        '''Print the peaks, the allocation sites and the projection.'''
+        # Print the peak per phase.
+        print("{0:<15s} | {1:>12s} | {2:>12s} | {3:>12s}".format(
+            "Phase", "Peak", "Retained", "Bytes/place"))
+        print("{0}".format(60*"-"))
+        for p in self.phases:
+            print("{0:<15s} | {1:>12s} | {2:>12s} | {3:>12.1f}".format(
+                p["phase"], _format_bytes(p["peak"]), _format_bytes(p["retained"]),
+                self.line(p)[0]))
+        # Print the sites with the largest growth per phase.
+        for p in self.phases:
+            print("\nTop allocation sites of phase {0}:".format(p["phase"]))
+            for s in p["sites"]:
+                frame = s.traceback[0]
+                print("  {0:>12s}  {1}:{2}".format(
+                    _format_bytes(s.size_diff), frame.filename, frame.lineno))
+        # Print the size of single objects and the projection.
+        sizes = object_sizes(self.places)
+        print("\nSize of one Decimal with {0} places: {1}".format(
+            self.places, _format_bytes(sizes["decimal"])))
+        print("Size of one string with {0} places: {1}".format(
+            self.places, _format_bytes(sizes["string"])))
+        print("\nProjected peak per phase (line through the measured places):")
+        print("{0:<15s} | ".format("Phase")
+              + " | ".join("{0:>10d}".format(n) for n in projection))
+        print("{0}".format((18 + 13*len(projection))*"-"))
+        peaks = [self.projection(n) for n in projection]
+        for p in self.phases:
+            name = p["phase"] if len(p["peaks"]) > 1 else p["phase"] + " *"
+            print("{0:<15s} | ".format(name)
+                  + " | ".join("{0:>10s}".format(_format_bytes(peak[p["phase"]]))
+                               for peak in peaks))
+        if any(len(p["peaks"]) < 2 for p in self.phases):
+            print("\n* measured for one size, scaled including the fixed overhead")
+        # End of function. Return 1.
+        return 1
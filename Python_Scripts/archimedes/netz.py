@@ -0,0 +1,708 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Calculation engine of the script archimedes_netz_lto.
+
+Description:
+The script new_approaches/dec/archimedes_netz_lto.py calculates Pi with
+the perimeters of Pfaff and one of several means, the reference method
+being the weighted arithmetic mean of Netz. Here are its functions and
+the class PiComputation, so that they can be imported without running
+the script.
+
+The import only defines functions and constants. Nothing is calculated
+and the decimal context is not changed. The 10000 places of the heredoc
+of the script are read from pi_heredoc.txt when reference_digits() is
+called for the first time.
+
+Usage:
+    from archimedes.netz import PiComputation
+    acstr, i = PiComputation(1000, method=0).run()
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-arguments
+# pylint: disable=multiple-statements
+# pylint: disable=import-outside-toplevel
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.5"
+
+# Import some standard Python modules.
+import os
+import sys
+from functools import lru_cache
+from time import perf_counter
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import Context, localcontext, ROUND_HALF_DOWN, ROUND_UP
+
+# Import the modules of the package. cubic_root() and correct_digits()
+# stay importable from this module.
+from archimedes.means import evaluate_all
+from archimedes.numeric import cubic_root
+from archimedes.profiling import phase, timed
+from archimedes.progress import progress_reporter
+from archimedes.reference import correct_digits
+
+# Define the file with the heredoc of Pi with 10000 places.
+HEREDOC_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pi_heredoc.txt")
+
+# Define the dictionary with the used methods.
+METHODS = {"0": "DÖRRIE AND NETZ ARITHMETIC MEAN",
+           "1": "NETZ WEIGHTED ARITHMETIC MEAN",
+           "2": "DÖRRIE ARITHMETIC MEAN",
+           "3": "SNELLIUS ARITHMETIC MEAN",
+           "4": "ARITHMETIC MEAN",
+           "5": "WEIGHTED ARITHMETIC MEAN",
+           "6": "HERONIAN MEAN",
+           "7": "POWER MEAN"}
+
+# Map the methods to the calibrated models of archimedes.calibration.
+CALIBRATED = {0: "netz", 2: "doerrie", 3: "snellius", 4: "pfaff"}
+
+# Map the methods to the means and weights of archimedes.means.
+MEAN_OF_METHOD = {"0": ("netz", 4),
+                  "1": ("netz_doerrie_geometric", 4),
+                  "2": ("doerrie", None),
+                  "3": ("snellius", None),
+                  "4": ("arithmetic", None),
+                  "5": ("weighted_arithmetic", 4),
+                  "6": ("heronian", None),
+                  "7": ("power", None)}
+
+# Define the order of the methods. The Archimedes constant has about order
+# times the correct places of the gap a1 - b1 of the perimeters.
+ORDER = {0: 3, 1: 3, 2: 2, 3: 2, 4: 1, 5: 1, 6: 1, 7: 1}
+
+# ----------------------------------------------------------------------
+# Function init_values()
+# ----------------------------------------------------------------------
+def init_values(places, offset=16, method=None):
+    '''Predict precision and iteration by places.
+
+    Base values developed from data observations. If the method has
+    been calibrated (python3 -m archimedes.calibration), the values of
+    the calibrated model with its safety margin are used instead. Outside
+    of the calibrated places the base values are the lower bound.
+    '''
+    # Set the base precision and base iteration.
+    baseprec, baseiter = 1.00, 0.56
+    # Calculate precision and iteration.
+    calcprec = D(baseprec)*D(places) + D(offset)
+    calciter = D(baseiter)*D(places) + D(offset)/D(2)
+    # Round them up.
+    precision = int(D(calcprec).quantize(D('1'), rounding=ROUND_UP))
+    iteration = int(D(calciter).quantize(D('1'), rounding=ROUND_UP))
+    # Import the calibration only when precision and iteration are predicted.
+    from archimedes.calibration import load_models, calibrated_range
+    from archimedes.calibration import init_values as calibrated_values
+    # Use the calibrated model of the method if there is one.
+    models = load_models()
+    name = CALIBRATED.get(method)
+    if name in models:
+        calibrated = calibrated_values(places, name, models)
+        low, high = calibrated_range(models[name])
+        if low <= places <= high:
+            return calibrated
+        # Do not extrapolate below the base values.
+        precision = max(precision, calibrated[0])
+        iteration = max(iteration, calibrated[1])
+    # Return required precision and iteration.
+    return precision, iteration
+
+# ----------------------------------------------------------------------
+# Helper function remove_whitestrings()
+# ----------------------------------------------------------------------
+def remove_whitespaces(string):
+    '''Remove all whitespaces defined by a list from a string.'''
+    # Define the list with whitespaces to remove.
+    mapping = [("\n", ""), ("\r", ""), ("\t", ""), (" ", "")]
+    # Remove the whitespaces from the given string.
+    for k, v in mapping:
+        string = string.replace(k, v)
+    # Return the trimmed string.
+    return string
+
+# ----------------------------------------------------------------------
+# Function reference_digits()
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def reference_digits():
+    '''Return the heredoc of Pi with 10000 places as string.'''
+    # Read the heredoc only once.
+    with open(HEREDOC_FILE, encoding="utf-8") as fh:
+        return remove_whitespaces(fh.read())
+
+# ----------------------------------------------------------------------
+# Function hide_cursor()
+# ----------------------------------------------------------------------
+def hide_cursor():
+    '''Hide the cursor.'''
+    sys.stdout.write("\x1b[?25l")
+    sys.stdout.flush()
+
+# ----------------------------------------------------------------------
+# Function show_cursor()
+# ----------------------------------------------------------------------
+def show_cursor():
+    '''Show the cursor.'''
+    sys.stdout.write("\x1b[?25h")
+    sys.stdout.flush()
+
+# ----------------------------------------------------------------------
+# Function print_iteration()
+# ----------------------------------------------------------------------
+def print_iteration(citer):
+    '''Print progress in form of the current iteration.'''
+    if citer == 0 or (citer % 100 == 0 and citer >= 100):
+        string = "Iteration: " + str(citer)
+        sys.stdout.write(string)
+        sys.stdout.write("\r")
+        sys.stdout.flush()
+
+# ----------------------------------------------------------------------
+# Function ancient_greek_mean()
+#
+# See also:
+# www.mathpages.com/home/kmath462/kmath462.htm
+# ----------------------------------------------------------------------
+def ancient_greek_mean(a1, b1, r):
+    '''Archimedes constant calculation using an ancient Greek mean.
+
+    Further ancient Greek means of a₁ and b₁ are
+    a1**2/(2*a1 - b1), (2*a1*b1 - b1**2)/a1, (a1**2 + b1**2)/(a1 + b1)
+    and (a1**2 - a1*b1 + b1**2)/a1.
+    '''
+    # Calculate the Archimedes constant.
+    ac = (b1 + D(4*a1*b1 - 3*b1**2).sqrt())/2*r
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function power_mean()
+#
+# See also:
+# mathworld.wolfram.com/PowerMean.html
+# ----------------------------------------------------------------------
+def power_mean(a1, b1, r):
+    '''Calculate the Archimedes constant using the Power mean.
+
+    Other names for the Power mean are Generalized mean or Hölder mean.
+    For p = 2 we get the Quadratic mean (Root mean square or RMS) and
+    for p = 3 we get the Cubic mean.
+               ___________
+              ╱   p      p
+             ╱  a₁  +  b₁
+          p ╱   ─────────
+          ╲╱        2
+    ac =  ────────────────
+                 r
+    '''
+    # To-Do:
+    # ac = ((a1**wa * b1**wb)**(1/D(wa+wb))) / r
+    # Calculate the Archimedes constant.
+    p = 1
+    ac = (((a1**p + b1**p)/D(2))**(1/D(p))) / r
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function logarithmic_mean()
+#
+# See also:
+# mathworld.wolfram.com/ ->
+# <- /Arithmetic-Logarithmic-GeometricMeanInequality.html
+# ----------------------------------------------------------------------
+def logarithmic_mean(a1, b1, r):
+    '''Archimedes constant calculation using the Logarithmic mean.'''
+    # Calculate the Archimedes constant.
+    ac = (a1 - b1)/((D(a1).ln() - D(b1).ln())*r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function heronian_mean()
+#
+# See also:
+# mathworld.wolfram.com/HeronianMean.html
+# ----------------------------------------------------------------------
+def heronian_mean(a1, b1, r):
+    '''Archimedes constant calculation using the Heronian mean.'''
+    # Calculate the Archimedes constant.
+    ac = (a1 + D(a1*b1).sqrt() + b1)/D(3 * r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function archimedes_weighted_arithmetic_mean()
+# ----------------------------------------------------------------------
+def weighted_arithmetic_mean(a1, b1, r):
+    '''Archimedes constant calculation using weighted arithmetic mean.
+
+         wa⋅a₁ + wb⋅b₁
+    ac = ─────────────
+          (wa + wb)⋅r
+    '''
+    # Calculate the Archimedes constant.
+    wa = 1
+    wb = 4
+    ac = (wa*a1 + wb*b1)/((wa + wb)*r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function arithmetic_mean()
+# ----------------------------------------------------------------------
+def arithmetic_mean(a1, b1, r):
+    '''Archimedes constant calculation using arithmetic mean.
+
+         a₁ + b₁
+    ac = ───────
+           2⋅r
+    '''
+    # Calculate the Archimedes constant.
+    ac = (a1 + b1) / (2*r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function snellius_mean()
+# ----------------------------------------------------------------------
+def snellius_mean(a1, b1, r):
+    '''Archimedes constant calculation using Snellius.
+
+         a₁ + 2⋅b₁
+    ac = ─────────
+            3⋅r
+    '''
+    # Calculate the Archimedes constant.
+    ac = (a1 + 2*b1) / (3*r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function doerrie_method()
+# ----------------------------------------------------------------------
+def doerrie_mean(a1, b1, r):
+    '''Archimedes constant calculation using Dörrie.
+
+                        ________
+          3⋅a₁⋅b₁    3 ╱      2
+         ───────── + ╲╱  a₁⋅b₁
+         2⋅a₁ + b₁
+    ac = ───────────────────────
+               2⋅r
+    '''
+    # Calculate the Archimedes constant with the cubic root of Halley.
+    ac = ((3*a1*b1)/(2*a1 + b1) + cubic_root(a1 * b1*b1))/(2*r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function doerrie_weighted_geometric_mean()
+# ----------------------------------------------------------------------
+def netz_doerrie_weighted_geometric_mean(a1, b1, r):
+    '''Archimedes constant calculation using Dörrie and weighted geometric mean
+                                         1
+                                      ───────
+                                      wa + wb
+         ⎛                      1    ⎞
+         ⎜                      ─⋅wa ⎟
+         ⎜           wb         3    ⎟
+         ⎜⎛ 3⋅a₁⋅b₁ ⎞   ⎛     2⎞     ⎟
+         ⎜⎜─────────⎟ ⋅ ⎝a₁⋅b₁ ⎠     ⎟
+         ⎝⎝2⋅a₁ + b₁⎠                ⎠
+    ac = ─────────────────────────────
+                      r
+
+    '''
+    # Calculate the Archimedes constant. The cubic root is the power wa/3.
+    wa = 1
+    wb = 4
+    a2 = (3*a1*b1)/(2*a1 + b1)
+    b2 = cubic_root(a1 * b1*b1)
+    ac = (a2**wb*b2**wa)**(1/D(wa + wb))/r
+    # Return the Archimedes constant.
+    return ac
+
+
+# ----------------------------------------------------------------------
+# Function netz_arithmetic_mean()
+# ----------------------------------------------------------------------
+def netz_arithmetic_mean(a1, b1, r, profiler=None):
+    '''Archimedes constant calculation using the referenz method.
+
+    Calculate the Archimedes constant using the idea of the so-called
+    Snellius acceleration in something like a squared form as well as
+    a mixture of harmonic and geometric mean introduced by Dörrie. The
+    acceleration of the convergence of the calculation is in principle
+    a suitable selected weighted arithmetic mean:
+                             _______
+               3⋅a₁⋅b₁    3 ╱     2
+          4 ⋅ ───────── + ╲╱ a₁⋅b₁
+             2⋅a₁ + b₁
+     ac = ──────────────────────────
+                   5⋅r
+    '''
+    # Calculate the Archimedes constant.
+    #ac = (((12*a1*b1)/(2*a1 + b1)) + ((a1 * b1**2)**(1/D(3))))/5*r
+    with timed(profiler, "archimedes_constant;harmonic_division"):
+        a2 = (3*a1*b1)/(2*a1 + b1)
+    with timed(profiler, "archimedes_constant;cubic_root"):
+        b2 = cubic_root(a1 * b1*b1)
+    with timed(profiler, "archimedes_constant;weighted_mean"):
+        ac = (4*a2 + b2) / (5*r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function archimedes_constant()
+# ----------------------------------------------------------------------
+def archimedes_constant(a1, b1, r, method=0, profiler=None):
+    '''Return Pi based on the choosen method.'''
+    # Calculate Pi based on choosen method.
+    if method == 0:
+        return netz_arithmetic_mean(a1, b1, r, profiler=profiler)
+    # Measure the other methods as a whole.
+    with timed(profiler, "archimedes_constant;" + METHODS[str(method)].lower().replace(" ", "_")):
+        if method == 1:
+            ac = netz_doerrie_weighted_geometric_mean(a1, b1, r)
+        elif method == 2:
+            ac = doerrie_mean(a1, b1, r)
+        elif method == 3:
+            ac = snellius_mean(a1, b1, r)
+        elif method == 4:
+            ac = arithmetic_mean(a1, b1, r)
+        elif method == 5:
+            ac = weighted_arithmetic_mean(a1, b1, r)
+        elif method == 6:
+            ac = heronian_mean(a1, b1, r)
+        elif method == 7:
+            ac = power_mean(a1, b1, r)
+    # Return the Archimedes constant.
+    return ac
+
+# ----------------------------------------------------------------------
+# Function all_archimedes_constants()
+# ----------------------------------------------------------------------
+def all_archimedes_constants(a1, b1, r):
+    '''Return the Archimedes constants of all methods at once.'''
+    # Evaluate all means with shared subexpressions.
+    estimates = evaluate_all(a1, b1, r, list(MEAN_OF_METHOD.values()))
+    # Return the Archimedes constants by method.
+    return {key: estimates[mean] for key, mean in MEAN_OF_METHOD.items()}
+
+# ----------------------------------------------------------------------
+# Function inner_outer_perimeter()
+# ----------------------------------------------------------------------
+def inner_outer_perimeter(r, profiler=None, state=None):
+    '''Generator function for calculating inner and outer perimeter.
+
+    If state (a, b) is given, the generator continues after this state.
+    The loop is chosen once, so the loop without profiler measures nothing.
+    '''
+    # Define the start values.
+    if state is None:
+        a0 = r * 2 * D(3).sqrt()   # half of the outer perimeter
+        b0 = r * 3                 # half of the inner perimeter
+        # Yield the start values in the zeroth loop.
+        yield a0, b0
+    else:
+        # Continue after the given state.
+        a0, b0 = state
+    # Run an infinite loop.
+    if profiler is None:
+        while True:
+            # Calculate the half of inner and outer perimeter.
+            a1 = (2*a0*b0)/(a0 + b0)
+            b1 = D(b0*a1).sqrt()
+            # Store the old values for the next loop.
+            a0 = a1
+            b0 = b1
+            # Yield a1 and b1.
+            yield a1, b1
+    else:
+        while True:
+            # Same calculation with time measurement of each operation.
+            t0 = perf_counter()
+            a1 = (2*a0*b0)/(a0 + b0)
+            t1 = perf_counter()
+            b1 = D(b0*a1).sqrt()
+            t2 = perf_counter()
+            profiler.add("inner_outer_perimeter;harmonic_division", t1 - t0)
+            profiler.add("inner_outer_perimeter;sqrt", t2 - t1)
+            # Store the old values for the next loop.
+            a0 = a1
+            b0 = b1
+            # Yield a1 and b1.
+            yield a1, b1
+
+# ----------------------------------------------------------------------
+# Class PiComputation
+# ----------------------------------------------------------------------
+class PiComputation:
+    '''One calculation of Pi with its own decimal context and generator.
+
+    The instance does not change the decimal context of the thread, so
+    several computations can run one after the other or at the same time
+    in threads of one process. Each run starts the sequence of the
+    perimeters from the beginning.
+    '''
+
+    def __init__(self, places, precision=None, iteration=None, r=1, method=0,
+                 rounding=ROUND_HALF_DOWN):
+        # Predict precision and iteration only if not given.
+        if precision is None or iteration is None:
+            predicted = init_values(places, method=method)
+            precision = predicted[0] if precision is None else precision
+            iteration = predicted[1] if iteration is None else iteration
+        self.places = places
+        self.precision = precision
+        self.iteration = iteration
+        self.radius = r
+        self.method = method
+        # Create the decimal context of the computation.
+        self.context = Context(prec=self.precision, rounding=rounding)
+        # Initialise the state of the sequence.
+        self.i, self.a1, self.b1 = -1, None, None
+        self.stopped = False
+        self._gen = None
+
+    def reset(self, profiler=None):
+        '''Start the sequence of the perimeters from the beginning.'''
+        self.i, self.a1, self.b1 = -1, None, None
+        self.stopped = False
+        self._gen = inner_outer_perimeter(self.radius, profiler=profiler)
+
+    def resume(self, i, a1, b1, profiler=None):
+        '''Continue the sequence after the state of iteration i. The
+        perimeters are rounded to the precision of the computation.'''
+        with localcontext(self.context):
+            self.a1, self.b1 = +D(a1), +D(b1)
+        self.i = i
+        self.stopped = False
+        self._gen = inner_outer_perimeter(self.radius, profiler=profiler,
+                                          state=(self.a1, self.b1))
+
+    def step(self):
+        '''Calculate the next half perimeters and return (i, a1, b1).'''
+        if self._gen is None:
+            self.reset()
+        with localcontext(self.context):
+            self.a1, self.b1 = next(self._gen)
+        self.i += 1
+        return self.i, self.a1, self.b1
+
+    def constant(self, profiler=None):
+        '''Return the Archimedes constant of the current perimeters.'''
+        with localcontext(self.context):
+            return archimedes_constant(self.a1, self.b1, self.radius, method=self.method,
+                                       profiler=profiler)
+
+    def estimated_digits(self):
+        '''Estimate the correct places of the Archimedes constant from the
+        gap of the current perimeters without calculating it.
+
+        The estimate is one place less than order times the places of
+        the gap, which overestimates the correct places by up to one. It
+        is limited by the places lost to the rounding errors of the
+        iterations. Methods without order give 0.
+        '''
+        if self.a1 is None or self.method not in ORDER:
+            return 0
+        # Keep the places not spoiled by the rounding errors of the iterations.
+        limit = min(self.places, self.precision - len(str(max(self.i, 1))) - 1)
+        with localcontext(self.context):
+            gap = self.a1 - self.b1
+        # The perimeters agree in all places of the precision.
+        if not gap:
+            return max(0, limit)
+        return max(0, min(ORDER[self.method]*(-gap.adjusted() - 1) - 1, limit))
+
+    def all_constants(self):
+        '''Return the Archimedes constants of all methods as strings.'''
+        with localcontext(self.context):
+            constants = all_archimedes_constants(self.a1, self.b1, self.radius)
+            return {key: str(ac) for key, ac in constants.items()}
+
+    def run(self, progress=False, profiler=None, tracer=None, memory=None, deadline=None,
+            cache=None):
+        '''Calculate the predicted iterations and return Pi as string and
+        the last iteration (FAST).
+
+        If the time of perf_counter() reaches the deadline, the iteration
+        stops early and the attribute stopped is set. The result is then
+        correct only up to estimated_digits(). With a StateCache of
+        archimedes.states the run starts from the deepest cached state
+        with enough precision and adds its own states to the cache.
+        '''
+        self.reset(profiler)
+        # Skip the iterations of a cached state.
+        state = None if cache is None else \
+            cache.lookup(self.precision, self.iteration, self.radius)
+        if state is not None:
+            self.resume(state[0], state[2], state[3], profiler)
+        if profiler is not None: profiler.frame = "calculate_pi0"
+        # Hide the cursor if the progress is printed.
+        reporter = progress_reporter(progress, self)
+        if reporter is not None: hide_cursor()
+        # Loop an iteration from 0 to ITERATION plus 1.
+        with phase(memory, "iteration"):
+            for i in range(self.i+1, self.iteration+1):
+                # Set the iteration of the profiler.
+                if profiler is not None: profiler.iteration = i
+                #  Calculate the half of inner and outer perimeter.
+                self.step()
+                # Print progress if the interval has passed.
+                if reporter is not None and i >= reporter.next: reporter.report(i)
+                # Cache the state of the iteration.
+                if cache is not None and cache.wants(i):
+                    cache.add(i, self.a1, self.b1, self.precision, self.radius)
+                # Stop at the deadline with the current perimeters.
+                if deadline is not None and perf_counter() >= deadline:
+                    self.stopped = True
+                    break
+                # Record the iteration with its estimate.
+                if tracer is not None and tracer.wants(i):
+                    tracer.record(i, self.a1, self.b1, self.constant())
+        # Cache the last state and write the cache.
+        if cache is not None:
+            cache.add(self.i, self.a1, self.b1, self.precision, self.radius)
+            cache.save()
+        # Calculate the Archimedes constant. The refinement belongs to no
+        # iteration band.
+        if profiler is not None: profiler.iteration = None
+        with phase(memory, "refinement"):
+            ac = self.constant(profiler=profiler)
+        # Print the last iteration and show the cursor.
+        if reporter is not None:
+            reporter.close()
+            show_cursor()
+        # Convert the Archimedes constant into a string.
+        with phase(memory, "formatting"):
+            with timed(profiler, "str"):
+                acstr = str(ac)
+        # Return the Archimedes constant.
+        return acstr, self.i
+
+    def run_until_stable(self, progress=False, profiler=None, tracer=None, memory=None):
+        '''Iterate until five estimates agree and return Pi as string and
+        the first iteration of the agreeing estimates (SLOW).'''
+        # Initialise array and variable.
+        ac = None
+        acarr = []
+        self.reset(profiler)
+        if profiler is not None: profiler.frame = "calculate_pi1"
+        # Hide the cursor if the progress is printed.
+        reporter = progress_reporter(progress, self)
+        if reporter is not None: hide_cursor()
+        # Loop an iteration from 0 to ITERATION plus 1.
+        # Iteration and refinement alternate, they are measured as one phase.
+        with phase(memory, "iteration"):
+            for i in range(0, self.iteration*4):
+                # Set the iteration of the profiler.
+                if profiler is not None: profiler.iteration = i
+                #  Calculate the half of inner and outer perimeter.
+                self.step()
+                # Print progress if the interval has passed.
+                if reporter is not None and i >= reporter.next: reporter.report(i)
+                # Calculate the Archimedes constant.
+                ac = self.constant(profiler=profiler)
+                # Record the iteration.
+                if tracer is not None and tracer.wants(i):
+                    tracer.record(i, self.a1, self.b1, ac)
+                # Add truncated value to array.
+                with timed(profiler, "str"):
+                    acarr.append(str(ac)[:self.places+3])
+                # Check if there are 3 elements in the array.
+                if len(acarr) >= 5:
+                    # Check if all array elements are equal.
+                    if len(set(acarr)) == 1:
+                        # Leave loop.
+                        break
+                    # Remove first element from array.
+                    acarr.pop(0)
+        # Print the last iteration and show the cursor.
+        if reporter is not None:
+            reporter.close()
+            show_cursor()
+        # Reset the iteration of the profiler.
+        if profiler is not None: profiler.iteration = None
+        # Convert the Archimedes constant into a string.
+        with phase(memory, "formatting"):
+            acstr = str(ac)
+        # Return the Archimedes constant.
+        return acstr, i-5
+
+    def run_targets(self, targets, progress=False, margin=2):
+        '''Generate the Archimedes constant for several places from one
+        run with the precision of the largest places.
+
+        For every target the estimate is calculated when the run passes
+        the iteration predicted for the target (init_values()) plus
+        margin. The prediction is for the precision of the target, with
+        more precision the last places may need some more iterations.
+        Yield the places, the iteration, Pi as string with the places and
+        the estimated correct places (estimated_digits()).
+        '''
+        # Sort the targets by their iteration. The largest target uses the
+        # iteration of the computation.
+        schedule = sorted((self.iteration if places >= self.places else
+                           min(init_values(places, method=self.method)[1] + margin,
+                               self.iteration), places) for places in set(targets))
+        self.reset()
+        # Hide the cursor if the progress is printed.
+        reporter = progress_reporter(progress, self)
+        if reporter is not None: hide_cursor()
+        try:
+            for iteration, places in schedule:
+                # Iterate up to the predicted iteration of the target.
+                while self.i < iteration:
+                    self.step()
+                    # Print progress if the interval has passed.
+                    if reporter is not None and self.i >= reporter.next:
+                        reporter.report(self.i)
+                # Refine the current perimeters and cut to the places.
+                acstr = str(self.constant())[:places+2]
+                yield places, self.i, acstr, min(places, self.estimated_digits())
+        finally:
+            # Print the last iteration and show the cursor.
+            if reporter is not None:
+                reporter.close()
+                show_cursor()
+
+# ----------------------------------------------------------------------
+# Function calculate_pi0()
+# ----------------------------------------------------------------------
+def calculate_pi0(places, iteration=16, r=D(1), method=0, progress=False,
+                  profiler=None, tracer=None, memory=None):
+    '''Archimedes algorithm.'''
+    # Run a new computation with the predicted precision.
+    computation = PiComputation(places, iteration=iteration, r=r, method=method)
+    return computation.run(progress, profiler, tracer, memory)
+
+# ----------------------------------------------------------------------
+# Function calculate_pi1()
+# ----------------------------------------------------------------------
+def calculate_pi1(places, iteration=16, r=D(1), method=0, progress=False,
+                  profiler=None, tracer=None, memory=None):
+    '''Archimedes algorithm.'''
+    # Run a new computation with the predicted precision.
+    computation = PiComputation(places, iteration=iteration, r=r, method=method)
+    return computation.run_until_stable(progress, profiler, tracer, memory)
+
+# ----------------------------------------------------------------------
+# Function compare_methods()
+# ----------------------------------------------------------------------
+def compare_methods(computation):
+    '''Return the Archimedes constants of all methods as strings for
+    the last perimeters of a computation.'''
+    # Run the recurrence up to the iteration if not done yet.
+    if computation.i != computation.iteration:
+        computation.reset()
+        while computation.i < computation.iteration:
+            computation.step()
+    # Return the Archimedes constants of all methods.
+    return computation.all_constants()
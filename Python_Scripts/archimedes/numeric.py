@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Square root and cubic root for all used number types.
+
+Description:
+Decimal numbers and the numbers of this package have a method sqrt(),
+floats have not. The cubic root is needed by the refinement of Dörrie.
+The functions below choose the right implementation by the type of the
+argument, so that a recurrence can be written once for all number
+types.
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import the standard Python module math.
+import math
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import getcontext, localcontext, ROUND_HALF_DOWN
+
+# ----------------------------------------------------------------------
+# Function cubic_root()
+# ----------------------------------------------------------------------
+def cubic_root(a):
+    '''Applying the Halleys method to get the cubic root of a Decimal.'''
+    # Calculate the number of leading digits.
+    cln = len(str(a).split(".")[0])
+    # Get the used decimal precision.
+    c = getcontext()
+    prec = c.prec-cln
+    # Set the convergence criterion.
+    eps = D(10)**(-prec)
+    # Set and calculate the start values.
+    x0 = a
+    xn = x0 * (x0*x0*x0 + 2*a) / (2 * x0*x0*x0 + a)
+    # Change the local context.
+    with localcontext() as ctx:
+        # Change the local context behaviour.
+        ctx.prec += 2
+        ctx.rounding = ROUND_HALF_DOWN
+        # Iterate until convergence condition is reached.
+        while abs(xn-x0) >= eps:
+            x0 = xn
+            xn = x0 * (x0*x0*x0 + 2*a) / (2 * x0*x0*x0 + a)
+    # Restore the precision.
+    xn = +xn
+    # Return the cubic root.
+    return xn
+
+# ----------------------------------------------------------------------
+# Function sqrt()
+# ----------------------------------------------------------------------
+def sqrt(x):
+    '''Return the square root of x.'''
+    # Use the standard Python module math for int and float.
+    if isinstance(x, (int, float)):
+        return math.sqrt(x)
+    # Use the method of the number type.
+    return x.sqrt()
+
+# ----------------------------------------------------------------------
+# Function cbrt()
+# ----------------------------------------------------------------------
+def cbrt(x):
+    '''Return the cubic root of a positive x.'''
+    # Use the power operator for int and float.
+    if isinstance(x, (int, float)):
+        return x**(1/3)
+    # Use Halley's method for Decimal numbers.
+    if isinstance(x, D):
+        return cubic_root(x)
+    # Use the method of the number type.
+    return x.cbrt()
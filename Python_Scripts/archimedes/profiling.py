@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Wall-clock time per logical operation and per iteration band.
+
+Description:
+The profiler accumulates the time of named operations, e.g. the
+harmonic mean or the square root of the perimeter recurrence. The time
+is additionally assigned to a band of iterations, so that one sees how
+the cost changes during a run. Nothing is measured if no profiler is
+passed to the calculation. The calculation encloses the operations in
+timed(profiler, operation), which is a shared null context without a
+profiler. The hot loop of the perimeters does not even enter a context,
+it chooses a loop with or without measurement once before iterating.
+
+phase(memory, name) is the same hook for the phases of a calculation,
+e.g. for the MemoryProfiler of archimedes.memory.
+
+The result is printed as summary or written as collapsed stack file.
+Each line of such a file consists of frames separated by semicolons
+and the time in microseconds. The file can be rendered e.g. with
+flamegraph.pl or speedscope.
+
+An operation may itself contain frames separated by semicolons, e.g.
+"inner_outer_perimeter;sqrt". The stack of a line consists of the root
+frame, the calling function (frame), the iteration band and the
+operation.
+
+Usage:
+    profiler = OpProfiler("main")
+    profiler.frame = "calculate_pi0"
+    profiler.iteration = i
+    profiler.add("inner_outer_perimeter;sqrt", seconds)
+    with timed(profiler, "archimedes_constant;cubic_root"):
+        b2 = cubic_root(a1 * b1*b1)
+    profiler.print_summary()
+    profiler.write_collapsed("netz_lto.folded")
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+# Define the context doing nothing, shared by all calls without profiler.
+NULL = nullcontext()
+
+# ----------------------------------------------------------------------
+# Class OpProfiler
+# ----------------------------------------------------------------------
+class OpProfiler:
+    '''Accumulate the time of named operations per iteration band.'''
+
+    def __init__(self, root="main", band=100):
+        # Initialise the root frame, the band width and the totals.
+        self.root = root
+        self.band = band
+        self.frame = None
+        self.iteration = None
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.start = perf_counter()
+
+    def _band_name(self):
+        '''Return the name of the band of the current iteration.'''
+        low = (self.iteration//self.band)*self.band
+        return "iter {0:06d}-{1:06d}".format(low, low + self.band - 1)
+
+    def add(self, operation, seconds):
+        '''Add the time of an operation to the current frame and band.'''
+        # Get the band if an iteration is running.
+        band = None if self.iteration is None else self._band_name()
+        # Accumulate time and calls.
+        key = (self.frame, band, operation)
+        self.totals[key] += seconds
+        self.calls[key] += 1
+
+    @contextmanager
+    def timer(self, operation):
+        '''Add the time of the enclosed block to the operation.'''
+        start = perf_counter()
+        try:
+            yield self
+        finally:
+            self.add(operation, perf_counter() - start)
+
+    def operations(self):
+        '''Return the total time and calls per operation.'''
+        result = defaultdict(lambda: [0.0, 0])
+        for (_, _, operation), seconds in self.totals.items():
+            result[operation][0] += seconds
+        for (_, _, operation), calls in self.calls.items():
+            result[operation][1] += calls
+        return dict(result)
+
+    def bands(self):
+        '''Return the total time per iteration band.'''
+        result = defaultdict(float)
+        for (_, band, _), seconds in self.totals.items():
+            if band is not None:
+                result[band] += seconds
+        return dict(sorted(result.items()))
+
+    def print_summary(self):
+        '''Print the time per operation and per iteration band.'''
+        # Calculate the elapsed and the measured time.
+        elapsed = perf_counter() - self.start
+        ops = self.operations()
+        measured = sum(seconds for seconds, _ in ops.values())
+        share = lambda seconds: 100*seconds/elapsed if elapsed > 0 else 0
+        # Print the time per operation.
+        print("{0:<45s} | {1:>8s} | {2:>10s} | {3:>6s}".format(
+            "Operation", "Calls", "Time [s]", "Share"))
+        print("{0}".format(78*"-"))
+        for op, (seconds, calls) in sorted(ops.items(), key=lambda x: -x[1][0]):
+            print("{0:<45s} | {1:>8d} | {2:>10.4f} | {3:>5.1f}%".format(
+                op, calls, seconds, share(seconds)))
+        print("{0:<45s} | {1:>8s} | {2:>10.4f} | {3:>5.1f}%".format(
+            "(not measured)", "", elapsed - measured, share(elapsed - measured)))
+        # Print the time per iteration band.
+        print("\n{0:<45s} | {1:>10s} | {2:>6s}".format("Iteration band", "Time [s]", "Share"))
+        print("{0}".format(67*"-"))
+        for band, seconds in self.bands().items():
+            print("{0:<45s} | {1:>10.4f} | {2:>5.1f}%".format(band, seconds, share(seconds)))
+        # End of function. Return 1.
+        return 1
+
+    def write_collapsed(self, path):
+        '''Write a flamegraph compatible collapsed stack file.'''
+        with open(path, "w", encoding="utf-8") as fh:
+            for (frame, band, operation), seconds in sorted(
+                    self.totals.items(), key=lambda x: [str(k) for k in x[0]]):
+                stack = [f for f in (self.root, frame, band, operation) if f is not None]
+                fh.write("{0} {1}\n".format(";".join(stack), int(round(seconds*1e6))))
+        # End of function. Return 1.
+        return 1
+
+# ----------------------------------------------------------------------
+# Function timed()
+# ----------------------------------------------------------------------
+def timed(profiler, operation):
+    '''Return the timer of an operation or a context doing nothing if
+    there is no profiler.'''
+    return NULL if profiler is None else profiler.timer(operation)
+
+# ----------------------------------------------------------------------
+# Function phase()
+# ----------------------------------------------------------------------
+def phase(memory, name):
+    '''Return the phase of a profiler, e.g. a MemoryProfiler of
+    archimedes.memory, or a context doing nothing if there is none.'''
+    return NULL if memory is None else memory.phase(name)
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Progress of a calculation throttled by the wall-clock time.
+
+Description:
+print_iteration() of archimedes.netz prints every 100th iteration. For
+many places an iteration takes long and the terminal stays silent, for
+few places the output costs more than the iteration. Here the progress
+is printed every INTERVAL seconds instead:
+
+    iteration   current iteration of the recurrence
+    rate        iterations per second
+    eta         projected seconds until the last iteration
+    digits      estimated correct places now and at the last iteration
+
+The reporter keeps a cost model of the recurrence, the seconds per
+iteration. From it the iteration of the next report is predicted, so
+the loop compares only two integers per iteration and reads the clock
+about once per INTERVAL. The cost model is updated at every report,
+since the cost per iteration changes e.g. with the load of the computer.
+
+The estimated correct places are taken from the gap of the perimeters
+(PiComputation.estimated_digits()). They grow linearly with the
+iterations, so their value at the last iteration is extrapolated.
+
+If the output is not a terminal, e.g. redirected to a file, no reporter
+is created and the loop only checks the reporter for None.
+
+Usage:
+    reporter = progress_reporter(True, computation)
+    for i in range(iteration + 1):
+        computation.step()
+        if reporter is not None and i >= reporter.next:
+            reporter.report(i)
+    if reporter is not None: reporter.close()
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-instance-attributes
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import sys
+from time import perf_counter
+
+# Define the seconds between two reports.
+INTERVAL = 0.5
+
+# Define the weight of the newest measurement in the cost model.
+SMOOTHING = 0.5
+
+# ----------------------------------------------------------------------
+# Class ProgressReporter
+# ----------------------------------------------------------------------
+class ProgressReporter:
+    '''Progress of a PiComputation printed every interval seconds.'''
+
+    def __init__(self, computation, stream=None, interval=INTERVAL):
+        # Store the computation and the output.
+        self.computation = computation
+        self.stream = sys.stdout if stream is None else stream
+        self.interval = interval
+        # Initialise the cost model and the next report.
+        self.cost = None
+        self.next = 0
+        self._start = perf_counter()
+        self._last = (-1, self._start)
+        self._width = 0
+
+    def report(self, i):
+        '''Print the progress of iteration i and predict the next report.'''
+        now = perf_counter()
+        last_i, last_t = self._last
+        # Update the seconds per iteration.
+        if i > last_i and now > last_t:
+            cost = (now - last_t)/(i - last_i)
+            self.cost = cost if self.cost is None else \
+                SMOOTHING*cost + (1 - SMOOTHING)*self.cost
+        self._last = (i, now)
+        # Predict the iteration which is reached after the interval.
+        if self.cost:
+            self.next = i + max(1, int(self.interval/self.cost))
+        else:
+            self.next = i + 1
+        self.write(self.line(i))
+
+    def projection(self, i):
+        '''Return iterations per second, remaining seconds, estimated
+        places now and estimated places at the last iteration.'''
+        total = self.computation.iteration
+        digits = self.computation.estimated_digits()
+        final = min(self.computation.places, digits*total//i) if i > 0 else 0
+        if not self.cost:
+            return None, None, digits, final
+        return 1/self.cost, max(0, total - i)*self.cost, digits, final
+
+    def line(self, i):
+        '''Return the line of progress of iteration i.'''
+        rate, eta, digits, final = self.projection(i)
+        if rate is None:
+            return "Iteration: {0}".format(i)
+        return "Iteration: {0} | {1:.1f} it/s | ETA {2:.1f} s | places {3} of ~{4}".format(
+            i, rate, eta, digits, final)
+
+    def write(self, string):
+        '''Overwrite the line of the last report.'''
+        self.stream.write(string.ljust(self._width) + "\r")
+        self.stream.flush()
+        self._width = len(string)
+
+    def message(self, string):
+        '''Print a line in place of the last report.'''
+        self.stream.write(string.ljust(self._width) + "\n")
+        self.stream.flush()
+        self._width = 0
+
+    def close(self):
+        '''Print the progress of the last iteration.'''
+        if self.computation.i >= 0:
+            self.report(self.computation.i)
+
+# ----------------------------------------------------------------------
+# Function progress_reporter()
+# ----------------------------------------------------------------------
+def progress_reporter(progress, computation, stream=None):
+    '''Return a reporter or None if progress is disabled or the output
+    is not a terminal.'''
+    if isinstance(progress, ProgressReporter):
+        return progress
+    stream = sys.stdout if stream is None else stream
+    if not progress or not stream.isatty():
+        return None
+    return ProgressReporter(computation, stream)
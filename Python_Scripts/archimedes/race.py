@@ -0,0 +1,209 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Race of several methods to a requested number of correct places.
+
+Description:
+Which method reaches a number of places first depends on the computer
+and on the places. The method of Netz needs the fewest iterations, but
+its refinement costs a cubic root. The method of Snellius needs more
+iterations, which are cheaper. Here the candidate methods run at the
+same time in their own processes:
+
+    1. Every process runs a PiComputation of archimedes.netz, the engine
+       of archimedes_netz_lto, with the predicted precision of its
+       method. After every step() the correct places are estimated from
+       the gap of the perimeters (PiComputation.estimated_digits()).
+    2. Every process reports its progress to the parent process.
+    3. The first method with the requested estimated places refines its
+       perimeters once and wins. Its result is returned and the other
+       processes are stopped.
+
+So an iteration costs as much as in the engine, the refinement is done
+only at the end. No reference is needed during the race, with --check
+the places of the winner are compared with the reference afterwards.
+The candidates are the calibrated methods of archimedes.netz
+(CALIBRATED).
+
+The processes are stopped cooperatively by an event, which they check
+in every iteration. Processes which do not stop in time are terminated.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.race
+    python3 -m archimedes.race --places 2000
+    python3 -m archimedes.race --places 1000 --methods netz snellius pfaff
+    python3 -m archimedes.race --places 2000 --check
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+import multiprocessing
+import queue
+import time
+
+# Import the modules of the package.
+from archimedes.netz import CALIBRATED, PiComputation, init_values
+from archimedes.reference import pi_digits, correct_digits
+
+# Define the default candidates and places.
+METHODS = ("netz", "doerrie", "snellius")
+PLACES = 1000
+
+# Map the names of the methods to the methods of PiComputation.
+METHOD_OF = {name: method for method, name in CALIBRATED.items()}
+
+# Define the number of iterations between two progress reports.
+REPORT = 10
+
+# Define the seconds to wait for a stopped process.
+TIMEOUT = 5
+
+# ----------------------------------------------------------------------
+# Function race_worker()
+# ----------------------------------------------------------------------
+def race_worker(method, places, maxiter, messages, stop):
+    '''Run a method until it has the estimated places, reaches maxiter
+    or is stopped. Report progress and result to the queue messages.'''
+    start = time.perf_counter()
+    precision, _ = init_values(places, method=METHOD_OF[method])
+    computation = PiComputation(places, precision, maxiter, method=METHOD_OF[method])
+    computation.reset()
+    estimated = 0
+    while computation.i < maxiter:
+        # Stop if another method has won.
+        if stop.is_set():
+            messages.put(("stopped", method, computation.i, estimated,
+                          time.perf_counter() - start, None))
+            return
+        i, _, _ = computation.step()
+        estimated = computation.estimated_digits()
+        if estimated >= places:
+            break
+        if i % REPORT == 0:
+            messages.put(("progress", method, i, estimated, time.perf_counter() - start,
+                          None))
+    # Refine only the last perimeters.
+    string = str(computation.constant())[:places+2]
+    # Report the result.
+    status = "done" if estimated >= places else "failed"
+    messages.put((status, method, computation.i, estimated, time.perf_counter() - start,
+                  string))
+
+# ----------------------------------------------------------------------
+# Function race()
+# ----------------------------------------------------------------------
+def race(places=PLACES, methods=METHODS, maxiter=None, callback=None):
+    '''Race the methods to the places and return the winner and the
+    final state of all methods.
+
+    The winner is a dictionary with method, iteration, estimated places,
+    time and the result string or None if no method reaches the places.
+    The callback is called with every message of the processes.
+    '''
+    if maxiter is None:
+        maxiter = 4*places + 40
+    messages = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    processes = {}
+    for method in methods:
+        args = (method, places, maxiter, messages, stop)
+        processes[method] = multiprocessing.Process(target=race_worker, args=args, daemon=True)
+    state = {method: {"status": "running", "iteration": 0, "estimated": 0, "time": 0.0}
+             for method in methods}
+    winner = None
+    try:
+        for process in processes.values():
+            process.start()
+        # Collect the messages until all methods have finished.
+        running = set(methods)
+        while running:
+            try:
+                status, method, i, estimated, seconds, string = messages.get(timeout=TIMEOUT)
+            except queue.Empty:
+                # Give up on processes which died without a message.
+                running = {m for m in running if processes[m].is_alive()}
+                continue
+            state[method].update(status=status, iteration=i, estimated=estimated, time=seconds)
+            if callback is not None:
+                callback(status, method, i, estimated, seconds)
+            if status == "progress":
+                continue
+            running.discard(method)
+            # The first finished method wins, the others are stopped.
+            if status == "done" and winner is None:
+                winner = {"method": method, "iteration": i, "estimated": estimated,
+                          "time": seconds, "result": string}
+                stop.set()
+    finally:
+        # Stop and wait for all processes.
+        stop.set()
+        for process in processes.values():
+            process.join(TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+    # Return the winner and the state of all methods.
+    return winner, state
+
+# ----------------------------------------------------------------------
+# Function print_progress()
+# ----------------------------------------------------------------------
+def print_progress(status, method, i, estimated, seconds):
+    '''Print a message of the race.'''
+    print("{0:>8.3f} s | {1:<17s} | {2:<8s} | {3:>9d} | {4:>9d}".format(
+        seconds, method, status, i, estimated))
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Race of the methods.")
+    parser.add_argument("--places", type=int, default=PLACES)
+    parser.add_argument("--methods", nargs="+", default=list(METHODS),
+                        choices=sorted(METHOD_OF))
+    parser.add_argument("--quiet", action="store_true", help="print no progress")
+    parser.add_argument("--check", action="store_true",
+                        help="compare the winner with the reference")
+    args = parser.parse_args(argv)
+    # Print the header of the progress.
+    if not args.quiet:
+        print("{0:>10s} | {1:<17s} | {2:<8s} | {3:>9s} | {4:>9s}".format(
+            "Time", "Method", "Status", "Iteration", "Estimated"))
+        print("{0}".format(65*"-"))
+    # Run the race.
+    start = time.perf_counter()
+    winner, state = race(args.places, args.methods,
+                         callback=None if args.quiet else print_progress)
+    elapsed = time.perf_counter() - start
+    # Print the final state of all methods.
+    print("\n{0:<17s} | {1:<8s} | {2:>9s} | {3:>9s} | {4:>10s}".format(
+        "Method", "Status", "Iteration", "Estimated", "Time [s]"))
+    print("{0}".format(65*"-"))
+    for method, res in state.items():
+        print("{0:<17s} | {status:<8s} | {iteration:>9d} | {estimated:>9d} | {time:>10.4f}".format(
+            method, **res))
+    # Print the winner.
+    if winner is None:
+        print("\nNo method reached {0} places.".format(args.places))
+    else:
+        print("\nWinner: {0} after {1:.4f} s (race {2:.4f} s)".format(
+            winner["method"], winner["time"], elapsed))
+        print("{0}...".format(winner["result"][:52]))
+        # Compare the winner with the reference after the race.
+        if args.check:
+            _, correct = correct_digits(winner["result"], pi_digits(args.places))
+            print("Correct places (reference):", correct)
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
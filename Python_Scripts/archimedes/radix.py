@@ -0,0 +1,257 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Conversion of long integers to digit strings and back.
+
+Description:
+The Decimal numbers of archimedes_netz_lto are converted with str() in
+linear time, since Decimal stores decimal digits. The integers of the
+fixed point backend (archimedes.fixed_point) are binary. str() of an
+integer is limited to 4300 digits since Python 3.11
+(sys.set_int_max_str_digits) and needs quadratic time, e.g. about 14 s
+for a million digits on the test system. Converting the integer with
+Decimal(n) or back with int() is quadratic as well.
+
+Here both directions are divided and conquered:
+
+    int_to_str()   n = hi*2^k + lo, both halves are converted to
+                   Decimal recursively and combined with the exact
+                   multiplication of the module decimal, which is
+                   subquadratic for large numbers. str() of the
+                   Decimal integer is linear.
+    str_to_int()   s = hi*10^k + lo, both halves are converted to int
+                   recursively and combined with the Karatsuba
+                   multiplication of Python integers.
+
+The leaves of the recursion are small enough for the built-in
+conversions. Neither function depends on the limit of the integer
+string conversion.
+
+For cross-checking, numbers can also be written in the bases 2, 8 and
+16. For these bases the conversion of integers is linear, e.g. Pi is
+3.243f6a8885a308d3... in base 16.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.radix
+    python3 -m archimedes.radix --digits 10000 100000 1000000
+    python3 -m archimedes.radix --check
+
+    string = to_string(x, 1000, base=16)
+'''
+# pylint: disable=invalid-name
+# pylint: disable=import-outside-toplevel
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import sys
+from time import perf_counter
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import Context, localcontext, Inexact, MAX_PREC, MAX_EMAX, MIN_EMIN, ROUND_DOWN
+
+# Define the format codes of the bases with linear conversion.
+CODES = {2: "b", 8: "o", 16: "x"}
+CODES_BITS = {2: 1, 8: 3, 16: 4}
+
+# Define the size of the leaves of the recursion. Smaller numbers are
+# converted with the built-in conversions.
+LEAF_BITS = 8192
+LEAF_DIGITS = 2048
+
+# Define Pi in base 16 for the check of the conversion.
+PI_HEX = "3.243f6a8885a308d313198a2e03707344a4093822299f31d0082efa98ec4e6c89"
+
+# ----------------------------------------------------------------------
+# Function exact_context()
+# ----------------------------------------------------------------------
+def exact_context():
+    '''Return a decimal context for exact integer arithmetic.'''
+    return Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[Inexact])
+
+# ----------------------------------------------------------------------
+# Function int_to_decimal()
+# ----------------------------------------------------------------------
+def int_to_decimal(n):
+    '''Convert a non-negative integer to a Decimal integer.'''
+    powers = {}
+
+    def power(k):
+        # Calculate 2^k once per conversion.
+        if k not in powers:
+            powers[k] = D(2)**k
+        return powers[k]
+
+    def convert(n, width):
+        # Convert small integers directly.
+        if width <= LEAF_BITS:
+            return D(n)
+        # Split the integer in a high and a low half of bits.
+        half = width >> 1
+        hi = n >> half
+        lo = n - (hi << half)
+        return convert(hi, width - half)*power(half) + convert(lo, half)
+
+    with localcontext(exact_context()):
+        return convert(n, n.bit_length())
+
+# ----------------------------------------------------------------------
+# Function int_to_str()
+# ----------------------------------------------------------------------
+def int_to_str(n, base=10):
+    '''Return the digits of an integer in the base 10, 2, 8 or 16.'''
+    if base in CODES:
+        return format(n, CODES[base])
+    if base != 10:
+        raise ValueError("base {0} is not supported".format(base))
+    # Convert the absolute value and add the sign.
+    string = "{0:f}".format(int_to_decimal(abs(n)))
+    return "-" + string if n < 0 else string
+
+# ----------------------------------------------------------------------
+# Function str_to_int()
+# ----------------------------------------------------------------------
+def str_to_int(string):
+    '''Convert a string of decimal digits with optional sign to int.'''
+    sign = -1 if string[:1] == "-" else 1
+    digits = string.lstrip("+-")
+    powers = {}
+
+    def power(k):
+        # Calculate 10^k once per conversion.
+        if k not in powers:
+            powers[k] = 10**k
+        return powers[k]
+
+    def convert(a, b):
+        # Convert short strings directly.
+        if b - a <= LEAF_DIGITS:
+            return int(digits[a:b])
+        # Split the string in a high and a low half of digits.
+        middle = (a + b + 1)//2
+        return convert(a, middle)*power(b - middle) + convert(middle, b)
+
+    return sign*convert(0, len(digits))
+
+# ----------------------------------------------------------------------
+# Function split_places()
+# ----------------------------------------------------------------------
+def split_places(digits, places, negative=False):
+    '''Insert the point before the last places digits.'''
+    digits = digits.rjust(places + 1, "0")
+    string = digits[:len(digits)-places] + "." + digits[len(digits)-places:] \
+        if places > 0 else digits
+    return "-" + string if negative else string
+
+# ----------------------------------------------------------------------
+# Function fixed_to_string()
+# ----------------------------------------------------------------------
+def fixed_to_string(m, bits, places, base=10):
+    '''Return the fixed point number m/2^bits truncated to the places
+    in the base 10, 2, 8 or 16.'''
+    if base in CODES:
+        # Shift the mantissa to the digits of the base.
+        shift = CODES_BITS[base]*places
+        scaled = (abs(m) << shift) >> bits
+    else:
+        scaled = (abs(m)*10**places) >> bits
+    return split_places(int_to_str(scaled, base), places, m < 0)
+
+# ----------------------------------------------------------------------
+# Function decimal_to_string()
+# ----------------------------------------------------------------------
+def decimal_to_string(x, places, base=10):
+    '''Return the Decimal number x truncated to the places in the base
+    10, 2, 8 or 16.'''
+    if base == 10:
+        # Decimal numbers are converted in linear time.
+        with localcontext(exact_context()) as ctx:
+            ctx.rounding = ROUND_DOWN
+            ctx.traps[Inexact] = False
+            return "{0:f}".format(x.quantize(D(1).scaleb(-places)))
+    # Multiply exactly with base^places and convert the integer part.
+    with localcontext(exact_context()):
+        scaled = (abs(x)*D(base)**places).to_integral_value(rounding=ROUND_DOWN)
+    return split_places(int_to_str(str_to_int("{0:f}".format(scaled)), base), places,
+                        x.is_signed())
+
+# ----------------------------------------------------------------------
+# Function to_string()
+# ----------------------------------------------------------------------
+def to_string(x, places, base=10):
+    '''Return an integer, a Decimal or a FixedPoint number truncated to
+    the places in the base 10, 2, 8 or 16.'''
+    if isinstance(x, int):
+        return split_places(int_to_str(abs(x), base) + "0"*places, places, x < 0)
+    if isinstance(x, D):
+        return decimal_to_string(x, places, base)
+    return x.to_string(places, base)
+
+# ----------------------------------------------------------------------
+# Function benchmark()
+# ----------------------------------------------------------------------
+def benchmark(digits):
+    '''Compare the conversions with str() and int() and return a list
+    of (digits, str, int_to_str, int, str_to_int) times in seconds.'''
+    # Remove the limit of the integer string conversion for str().
+    limit = sys.get_int_max_str_digits() if hasattr(sys, "get_int_max_str_digits") else None
+    if limit is not None:
+        sys.set_int_max_str_digits(0)
+    results = []
+    try:
+        for count in digits:
+            n = 7**int(count/0.8451)
+            t0 = perf_counter()
+            reference = str(n)
+            t1 = perf_counter()
+            string = int_to_str(n)
+            t2 = perf_counter()
+            int(reference)
+            t3 = perf_counter()
+            number = str_to_int(reference)
+            t4 = perf_counter()
+            if string != reference or number != n:
+                raise ArithmeticError("conversion of {0} digits failed".format(count))
+            results.append((len(reference), t1 - t0, t2 - t1, t3 - t2, t4 - t3))
+    finally:
+        if limit is not None:
+            sys.set_int_max_str_digits(limit)
+    return results
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line. The module is imported by fixed_point, so
+    # argparse is imported only here.
+    import argparse
+    parser = argparse.ArgumentParser(description="Conversion of long integers.")
+    parser.add_argument("--digits", type=int, nargs="+", default=[10**4, 10**5, 3*10**5])
+    parser.add_argument("--check", action="store_true", help="convert Pi to base 16")
+    args = parser.parse_args(argv)
+    # Convert the reference of Pi to base 16.
+    if args.check:
+        # Import the reference only if needed.
+        from archimedes.netz import reference_digits
+        string = decimal_to_string(D(reference_digits()), len(PI_HEX) - 2, 16)
+        print("Pi in base 16:", string)
+        print("Agrees with the known places:", string == PI_HEX)
+        print()
+    # Print the header of the table.
+    print("{0:>9s} | {1:>9s} | {2:>12s} | {3:>9s} | {4:>12s}".format(
+        "Digits", "str [s]", "int_to_str", "int [s]", "str_to_int"))
+    print("{0}".format(63*"-"))
+    for count, t_str, t_dc, t_int, t_ci in benchmark(args.digits):
+        print("{0:>9d} | {1:>9.4f} | {2:>12.4f} | {3:>9.4f} | {4:>12.4f}".format(
+            count, t_str, t_dc, t_int, t_ci))
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
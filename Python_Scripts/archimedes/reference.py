@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Reference values of Pi for checking calculation results.
+
+Description:
+The scripts compare their results with a heredoc of known places of
+Pi. For more than a few thousand places such a heredoc is unhandy, so
+the reference is calculated here with the Chudnovsky series using
+binary splitting and integer arithmetic only.
+
+The reference is only used to count the correct places of a result.
+It is not an Archimedes algorithm and it is of course based on the
+knowledge of Pi.
+
+See also:
+en.wikipedia.org/wiki/Chudnovsky_algorithm
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import math
+import os
+from functools import lru_cache
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import localcontext
+
+# Number of guard digits of the reference calculation.
+GUARD = 10
+
+# ----------------------------------------------------------------------
+# Function _binary_split()
+# ----------------------------------------------------------------------
+def _binary_split(a, b):
+    '''Binary splitting of the Chudnovsky series in the range [a, b).'''
+    # Calculate a single term.
+    if b == a + 1:
+        if a == 0:
+            Pab = Qab = 1
+        else:
+            Pab = (6*a - 5)*(2*a - 1)*(6*a - 1)
+            Qab = a*a*a*10939058860032000
+        Tab = Pab*(13591409 + 545140134*a)
+        if a & 1:
+            Tab = -Tab
+        return Pab, Qab, Tab
+    # Split the range and combine both halves.
+    m = (a + b)//2
+    Pam, Qam, Tam = _binary_split(a, m)
+    Pmb, Qmb, Tmb = _binary_split(m, b)
+    return Pam*Pmb, Qam*Qmb, Qmb*Tam + Pam*Tmb
+
+# ----------------------------------------------------------------------
+# Function pi_digits()
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def pi_digits(places):
+    '''Return Pi as string '3.14...' with the given number of places.'''
+    # Each term of the series adds about 14.18 places.
+    terms = int(places/14.181647462725477) + 2
+    # Sum up the series.
+    _, Q, T = _binary_split(0, terms)
+    # Calculate Pi scaled by 10**(places + GUARD).
+    unity = 10**(places + GUARD)
+    sqrtc = math.isqrt(10005*unity*unity)
+    pi = (Q*426880*sqrtc)//T
+    # Convert the integer without the limits of int to str conversion.
+    with localcontext() as ctx:
+        ctx.prec = places + GUARD + 2
+        digits = str(D(pi))
+    # Return the places without the guard digits.
+    return digits[0] + "." + digits[1:places+1]
+
+# ----------------------------------------------------------------------
+# Function correct_digits()
+# ----------------------------------------------------------------------
+def correct_digits(chkpi, refpi=None):
+    '''Calculate the correct digits of a given Pi number.
+
+    Returns the matching leading string and the number of correct
+    places after the decimal point.
+    '''
+    # Initialise the local variables.
+    chkpi = str(chkpi)
+    if refpi is None:
+        refpi = pi_digits(max(len(chkpi) - 2, 1))
+    # Extract the common prefix of both strings.
+    correct = os.path.commonprefix([chkpi, str(refpi)])
+    # Return the correct digits and the number of correct places.
+    return (correct, max(len(correct) - 2, 0))
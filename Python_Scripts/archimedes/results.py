@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Persistent cache of the results of archimedes_netz_lto.
+
+Description:
+A run of archimedes_netz_lto with the same parameters calculates the
+same result again. Here the results are stored in a directory, one file
+per result. The file name is the key of the result
+
+    method-rounding-radius-places-precision-iteration-used-verified.pi
+
+where used is the last iteration of the calculation and verified is
+the number of places known to be correct, e.g. by
+PiComputation.estimated_digits(). get() returns
+
+    1. the result with the same key or
+    2. the prefix of a result of the same method, rounding and radius
+       with at least MARGIN more verified places than requested.
+
+The estimated places do not count the rounding errors and the last
+places of a result can be spoiled by a carry, so a prefix keeps a margin
+to the verified places.
+
+Both are found from the file names only, the files are not read for the
+search. The cache is bounded by a number of bytes. The least recently
+used results are removed first, a hit updates the modification time of
+its file.
+
+Several processes can use the same directory. A result is written to a
+temporary file and renamed, so a reader finds either the complete file
+or none. Writing and removing files is serialised by an exclusive lock
+of the file .lock in the directory (fcntl, if available). A file removed
+by another process while reading is treated as a miss.
+
+Usage:
+    cache = ResultCache("archimedes_results")
+    hit = cache.get(result_key(0, 1000, 1004, 552))
+    cache.put(result_key(0, 1000, 1004, 552), acstr, 552, 996)
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-arguments
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import os
+from contextlib import contextmanager
+
+# Import the module for locking files if available (POSIX).
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Define the extension of the result files.
+EXTENSION = ".pi"
+
+# Define the default size of the cache in bytes.
+MAX_BYTES = 64*1024*1024
+
+# Define the verified places a prefix keeps in reserve.
+MARGIN = 2
+
+# ----------------------------------------------------------------------
+# Function result_key()
+# ----------------------------------------------------------------------
+def result_key(method, places, precision, iteration, rounding="ROUND_HALF_DOWN", r=1):
+    '''Return the key of a result as tuple of strings.'''
+    return tuple(str(x) for x in (method, rounding, r, places, precision, iteration))
+
+# ----------------------------------------------------------------------
+# Function file_name()
+# ----------------------------------------------------------------------
+def file_name(key, used, verified):
+    '''Return the file name of a result.'''
+    return "-".join(key + (str(used), str(verified))) + EXTENSION
+
+# ----------------------------------------------------------------------
+# Function parse_name()
+# ----------------------------------------------------------------------
+def parse_name(name):
+    '''Return the key, the used iteration and the verified places of a
+    file name or None.'''
+    if not name.endswith(EXTENSION):
+        return None
+    fields = name[:-len(EXTENSION)].split("-")
+    if len(fields) != 8:
+        return None
+    try:
+        return tuple(fields[:6]), int(fields[6]), int(fields[7])
+    except ValueError:
+        return None
+
+# ----------------------------------------------------------------------
+# Class ResultCache
+# ----------------------------------------------------------------------
+class ResultCache:
+    '''Size-bounded LRU cache of results in a directory.'''
+
+    def __init__(self, directory, max_bytes=MAX_BYTES):
+        # Store the directory and the size and create the directory.
+        self.directory = str(directory)
+        self.max_bytes = int(max_bytes)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @contextmanager
+    def lock(self):
+        '''Hold the exclusive lock of the directory.'''
+        with open(os.path.join(self.directory, ".lock"), "a", encoding="utf-8") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def entries(self):
+        '''Return the list of (name, key, used, verified) of all results.'''
+        entries = []
+        for name in os.listdir(self.directory):
+            parsed = parse_name(name)
+            if parsed is not None:
+                entries.append((name,) + parsed)
+        return entries
+
+    def find(self, key):
+        '''Return the file name and the number of places to use for the
+        key or None. The same key is preferred to a prefix.'''
+        places = int(key[3])
+        prefix = None
+        for name, other, _, verified in self.entries():
+            if other == key:
+                return name, None
+            # Use the shortest result with enough verified places.
+            if other[:3] == key[:3] and verified - MARGIN >= places:
+                if prefix is None or int(other[3]) < int(prefix[1]):
+                    prefix = (name, other[3])
+        return None if prefix is None else (prefix[0], places)
+
+    def get(self, key):
+        '''Return a dictionary with the result, its iteration, verified
+        places and True if the key was found or None.'''
+        found = self.find(key)
+        if found is None:
+            return None
+        name, places = found
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                result = fh.read()
+            # Mark the result as recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        _, used, verified = parse_name(name)
+        if places is not None:
+            result, verified = result[:places+2], places
+        return {"result": result, "iteration": used, "verified": verified,
+                "exact": places is None}
+
+    def put(self, key, result, used, verified):
+        '''Store a result with its last iteration and remove the least
+        recently used results if the cache is too large.'''
+        with self.lock():
+            # Replace older results of the same key.
+            for name, other, _, _ in self.entries():
+                if other == key:
+                    os.remove(os.path.join(self.directory, name))
+            # Import tempfile only for writing, it is slow to import.
+            import tempfile  # pylint: disable=import-outside-toplevel
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(result)
+            os.replace(tmp, os.path.join(self.directory, file_name(key, used, verified)))
+            self.evict()
+
+    def evict(self):
+        '''Remove the least recently used results until the cache fits
+        into max_bytes. The caller holds the lock.'''
+        files = []
+        for name, _, _, _ in self.entries():
+            stat = os.stat(os.path.join(self.directory, name))
+            files.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
@@ -0,0 +1,185 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Empirical complexity of the method of Netz: time versus places.
+
+Description:
+The script archimedes_netz_lto predicts precision and iterations
+linearly in the number of places (init_values()). The time per
+iteration grows with the precision as well, so the total time grows
+faster than linear. Here the calculation of archimedes_netz_lto (FAST,
+PiComputation.run()) runs for a geometric ladder of places and the time
+of each phase is measured by the phase hooks of the run:
+
+    iteration     perimeter recurrence of Pfaff (division and sqrt)
+    refinement    weighted arithmetic mean of Netz (cubic root)
+    formatting    conversion of the result to a string
+    verification  comparison with the reference value
+
+For every phase a power law t = c*places^k is fitted by least squares of
+log(t) over log(places) and extrapolated to large places. Only the
+upper rungs of the ladder are used for the fit, since the standard
+Python module decimal switches to faster multiplication algorithms for
+large numbers and the small rungs are dominated by overhead. The
+extrapolation is a rough estimate and no promise.
+
+The reference value is calculated beforehand and is not timed.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.scaling [start] [stop] [factor]
+    python3 -m archimedes.scaling 1000 64000 2
+    python3 -m archimedes.scaling 1000 8000 1.5
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import math
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+# Import the modules of the package.
+from archimedes.netz import PiComputation
+from archimedes.reference import pi_digits, correct_digits
+
+# Define the phases of a calculation.
+PHASES = ("iteration", "refinement", "formatting", "verification")
+
+# Define the default ladder and the places of the extrapolation.
+LADDER = (250, 4000, 2)
+TARGETS = (10**5, 10**6, 10**7)
+
+# Define the number of upper rungs used for the fit.
+FIT = 3
+
+# ----------------------------------------------------------------------
+# Function ladder()
+# ----------------------------------------------------------------------
+def ladder(start, stop, factor=2):
+    '''Return the geometric ladder of places from start to stop.'''
+    rungs = []
+    places = start
+    while places <= stop:
+        rungs.append(int(places))
+        places *= factor
+    return rungs
+
+# ----------------------------------------------------------------------
+# Class PhaseTimer
+# ----------------------------------------------------------------------
+class PhaseTimer:
+    '''Wall-clock time of the phases of PiComputation.run().'''
+
+    def __init__(self):
+        # Initialise the times of the phases.
+        self.times = dict.fromkeys(PHASES, 0.0)
+
+    @contextmanager
+    def phase(self, name):
+        '''Add the time of the enclosed block to the phase.'''
+        start = perf_counter()
+        try:
+            yield self
+        finally:
+            self.times[name] = self.times.get(name, 0.0) + perf_counter() - start
+
+# ----------------------------------------------------------------------
+# Function run_phases()
+# ----------------------------------------------------------------------
+def run_phases(places, method=0):
+    '''Calculate Pi as archimedes_netz_lto does and return the time of
+    each phase and the number of correct places.'''
+    # Predict precision and iteration with init_values().
+    computation = PiComputation(places, method=method)
+    refpi = pi_digits(places)
+    timer = PhaseTimer()
+    # Run the calculation with the phase hooks of the timer.
+    string, _ = computation.run(memory=timer)
+    # Count the correct places.
+    with timer.phase("verification"):
+        _, correct = correct_digits(string[:places+2], refpi)
+    # Return the result.
+    return {"places": places, "precision": computation.precision,
+            "iteration": computation.iteration, "correct": correct, "times": timer.times}
+
+# ----------------------------------------------------------------------
+# Function fit_power_law()
+# ----------------------------------------------------------------------
+def fit_power_law(places, times):
+    '''Fit t = c*places^k by least squares in log-log and return (c, k).'''
+    # Use only positive times.
+    points = [(math.log(p), math.log(t)) for p, t in zip(places, times) if t > 0]
+    if len(points) < 2:
+        return 0.0, 0.0
+    # Calculate the slope and the intercept.
+    n = len(points)
+    mx = sum(x for x, _ in points)/n
+    my = sum(y for _, y in points)/n
+    sxx = sum((x - mx)**2 for x, _ in points)
+    sxy = sum((x - mx)*(y - my) for x, y in points)
+    k = sxy/sxx if sxx > 0 else 0.0
+    # Return the coefficient and the exponent.
+    return math.exp(my - k*mx), k
+
+# ----------------------------------------------------------------------
+# Function scaling_study()
+# ----------------------------------------------------------------------
+def scaling_study(rungs, fit=FIT, verbose=True, method=0):
+    '''Run the ladder and fit a power law per phase.'''
+    results = []
+    for places in rungs:
+        res = run_phases(places, method)
+        results.append(res)
+        if verbose:
+            print("{0:>8d} | {1:>9d} | {2:>7d} | ".format(places, res["iteration"], res["correct"])
+                  + " | ".join("{0:>12.4f}".format(res["times"][p]) for p in PHASES)
+                  + " | {0:>10.4f}".format(sum(res["times"].values())))
+    # Fit the power law per phase and for the total.
+    upper = results[-fit:]
+    xs = [res["places"] for res in upper]
+    models = {p: fit_power_law(xs, [res["times"][p] for res in upper]) for p in PHASES}
+    models["total"] = fit_power_law(xs, [sum(res["times"].values()) for res in upper])
+    # Return the measurements and the models.
+    return results, models
+
+# ----------------------------------------------------------------------
+# Function _format_seconds()
+# ----------------------------------------------------------------------
+def _format_seconds(seconds):
+    '''Return a time as human readable string.'''
+    for unit, size in (("a", 31557600), ("d", 86400), ("h", 3600), ("min", 60)):
+        if seconds >= size:
+            return "{0:.1f} {1}".format(seconds/size, unit)
+    return "{0:.2f} s".format(seconds)
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(start, stop, factor):
+    '''Main script function.'''
+    # Print the header of the measurements.
+    print("{0:>8s} | {1:>9s} | {2:>7s} | ".format("Places", "Iteration", "Correct")
+          + " | ".join("{0:>12s}".format(p) for p in PHASES)
+          + " | {0:>10s}".format("total [s]"))
+    print("{0}".format(111*"-"))
+    # Run the ladder.
+    _, models = scaling_study(ladder(start, stop, factor))
+    # Print the exponents and the extrapolation.
+    print("\n{0:<13s} | {1:>8s} | ".format("Phase", "Exponent")
+          + " | ".join("{0:>10d}".format(n) for n in TARGETS))
+    print("{0}".format((26 + 13*len(TARGETS))*"-"))
+    for phase, (c, k) in models.items():
+        print("{0:<13s} | {1:>8.2f} | ".format(phase, k)
+              + " | ".join("{0:>10s}".format(_format_seconds(c*n**k)) for n in TARGETS))
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function. The factor may be a float.
+    ARGS = [float(arg) for arg in sys.argv[1:4]]
+    main(*(ARGS + list(LADDER)[len(ARGS):]))
@@ -0,0 +1,401 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''The recurrences of the scripts as generator functions.
+
+Description:
+The functions of the scripts return the approximation of Pi after a
+given number of iterations. A table with n rows calls such a function n
+times from scratch, which costs O(n²) iterations. The generators below
+run a recurrence once and yield per iteration the tuple
+
+    (i, n, lower, upper, estimate)
+
+with the iteration i, the number of edges n, the lower and the upper
+bound of Pi and the estimate of Pi. Where the original script only
+calculates one bound, the other one follows from the same edges. The
+estimate is the arithmetic mean of both bounds or the refinement named
+by the generator.
+
+The generators work with every number type which supports the basic
+arithmetic operations, e.g. float, Decimal and the double-double and
+quad-double numbers. The start values have to be of that type.
+
+Usage:
+    from itertools import islice
+    from decimal import Decimal as D
+    from archimedes.sequences import sequence
+    for i, n, lower, upper, estimate in islice(sequence("pfaff", D), 10):
+        print(i, n, estimate)
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-locals
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some names from standard Python modules.
+from collections import deque
+from itertools import islice
+
+# Import the square root and the cubic root for all number types.
+from archimedes.numeric import sqrt, cbrt
+
+# ----------------------------------------------------------------------
+# Generator function inner_polygon()
+# ----------------------------------------------------------------------
+def inner_polygon(AB, AC, BC):
+    '''Inner polygon of Archimedes (archimedes_algorithm_inner_polygon).
+
+    AB = Diameter, AC = Long leg, BC = Edge of the inner polygon
+    '''
+    # Use the start values in the zeroth loop.
+    i, n = 0, 6
+    lower = (BC*n)/AB
+    upper = (BC/AC)*n
+    yield i, n, lower, upper, (lower + upper)/2
+    # Run an infinite loop.
+    while True:
+        # Calculate the number of edges.
+        i += 1
+        n = 6*2**i
+        # Calculate the length of the hypotenuse and the length of the edge.
+        AD = AB/sqrt((BC**2/(AB + AC)**2) + 1)
+        BD = sqrt(AB**2 - AD**2)
+        # Store the values for the next iteration.
+        BC = BD
+        AC = AD
+        # Calculate the bounds of Pi.
+        lower = (BD*n)/AB
+        upper = (BD/AD)*n
+        yield i, n, lower, upper, (lower + upper)/2
+
+# ----------------------------------------------------------------------
+# Generator function outer_polygon()
+# ----------------------------------------------------------------------
+def outer_polygon(OA, OC, AC):
+    '''Outer polygon of Archimedes (archimedes_algorithm_outer_polygon).
+
+    This is also the recurrence of inner_from_outer_method0 which uses
+    the lower bound.
+
+    OA = Incircle radius, OC = Circumcircle radius, AC = Half of edge
+    '''
+    # Store incircle radius for later use.
+    r = OA
+    # Use the start values in the zeroth loop. AC/OC is the half edge of
+    # the inner polygon of the unit circle.
+    i, n = 0, 6
+    lower = (AC/OC)*n
+    upper = (AC/r)*n
+    yield i, n, lower, upper, (lower + upper)/2
+    # Run an infinite loop.
+    while True:
+        # Calculate the number of edges.
+        i += 1
+        n = 6*2**i
+        # Calculate the length of the hypotenuse and the length of the edge.
+        AD = (AC*OA)/(OA + OC)
+        OD = sqrt(OA**2 + AD**2)
+        # Store the values for the next iteration.
+        AC = AD
+        OC = OD
+        # Calculate the bounds of Pi.
+        lower = (AD/OD)*n
+        upper = (AD/r)*n
+        yield i, n, lower, upper, (lower + upper)/2
+
+# Method 0 uses the recurrence of the outer polygon.
+inner_from_outer_method0 = outer_polygon
+
+# ----------------------------------------------------------------------
+# Generator function inner_from_outer_method1()
+# ----------------------------------------------------------------------
+def inner_from_outer_method1(OB, OE, BE):
+    '''First modified Archimedes algorithm (inner_from_outer_method1).
+
+    OB = Incircle radius, OE = Circumcircle radius, BE = Half of edge
+    '''
+    # Use the start values in the zeroth loop. The polygons belong to the
+    # circle with the fixed radius OB, so BE/OE and BE/OB are the half
+    # edges of the polygons of the unit circle.
+    i, n = 0, 6
+    lower = (BE/OE)*n
+    upper = (BE/OB)*n
+    yield i, n, lower, upper, (lower + upper)/2
+    # Run an infinite loop.
+    while True:
+        # Calculate the number of edges.
+        i += 1
+        n = 6*2**i
+        # Calculate the length of the hypotenuse and the length of the edge.
+        BF = (BE*OB)/(OB + OE)
+        OF = sqrt(OB**2 + BF**2)
+        # Store the values for the next iteration.
+        BE = BF
+        OE = OF
+        # Calculate the bounds of Pi.
+        lower = (BF/OF)*n
+        upper = (BF/OB)*n
+        yield i, n, lower, upper, (lower + upper)/2
+
+# ----------------------------------------------------------------------
+# Generator function inner_from_outer_method2()
+# ----------------------------------------------------------------------
+def inner_from_outer_method2(OB, OE, BE):
+    '''Second modified Archimedes algorithm (inner_from_outer_method2).
+
+    OB = Incircle radius, OE = Circumcircle radius, BE = Half of edge
+    '''
+    # Initialise the value of OA for the first iteration step.
+    OA = OE
+    # Use the start values in the zeroth loop.
+    i, n = 0, 6
+    lower = BE*n/OA
+    upper = BE/OB*n
+    yield i, n, lower, upper, (lower + upper)/2
+    # Run an infinite loop.
+    while True:
+        # Calculate the number of edges.
+        i += 1
+        n = 6*2**i
+        # Calculate the length of the hypotenuse and the length of the edge.
+        BF = (BE*OB)/(OB + OE)
+        OF = sqrt(OB**2 + BF**2)
+        # Store the values for the next iteration.
+        OB = OB + ((OA - OF)*sqrt(1 - (BF**2/OF**2)))
+        OE = OA
+        BE = BF + BF*((OA - OF)/OF)
+        # Calculate the bounds of Pi.
+        lower = BE*n/OA
+        upper = BE/OB*n
+        yield i, n, lower, upper, (lower + upper)/2
+
+# ----------------------------------------------------------------------
+# Generator function inner_from_outer_method3()
+# ----------------------------------------------------------------------
+def inner_from_outer_method3(OB, OE, BE):
+    '''Third modified Archimedes algorithm (inner_from_outer_method3).
+
+    OB = Incircle radius, OE = Circumcircle radius, BE = Half of edge
+    '''
+    # Initialise the value of OA for the first iteration step.
+    OA = OE
+    # Use the start values in the zeroth loop.
+    i, n = 0, 6
+    lower = (BE/OA)*n
+    upper = (BE/OB)*n
+    yield i, n, lower, upper, (lower + upper)/2
+    # Run an infinite loop.
+    while True:
+        # Calculate the number of edges.
+        i += 1
+        n = 6*2**i
+        # Calculate the length of the hypotenuse and the length of the edge.
+        BF = (BE*OB)/(OB + OE)
+        OF = sqrt(OB**2 + BF**2)
+        # Store the values for the next iteration.
+        OB = OB + ((OA - OF)*sqrt(1 - (BF**2/OF**2)))
+        BE = BF*OA/OF
+        # Calculate the bounds of Pi.
+        lower = (BE/OA)*n
+        upper = (BE/OB)*n
+        yield i, n, lower, upper, (lower + upper)/2
+
+# ----------------------------------------------------------------------
+# Generator function edges()
+# ----------------------------------------------------------------------
+def edges(Sn, sn, r=1):
+    '''Recurrence of the edges (archimedes_edges_dec).
+
+    Sn = Outer edge, sn = Inner edge of the circle with the radius r
+    '''
+    # Use the start values in the zeroth loop.
+    i, n = 0, 6
+    yield i, n, sn*n/(2*r), Sn*n/(2*r), (Sn + sn)*n/(4*r)
+    # Run an infinite loop.
+    while True:
+        # Calculate the number of edges.
+        i += 1
+        n = 6*2**i
+        # Calculate the inner and the outer edge.
+        sn = sqrt(2*r**2 - r*sqrt(4*r**2 - sn**2))
+        Sn = sn/sqrt(1 - (sn/(2*r))**2)
+        yield i, n, sn*n/(2*r), Sn*n/(2*r), (Sn + sn)*n/(4*r)
+
+# ----------------------------------------------------------------------
+# Generator function pfaff()
+# ----------------------------------------------------------------------
+def pfaff(a0, b0, r=1, n0=6):
+    '''Perimeter recurrence in the formulation of Pfaff.
+
+    a0 = Half of outer perimeter, b0 = Half of inner perimeter
+    '''
+    # Use the start values in the zeroth loop.
+    i, a1, b1 = 0, a0, b0
+    # Run an infinite loop.
+    while True:
+        # Yield the bounds and the arithmetic mean.
+        yield i, n0*2**i, b1/r, a1/r, (a1 + b1)/(2*r)
+        # Calculate the half of inner and outer perimeter.
+        i += 1
+        a1 = (2*a0*b0)/(a0 + b0)
+        b1 = sqrt(b0*a1)
+        # Store the old values for the next loop.
+        a0, b0 = a1, b1
+
+# ----------------------------------------------------------------------
+# Generator function gregory()
+# ----------------------------------------------------------------------
+def gregory(a0, b0, r=1, n0=3):
+    '''Area recurrence of Gregory (gregory).
+
+    a0 = Outer area, b0 = Inner area
+    '''
+    # Use the start values in the zeroth loop.
+    i, a1, b1 = 0, a0, b0
+    # Run an infinite loop.
+    while True:
+        # Yield the bounds and the arithmetic mean.
+        yield i, n0*2**i, b1/r**2, a1/r**2, (a1 + b1)/(2*r**2)
+        # Calculate the inner and outer area.
+        i += 1
+        b1 = sqrt(a0*b0)
+        a1 = (2*a0*b1)/(a0 + b1)
+        # Store the old values for the next loop.
+        a0, b0 = a1, b1
+
+# ----------------------------------------------------------------------
+# Generator function snellius()
+# ----------------------------------------------------------------------
+def snellius(a0, b0, r=1):
+    '''Pfaff recurrence with the acceleration of Snellius.'''
+    # Refine the perimeter sequence.
+    for i, n, b1, a1, _ in pfaff(a0, b0, r):
+        yield i, n, b1, a1, (a1 + 2*b1)/3
+
+# ----------------------------------------------------------------------
+# Generator function doerrie()
+# ----------------------------------------------------------------------
+def doerrie(a0, b0, r=1, weight=1):
+    '''Pfaff recurrence with the refinement of Dörrie.
+
+    The estimate is the weighted arithmetic mean of the refined bounds
+    with the weight of the lower bound. Weight 1 is the arithmetic mean
+    of Dörrie, 2 the combination with Snellius and 4 the one of Netz.
+    '''
+    # Refine the perimeter sequence.
+    for i, n, b1, a1, _ in pfaff(a0, b0, r):
+        # Calculate the refinement of inner and outer bound.
+        b3 = (3*a1*b1)/(2*a1 + b1)
+        a3 = cbrt(a1*b1**2)
+        yield i, n, b3, a3, (a3 + weight*b3)/(weight + 1)
+
+# ----------------------------------------------------------------------
+# Generator function doerrie_snellius()
+# ----------------------------------------------------------------------
+def doerrie_snellius(a0, b0, r=1):
+    '''Refinement of Dörrie combined with Snellius.'''
+    return doerrie(a0, b0, r, weight=2)
+
+# ----------------------------------------------------------------------
+# Generator function netz()
+# ----------------------------------------------------------------------
+def netz(a0, b0, r=1):
+    '''Refinement of Dörrie with the weighted arithmetic mean of Netz.'''
+    return doerrie(a0, b0, r, weight=4)
+
+# ----------------------------------------------------------------------
+# Generator function aitken()
+# ----------------------------------------------------------------------
+def aitken(a0, b0, r=1):
+    '''Pfaff recurrence with Aitken's delta-squared process.'''
+    # Define Aitken's function.
+    AX = lambda x: (x[0]*x[2] - x[1]**2)/(x[0] + x[2] - 2*x[1])
+    # Define the lists for saving the lower and the upper bounds.
+    lower = deque(maxlen=3)
+    upper = deque(maxlen=3)
+    # Refine the perimeter sequence.
+    for i, n, b1, a1, _ in pfaff(a0, b0, r):
+        lower.append(b1)
+        upper.append(a1)
+        # Aitken can be used up from 3 list elements.
+        a2, b2 = a1, b1
+        if i >= 2:
+            try:
+                a2, b2 = AX(upper), AX(lower)
+            except ArithmeticError:
+                # On error ignore Aitken's AX values.
+                a2, b2 = a1, b1
+        yield i, n, b2, a2, (a2 + b2)/2
+
+# ----------------------------------------------------------------------
+# Start values
+# ----------------------------------------------------------------------
+def _inner_start(num, r):
+    '''Hexagon for the inner polygon: AB, AC, BC.'''
+    return num(2)*r, sqrt(num(3))*r, num(1)*r
+
+def _outer_start(num, r):
+    '''Hexagon for the outer polygon: OA, OC, AC.'''
+    OA = num(1)*r
+    return OA, OA*2*sqrt(num(3))/3, OA/sqrt(num(3))
+
+def _method_start(num, r):
+    '''Hexagon for the modified methods: OB, OE, BE.'''
+    OE = num(1)*r
+    return OE*sqrt(num(3))/2, OE, OE/2
+
+def _edges_start(num, r):
+    '''Hexagon for the edges: Sn, sn, r.'''
+    return 2*sqrt(num(3))*num(r)/3, num(r), r
+
+def _perimeter_start(num, r):
+    '''Hexagon for the perimeters: a0, b0, r.'''
+    return num(r)*2*sqrt(num(3)), num(r)*3, r
+
+def _area_start(num, r):
+    '''Triangle for the areas: a0, b0, r.'''
+    return 3*sqrt(num(3))*num(r)**2, 3*sqrt(num(3))*num(r)**2/4, r
+
+# Define the dictionary with the generators and their start values.
+SEQUENCES = {"inner_polygon": (inner_polygon, _inner_start),
+             "outer_polygon": (outer_polygon, _outer_start),
+             "inner_from_outer_method0": (inner_from_outer_method0, _outer_start),
+             "inner_from_outer_method1": (inner_from_outer_method1, _method_start),
+             "inner_from_outer_method2": (inner_from_outer_method2, _method_start),
+             "inner_from_outer_method3": (inner_from_outer_method3, _method_start),
+             "edges": (edges, _edges_start),
+             "pfaff": (pfaff, _perimeter_start),
+             "gregory": (gregory, _area_start),
+             "snellius": (snellius, _perimeter_start),
+             "doerrie": (doerrie, _perimeter_start),
+             "doerrie_snellius": (doerrie_snellius, _perimeter_start),
+             "netz": (netz, _perimeter_start),
+             "aitken": (aitken, _perimeter_start)}
+
+# ----------------------------------------------------------------------
+# Function sequence()
+# ----------------------------------------------------------------------
+def sequence(name, num=float, r=1):
+    '''Create the generator of a recurrence with its default start
+    values of the number type num.'''
+    # Look up the generator and the start values.
+    generator, start = SEQUENCES[name]
+    # Return the instantiated generator.
+    return generator(*start(num, r))
+
+# ----------------------------------------------------------------------
+# Function table()
+# ----------------------------------------------------------------------
+def table(generator, iteration):
+    '''Return the rows 0 to iteration of a generator as list.'''
+    return list(islice(generator, iteration+1))
+
+# ----------------------------------------------------------------------
+# Function last()
+# ----------------------------------------------------------------------
+def last(generator, iteration):
+    '''Return only the row of the given iteration of a generator.'''
+    return deque(islice(generator, iteration+1), maxlen=1)[0]
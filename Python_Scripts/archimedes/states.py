@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Persistent cache of the perimeters to skip the early iterations.
+
+Description:
+Every run of archimedes_netz_lto starts the perimeter recurrence of
+Pfaff from the hexagon, although the early iterations are the same for
+every number of places. Only the precision differs. A state (a_k, b_k)
+calculated with the precision Q can be rounded to every precision
+P <= Q and continued from there. Its error is at most half a unit of
+the last place plus the rounding errors of Q, so it is as good as the
+state calculated with the precision P.
+
+The cache stores every STRIDE-th state and the last state of a run
+with the highest precision ever calculated for the iteration:
+
+    iteration   k of the state (a_k, b_k)
+    precision   precision Q of the calculation of the state
+    a, b        half of the outer and inner perimeter as strings
+
+A new run with precision P and iteration n starts from the deepest
+state with k <= n and Q >= P. So a repeated run skips all iterations
+and a run with a little less precision most of them. The states of a
+radius are kept separately, the states of other radii are not used.
+
+File format:
+JSON with the version and per radius a dictionary of the iterations.
+The file is written to a temporary file first and then replaced, so a
+broken run does not destroy the cache.
+
+Usage:
+    cache = StateCache("archimedes_netz_lto.states")
+    acstr, i = PiComputation(1000).run(cache=cache)
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import json
+import os
+
+# Define the version of the file format.
+VERSION = 1
+
+# Define the distance of the cached iterations.
+STRIDE = 64
+
+# ----------------------------------------------------------------------
+# Class StateCache
+# ----------------------------------------------------------------------
+class StateCache:
+    '''Cache of the perimeters (a_k, b_k) with their precision.'''
+
+    def __init__(self, path, stride=STRIDE):
+        # Store the path and the stride and read the file.
+        self.path = str(path)
+        self.stride = max(int(stride), 1)
+        self.states = {}
+        self.changed = False
+        self.load()
+
+    def load(self):
+        '''Read the states of the file if it exists and is valid.'''
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == VERSION:
+            self.states = data.get("states", {})
+
+    def lookup(self, precision, iteration, r=1):
+        '''Return the deepest usable state (k, Q, a, b) for the precision
+        and the iteration or None.'''
+        best = None
+        for key, state in self.states.get(str(r), {}).items():
+            k = int(key)
+            if k <= iteration and state["precision"] >= precision:
+                if best is None or k > best[0]:
+                    best = (k, state["precision"], state["a"], state["b"])
+        return best
+
+    def wants(self, i):
+        '''Return True if the iteration i is cached.'''
+        return i % self.stride == 0
+
+    def add(self, i, a1, b1, precision, r=1):
+        '''Keep the state of iteration i if its precision is higher than
+        the one of the cached state.'''
+        states = self.states.setdefault(str(r), {})
+        state = states.get(str(i))
+        if state is None or state["precision"] < precision:
+            states[str(i)] = {"precision": int(precision), "a": str(a1), "b": str(b1)}
+            self.changed = True
+
+    def save(self):
+        '''Write the states if they have changed.'''
+        if not self.changed:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": VERSION, "states": self.states}, fh)
+        os.replace(tmp, self.path)
+        self.changed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.save()
+        return False
@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Memoized sequences of the recurrences for notebooks.
+
+Description:
+In a notebook the same recurrence is evaluated again and again with the
+same precision, but with different iterations or different means. Every
+cell starts the recurrence from the hexagon. Here the rows of the
+generators of archimedes.sequences
+
+    (i, n, lower, upper, estimate)
+
+are kept per (recurrence, precision, rounding, radius). A request for
+more iterations continues the stored generator in its own decimal
+context, a request for fewer iterations costs nothing. So a notebook
+only pays for the iterations not calculated before.
+
+The store is bounded by a number of bytes. The size of a sequence is
+the size of its numbers (sys.getsizeof). If the store is too large,
+the least recently used sequences are removed. The sequence which is
+just used is never removed, even if it alone is larger than the bound.
+
+A precision of None uses floats, otherwise Decimal numbers with the
+precision and the rounding. The decimal context of the caller is not
+changed.
+
+Usage:
+    from archimedes.store import SequenceStore
+    store = SequenceStore()
+    rows = store.rows("pfaff", 500, precision=1010)
+    a1, b1 = store.perimeters(400, precision=1010)[-1]
+    print(store.info())
+'''
+# pylint: disable=invalid-name
+# pylint: disable=too-many-arguments
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import sys
+from collections import OrderedDict
+from contextlib import nullcontext
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import Context, localcontext, ROUND_HALF_DOWN
+
+# Import the modules of the package.
+from archimedes.sequences import sequence
+
+# Define the default size of the store in bytes.
+MAX_BYTES = 256*1024*1024
+
+# ----------------------------------------------------------------------
+# Function row_size()
+# ----------------------------------------------------------------------
+def row_size(row):
+    '''Return the size of the numbers of a row in bytes.'''
+    return sum(sys.getsizeof(x) for x in row)
+
+# ----------------------------------------------------------------------
+# Class StoredSequence
+# ----------------------------------------------------------------------
+class StoredSequence:
+    '''The calculated rows of a recurrence and its generator.'''
+
+    def __init__(self, name, precision=None, rounding=ROUND_HALF_DOWN, r=1):
+        # Create the context and the generator of the recurrence.
+        self.context = None if precision is None else Context(prec=precision, rounding=rounding)
+        with self.local():
+            self.generator = sequence(name, float if precision is None else D, r)
+        self.rows = []
+        self.size = 0
+
+    def local(self):
+        '''Return the decimal context of the sequence as context manager.'''
+        return nullcontext() if self.context is None else localcontext(self.context)
+
+    def extend(self, iteration):
+        '''Calculate the rows up to the iteration and return the number
+        of new rows.'''
+        count = 0
+        with self.local():
+            while len(self.rows) <= iteration:
+                row = next(self.generator)
+                self.rows.append(row)
+                self.size += row_size(row)
+                count += 1
+        return count
+
+# ----------------------------------------------------------------------
+# Class SequenceStore
+# ----------------------------------------------------------------------
+class SequenceStore:
+    '''Size-bounded LRU store of memoized sequences.'''
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        # Store the bound and initialise the sequences and counters.
+        self.max_bytes = int(max_bytes)
+        self.sequences = OrderedDict()
+        self.hits = 0
+        self.computed = 0
+
+    def get(self, name, iteration, precision=None, rounding=ROUND_HALF_DOWN, r=1):
+        '''Return the stored sequence with at least the rows up to the
+        iteration.'''
+        key = (name, precision, rounding, str(r))
+        stored = self.sequences.get(key)
+        if stored is None:
+            stored = self.sequences[key] = StoredSequence(name, precision, rounding, r)
+        # Mark the sequence as recently used.
+        self.sequences.move_to_end(key)
+        # Calculate only the missing rows.
+        new = stored.extend(iteration)
+        self.computed += new
+        self.hits += iteration + 1 - new
+        self.evict()
+        return stored
+
+    def rows(self, name, iteration, precision=None, rounding=ROUND_HALF_DOWN, r=1):
+        '''Return the rows 0 to iteration of a recurrence.'''
+        return self.get(name, iteration, precision, rounding, r).rows[:iteration+1]
+
+    def row(self, name, iteration, precision=None, rounding=ROUND_HALF_DOWN, r=1):
+        '''Return the row of the iteration of a recurrence.'''
+        return self.get(name, iteration, precision, rounding, r).rows[iteration]
+
+    def perimeters(self, iteration, precision=None, rounding=ROUND_HALF_DOWN, r=1):
+        '''Return the half outer and inner perimeters (a_k, b_k) of Pfaff
+        for the iterations 0 to iteration.'''
+        stored = self.get("pfaff", iteration, precision, rounding, r)
+        # Multiply with the precision of the sequence.
+        with stored.local():
+            return [(upper*r, lower*r) for _, _, lower, upper, _ in stored.rows[:iteration+1]]
+
+    def size(self):
+        '''Return the size of all sequences in bytes.'''
+        return sum(stored.size for stored in self.sequences.values())
+
+    def evict(self):
+        '''Remove the least recently used sequences until the store fits
+        into max_bytes. The most recently used sequence is kept.'''
+        total = self.size()
+        while total > self.max_bytes and len(self.sequences) > 1:
+            _, stored = self.sequences.popitem(last=False)
+            total -= stored.size
+
+    def clear(self):
+        '''Remove all sequences.'''
+        self.sequences.clear()
+
+    def info(self):
+        '''Return the rows and bytes of the stored sequences and the
+        numbers of reused and calculated rows.'''
+        return {"sequences": [{"name": key[0], "precision": key[1], "rounding": key[2],
+                               "radius": key[3], "rows": len(stored.rows),
+                               "bytes": stored.size}
+                              for key, stored in self.sequences.items()],
+                "bytes": self.size(), "hits": self.hits, "computed": self.computed}
@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Parallel parameter sweep over means, weights, rounding and places.
+
+Description:
+The "Spin-off" table of archimedes_netz_lto compares the weights 2/3 to
+6/7 of the weighted arithmetic mean, the To-Do list asks for the
+influence of the rounding. Here a grid of
+
+    means     of archimedes.means
+    weights   of the weighted means
+    rounding  modes of the standard Python module decimal
+    places    requested correct places
+
+is calculated on a process pool. One task consists of a rounding mode
+and a number of places. It calculates the perimeter sequence of Pfaff
+once with the precision places + guard and evaluates all means and
+weights on each pair of perimeters with evaluate_all() of
+archimedes.means. For every variant the first iteration with the
+requested correct places is recorded. Variants that do not reach them
+are reported with the most correct places found.
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.sweep
+    python3 -m archimedes.sweep --places 100 1000 --weights 2 3 4 5 6
+    python3 -m archimedes.sweep --rounding ROUND_HALF_DOWN ROUND_DOWN --output sweep.json
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+import decimal
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+# Import names from the standard Python module decimal.
+from decimal import Decimal as D
+from decimal import localcontext
+
+# Import the modules of the package.
+from archimedes.means import MEANS, WEIGHTED, evaluate_all
+from archimedes.reference import pi_digits, correct_digits
+from archimedes.sequences import pfaff
+
+# Define the default grid.
+WEIGHTS = (2, 3, 4, 5, 6)
+ROUNDING = ("ROUND_HALF_DOWN", "ROUND_HALF_EVEN", "ROUND_DOWN", "ROUND_UP")
+PLACES = (100,)
+GUARD = 2
+
+# ----------------------------------------------------------------------
+# Function variants()
+# ----------------------------------------------------------------------
+def variants(means=tuple(MEANS), weights=WEIGHTS):
+    '''Return the list of (mean, weight) pairs of the grid.'''
+    result = []
+    for name in means:
+        if name in WEIGHTED:
+            result.extend((name, w) for w in weights)
+        else:
+            result.append((name, None))
+    return result
+
+# ----------------------------------------------------------------------
+# Function sweep_task()
+# ----------------------------------------------------------------------
+def sweep_task(places, rounding, guard, grid, maxiter=None):
+    '''Calculate the perimeters once and evaluate all variants of the
+    grid. Return one result dictionary per variant.'''
+    # Limit the iterations to the needs of the arithmetic mean.
+    if maxiter is None:
+        maxiter = 2*places + 40
+    precision = places + guard
+    refpi = pi_digits(places)
+    pending = {v: 0 for v in grid}
+    found = {}
+    with localcontext() as ctx:
+        ctx.prec = precision
+        ctx.rounding = getattr(decimal, rounding)
+        # Run the perimeter sequence of Pfaff.
+        for i, _, b1, a1, _ in pfaff(2*D(3).sqrt(), D(3)):
+            # Evaluate all variants which have not reached the places.
+            estimates = evaluate_all(a1, b1, 1, list(pending))
+            for (name, weight), ac in estimates.items():
+                _, correct = correct_digits(str(ac)[:places+2], refpi)
+                if correct >= places:
+                    found[(name, weight)] = (i, correct)
+                    del pending[(name, weight)]
+                else:
+                    pending[(name, weight)] = max(pending[(name, weight)], correct)
+            if not pending or i >= maxiter:
+                break
+    # Collect the results of all variants.
+    results = []
+    for name, weight in grid:
+        iteration, correct = found.get((name, weight), (None, pending.get((name, weight))))
+        results.append({"mean": name, "weight": weight, "rounding": rounding,
+                        "places": places, "precision": precision,
+                        "iteration": iteration, "correct": correct})
+    return results
+
+# ----------------------------------------------------------------------
+# Function run_sweep()
+# ----------------------------------------------------------------------
+def run_sweep(means=tuple(MEANS), weights=WEIGHTS, rounding=ROUNDING, places=PLACES,
+              guard=GUARD, workers=None):
+    '''Run the grid on a process pool and return the sorted results.'''
+    grid = variants(means, weights)
+    tasks = list(product(places, rounding))
+    results = []
+    workers = workers or os.cpu_count() or 1
+    # Run the tasks one after the other or on a process pool.
+    if workers == 1:
+        for p, rnd in tasks:
+            results.extend(sweep_task(p, rnd, guard, grid))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(sweep_task, p, rnd, guard, grid) for p, rnd in tasks]
+            for future in as_completed(futures):
+                results.extend(future.result())
+    # Sort the results in the order of the grid.
+    order = {v: k for k, v in enumerate(grid)}
+    results.sort(key=lambda x: (x["places"], order[(x["mean"], x["weight"])],
+                                rounding.index(x["rounding"])))
+    return results
+
+# ----------------------------------------------------------------------
+# Function print_table()
+# ----------------------------------------------------------------------
+def print_table(results):
+    '''Print the results of a sweep as table.'''
+    print("{0:<23s} | {1:>6s} | {2:<16s} | {3:>6s} | {4:>9s} | {5:>9s} | {6:>7s}".format(
+        "Mean", "Weight", "Rounding", "Places", "Precision", "Iteration", "Correct"))
+    print("{0}".format(94*"-"))
+    for res in results:
+        weight = "" if res["weight"] is None else "{0}/{1}".format(res["weight"], res["weight"] + 1)
+        iteration = "-" if res["iteration"] is None else str(res["iteration"])
+        print("{0:<23s} | {1:>6s} | {2:<16s} | {3:>6d} | {4:>9d} | {5:>9s} | {6:>7d}".format(
+            res["mean"], weight, res["rounding"], res["places"], res["precision"],
+            iteration, res["correct"]))
+    # End of function. Return 1.
+    return 1
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Parameter sweep of the means.")
+    parser.add_argument("--means", nargs="+", default=list(MEANS), choices=list(MEANS))
+    parser.add_argument("--weights", type=int, nargs="+", default=list(WEIGHTS))
+    parser.add_argument("--rounding", nargs="+", default=list(ROUNDING))
+    parser.add_argument("--places", type=int, nargs="+", default=list(PLACES))
+    parser.add_argument("--guard", type=int, default=GUARD)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+    # Run the sweep and print the table.
+    results = run_sweep(args.means, args.weights, args.rounding, args.places,
+                        args.guard, args.workers)
+    print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+            fh.write("\n")
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
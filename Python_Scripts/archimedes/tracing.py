@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Per-iteration trace records in a compact binary or NPZ file.
+
+Description:
+A trace consists of one record per sampled iteration
+
+    i         iteration
+    a1        half of the outer perimeter
+    b1        half of the inner perimeter
+    estimate  estimate of Pi
+    digits    number of correct places of the estimate
+
+The values a1, b1 and the estimate are stored as floats. Their leading
+digits show the convergence, the exact number of correct places is
+stored as integer. To keep long runs cheap only every sample-th
+iteration is recorded. The calling loop checks the recorder with
+
+    if tracer is not None and tracer.wants(i):
+        tracer.record(i, a1, b1, estimate)
+
+so disabled tracing costs one comparison with None and nothing is
+formatted or calculated for iterations which are not sampled.
+
+File formats:
+A path ending with .npz is written with NumPy when the recorder is
+closed. Every other path is written as binary file while running: a
+header of 8 bytes (b"ATRC", version) followed by little endian records
+of 40 bytes (int64, 3 x float64, int64).
+
+Usage:
+    with TraceRecorder("run.trace", sample=10, refpi=pi_digits(1000)) as tracer:
+        ...
+    records = read_trace("run.trace")
+'''
+# pylint: disable=invalid-name
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import struct
+
+# Import the modules of the package.
+from archimedes.reference import correct_digits
+
+# Define the header and the layout of a record.
+MAGIC = b"ATRC"
+VERSION = 1
+HEADER = struct.Struct("<4sI")
+RECORD = struct.Struct("<qdddq")
+
+# Define the names of the fields of a record.
+FIELDS = ("i", "a1", "b1", "estimate", "digits")
+
+# ----------------------------------------------------------------------
+# Class TraceRecorder
+# ----------------------------------------------------------------------
+class TraceRecorder:
+    '''Record every sample-th iteration of a calculation.'''
+
+    def __init__(self, path, sample=1, refpi=None):
+        # Store the path, the sampling and the reference value.
+        self.path = str(path)
+        self.sample = max(int(sample), 1)
+        self.refpi = refpi
+        self.count = 0
+        # Collect the records of a NPZ file, open a binary file.
+        self.npz = self.path.endswith(".npz")
+        self.rows = []
+        self.fh = None
+        if not self.npz:
+            self.fh = open(self.path, "wb")
+            self.fh.write(HEADER.pack(MAGIC, VERSION))
+
+    def wants(self, i):
+        '''Return True if the iteration i is recorded.'''
+        return i % self.sample == 0
+
+    def record(self, i, a1, b1, estimate):
+        '''Record an iteration.'''
+        # Count the correct places of the estimate.
+        digits = -1
+        if self.refpi is not None:
+            _, digits = correct_digits(str(estimate)[:len(self.refpi)], self.refpi)
+        row = (int(i), float(a1), float(b1), float(estimate), digits)
+        # Write the record or keep it for the NPZ file.
+        if self.npz:
+            self.rows.append(row)
+        else:
+            self.fh.write(RECORD.pack(*row))
+        self.count += 1
+
+    def close(self):
+        '''Write the NPZ file respectively close the binary file.'''
+        if self.npz:
+            # NumPy is only needed for NPZ files.
+            import numpy as np  # pylint: disable=import-outside-toplevel
+            columns = list(zip(*self.rows)) or [()]*len(FIELDS)
+            np.savez_compressed(self.path,
+                                **{name: np.array(col, dtype=np.int64 if name in ("i", "digits")
+                                                  else np.float64)
+                                   for name, col in zip(FIELDS, columns)})
+            self.rows = []
+        elif self.fh is not None:
+            self.fh.close()
+            self.fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+# ----------------------------------------------------------------------
+# Function read_trace()
+# ----------------------------------------------------------------------
+def read_trace(path):
+    '''Read a trace file and return the list of records.'''
+    path = str(path)
+    # Read a NPZ file.
+    if path.endswith(".npz"):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        with np.load(path) as data:
+            return [tuple(row) for row in zip(*(data[name].tolist() for name in FIELDS))]
+    # Read a binary file.
+    with open(path, "rb") as fh:
+        magic, version = HEADER.unpack(fh.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{0} is not a trace file of version {1}".format(path, VERSION))
+        return list(RECORD.iter_unpack(fh.read()))
@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+'''Verification of a result without a reference value of Pi.
+
+Description:
+The scripts count the correct places by comparing with a heredoc of
+10000 places or with archimedes.reference. Here a result is verified
+by a second calculation instead. All runs are a PiComputation of
+archimedes.netz, the engine of archimedes_netz_lto, which iterates the
+perimeters and refines them once after the last iteration:
+
+    1. The method runs with the precision P and the iteration N and at
+       the same time in a second process with the precision P + delta
+       and the iteration N + ceil(delta*N/places) (check_iteration()).
+    2. Optionally a different method runs in a third process with its
+       own predicted precision and iteration.
+    3. The common leading places of all results are the verified
+       places.
+
+The check run is good for about delta more places than the run with
+precision P, both for the rounding errors and for the error of the
+truncated recurrence, which falls linearly with the iterations. So the
+places spoiled by either error differ from the check run. The run of a
+different method converges differently and detects the errors as well.
+The verified places are a lower bound of the correct places, if the
+errors of the runs do not agree by chance.
+
+The runs work in parallel, so the wall-clock time is about the time of
+the slowest run on a computer with enough processors, i.e. of the check
+run with its few more iterations. The methods are the calibrated ones
+of archimedes.netz (CALIBRATED).
+
+Usage: (from the directory Python_Scripts)
+    python3 -m archimedes.verify
+    python3 -m archimedes.verify --places 5000 --method netz --other snellius
+    python3 -m archimedes.verify --places 2000 --delta 20 --check
+    python3 -m archimedes.verify --places 1000 --radius 2
+'''
+# pylint: disable=invalid-name
+# pylint: disable=import-outside-toplevel
+
+__author__ = "Dr. Peter Netz"
+__copyright__ = "Copyright (C) 2023, Dr. Peter Netz"
+__license__ = "MIT"
+__version__ = "0.1"
+
+# Import some standard Python modules.
+import argparse
+import math
+import time
+
+# Import the modules of the package.
+from archimedes.netz import CALIBRATED, PiComputation, init_values
+from archimedes.reference import correct_digits
+
+# Define the default method, places and additional precision.
+METHOD = "netz"
+PLACES = 1000
+DELTA = 10
+
+# Map the names of the methods to the methods of PiComputation.
+METHOD_OF = {name: method for method, name in CALIBRATED.items()}
+
+# ----------------------------------------------------------------------
+# Function calculate()
+# ----------------------------------------------------------------------
+def calculate(method, places, precision, iteration, r=1):
+    '''Return Pi of the named method after the iteration as string with
+    the places.'''
+    computation = PiComputation(places, precision, iteration, r, METHOD_OF[method])
+    acstr, _ = computation.run()
+    return acstr[:places+2]
+
+# ----------------------------------------------------------------------
+# Function check_iteration()
+# ----------------------------------------------------------------------
+def check_iteration(places, iteration, delta=DELTA):
+    '''Return the iteration of the check run with delta more places.
+
+    The iterations grow linearly with the places, so delta more places
+    need about delta*iteration/places more iterations.
+    '''
+    return iteration + math.ceil(delta*iteration/max(places, 1))
+
+# ----------------------------------------------------------------------
+# Function agreeing_places()
+# ----------------------------------------------------------------------
+def agreeing_places(*results):
+    '''Return the number of common leading places of the results.'''
+    places = min(len(res) for res in results) - 2
+    for res in results[1:]:
+        places = min(places, correct_digits(res, results[0])[1])
+    return max(places, 0)
+
+# ----------------------------------------------------------------------
+# Function self_verify()
+# ----------------------------------------------------------------------
+def self_verify(places, method=METHOD, precision=None, iteration=None, delta=DELTA,
+                other=None, executor=None, r=1):
+    '''Calculate a method with the precision P and a check run with
+    delta more places and optionally a different method in parallel.
+    Return a dictionary with the result of precision P, the verified
+    places and all runs.'''
+    # Use the predicted precision and iteration as default.
+    if precision is None or iteration is None:
+        predicted = init_values(places, method=METHOD_OF[method])
+        precision = precision or predicted[0]
+        iteration = iteration or predicted[1]
+    runs = [(method, places, precision, iteration),
+            (method, places, precision + delta, check_iteration(places, iteration, delta))]
+    if other is not None:
+        runs.append((other, places) + init_values(places, method=METHOD_OF[other]))
+    # Run all calculations in parallel.
+    own = executor is None
+    if own:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(len(runs))
+    try:
+        futures = [executor.submit(calculate, *run, r=r) for run in runs]
+        results = [future.result() for future in futures]
+    finally:
+        if own:
+            executor.shutdown()
+    # Return the result and the verified places.
+    return {"result": results[0], "verified": agreeing_places(*results),
+            "runs": [dict(zip(("method", "places", "precision", "iteration", "result"),
+                              run + (res,))) for run, res in zip(runs, results)]}
+
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main(argv=None):
+    '''Main script function.'''
+    # Parse the command line.
+    parser = argparse.ArgumentParser(description="Verification without reference.")
+    parser.add_argument("--places", type=int, default=PLACES)
+    parser.add_argument("--method", default=METHOD, choices=sorted(METHOD_OF))
+    parser.add_argument("--other", choices=sorted(METHOD_OF),
+                        help="verify with a different method as well")
+    parser.add_argument("--delta", type=int, default=DELTA)
+    parser.add_argument("--radius", type=int, default=1)
+    parser.add_argument("--check", action="store_true", help="compare with the reference")
+    args = parser.parse_args(argv)
+    # Run the verification.
+    start = time.perf_counter()
+    res = self_verify(args.places, args.method, delta=args.delta, other=args.other,
+                      r=args.radius)
+    elapsed = time.perf_counter() - start
+    # Print the runs.
+    print("{0:<17s} | {1:>9s} | {2:>9s} | {3:>8s}".format(
+        "Method", "Precision", "Iteration", "Agreeing"))
+    print("{0}".format(53*"-"))
+    for run in res["runs"]:
+        print("{0:<17s} | {1:>9d} | {2:>9d} | {3:>8d}".format(
+            run["method"], run["precision"], run["iteration"],
+            agreeing_places(res["result"], run["result"])))
+    # Print the verified places.
+    print("\nRequested places:", args.places)
+    print("Verified places:", res["verified"])
+    print("Time: {0:.4f} s".format(elapsed))
+    if args.check:
+        print("Correct places (reference):", correct_digits(res["result"])[1])
+    # End of function. Return 1.
+    return 1
+
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
@@ -68,17 +68,28 @@ def archimedes_outer_polygon(OA, OC, AC, iteration=5):
     # Return the approximation of Archimedes constant.
     return ac
 
-# Start values for the calculation of the inner polygon.
-# OA = Incircle radius
-# OC = Circumcircle radius
-# AC = Half of edge length
-# Start values 6-gon (hexagon)
-# OA = 1 -> unit circle.
-OA = 1
-OC = OA*(2/3)*math.sqrt(3)
-AC = OA/(math.sqrt(3))
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Start values for the calculation of the inner polygon.
+    # OA = Incircle radius
+    # OC = Circumcircle radius
+    # AC = Half of edge length
+    # Start values 6-gon (hexagon)
+    # OA = 1 -> unit circle.
+    OA = 1
+    OC = OA*(2/3)*math.sqrt(3)
+    AC = OA/(math.sqrt(3))
+    # Run a simple test.
+    iteration = 1020
+    Pi = archimedes_outer_polygon(OA, OC, AC, iteration=iteration)
+    print(Pi)
+    # End of function. Return None.
+    return None
 
-# Run a simple test.
-iteration = 1020
-Pi = archimedes_outer_polygon(OA, OC, AC, iteration=iteration)
-print(Pi)
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
@@ -31,6 +31,10 @@ __version__ = "0.1"
 
 # Import the standard Python module math.
 import math
+from itertools import islice
+
+# Import the generator of the inner polygon.
+from archimedes.sequences import inner_polygon
 
 # Define the function for the iterative calculation of Pi.
 def archimedes_inner_polygon(AB, AC, BC, iteration=5, verbose=False):
@@ -71,9 +75,8 @@ def print_table():
     BC = 1
     print("{0:<10s} | {1:<5s} | {2:<18s}".format("Iterations", "Edges", "Pi"))
     print("{0}".format(39*"-"))
-    for i in range (0,5):
-        n = 6 * 2**i
-        Pi = archimedes_inner_polygon(AB, AC, BC, iteration=i)
+    # Run the recurrence only once for all rows of the table.
+    for i, n, Pi, _, _ in islice(inner_polygon(AB, AC, BC), 5):
         print("{0:<10d} | {1:<5d} | {2:<.15f}".format(i, n, Pi))
     # End of function. Return None.
     return None
@@ -45,9 +45,6 @@ from decimal import getcontext
 ITERATION = 165
 PRECISION = 202
 
-# Set the precision of the decimal calculation.
-getcontext().prec = PRECISION
-
 # ------------------------------------------------------------------------------
 # Function archimedes_inner_polygon()
 # ------------------------------------------------------------------------------
@@ -124,6 +121,8 @@ def correct_digits(chkpi, refpi=''):
 # Main script function.
 def main(precision, iteration):
     '''Main script function.'''
+    # Set the precision of the decimal calculation.
+    getcontext().prec = precision
     # Start values 6-gon (hexagon) for the calculation of the inner polygon.
     # OB = Incircle radius
     # OE = Circumcircle radius
@@ -22,7 +22,10 @@ overflow error occurs.
 
 To-Do:
 Write a version of this script using the standard Python module
-'decimal' to overcome the limitation.
+'decimal' to overcome the limitation. The generator of the package
+archimedes (archimedes/sequences.py) runs this formulation with
+Decimal, double-double and fixed point numbers, see also
+archimedes/formulations.py.
 
 Test system:
 Python 3.8.10; Linux Mint 20.3 Una, Ubuntu Focal, GNU/Linux, x86_64
@@ -13,7 +13,10 @@ Test system:
 Python 3.8.10; Linux Mint 20.3 Una, Ubuntu Focal, GNU/Linux, x86_64
 
 To-Do:
-Write a version for big numbers to overcome the limitation.
+Write a version for big numbers to overcome the limitation. The
+generator of the package archimedes (archimedes/sequences.py) runs this
+formulation with Decimal, double-double and fixed point numbers, see
+also archimedes/formulations.py.
 
 Differences to SageMath:
 1. The standard Python module math has to be imported.
@@ -57,15 +60,26 @@ def archimedes_inner_polygon_method2(OB, OE, BE, iteration=5):
     # Return the approximation of Archimedes constant.
     return ac
 
-# Start values for the calculation of the inner polygon.
-# OB = Incircle radius
-# OE = Circumcircle radius
-# BE = Half of edge length
-OB = 1/2*math.sqrt(3)
-OE = 1
-BE = 1/2
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Start values for the calculation of the inner polygon.
+    # OB = Incircle radius
+    # OE = Circumcircle radius
+    # BE = Half of edge length
+    OB = 1/2*math.sqrt(3)
+    OE = 1
+    BE = 1/2
+    # Run a simple test.
+    iteration = 1010
+    Pi = archimedes_inner_polygon_method2(OB, OE, BE, iteration=iteration)
+    print(Pi)
+    # End of function. Return None.
+    return None
 
-# Run a simple test.
-iteration = 1010
-Pi = archimedes_inner_polygon_method2(OB, OE, BE, iteration=iteration)
-print(Pi)
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
@@ -22,7 +22,10 @@ places due to the specification of floats.
 
 To-Do:
 Write a version of this script using the standard Python module
-'decimal' to overcome the limitation.
+'decimal' to overcome the limitation. The generator of the package
+archimedes (archimedes/sequences.py) runs this formulation with
+Decimal, double-double and fixed point numbers, see also
+archimedes/formulations.py.
 
 Test system:
 Python 3.8.10; Linux Mint 20.3 Una, Ubuntu Focal, GNU/Linux, x86_64
@@ -33,9 +36,8 @@ Differences to the usage in SageMath:
 '''
 # pylint: disable=invalid-name
 # pylint: disable=unused-argument
-# pylint: disable=eval-used
-# pylint: disable=global-statement
 # pylint: disable=too-many-locals
+# pylint: disable=multiple-statements
 
 __author__ = "Dr. Peter Netz"
 __copyright__ = "Copyright (C), 2023 Dr. Peter Netz"
@@ -49,7 +51,8 @@ import math
 ITERATION = 1021
 
 # Set the ouput flags.
-# Used so far: DATA, VERBOSE and ERROR.
+# Used so far: DATA, VERBOSE and ERROR. The flags are checked before
+# userprint() is called, so no message is formatted if a flag is False.
 INFO = False
 DATA = False
 WARNING = False
@@ -61,20 +64,16 @@ DEBUG = False
 # Define the helper function userprint()
 # **************************************
 def userprint(*args, **kwarks):
-    '''Print further informations depending on the related flag.'''
-    # Declare the global variables.
-    global INFO, DATA, WARNING, VERBOSE, ERROR, DEBUG
-    # Define the required dictionary.
-    dy = {0: "INFO", 1: "DATA", 2: "WARNING",
-          3: "VERBOSE", 4: "ERROR", 5: "DEBUG"}
-    # Loop over the keys of the dictionary.
-    for key in dy:
-        # Print output if value is True.
-        if args[0] == key and eval(dy[key]):
-            # Loop over the list of arguments starting after the declared type.
-            for arg in args[1:]:
-                # Print each argument on a separate line.
-                print(arg)
+    '''Print further informations on separate lines.
+
+    The first argument is the type of the output (0: INFO, 1: DATA,
+    2: WARNING, 3: VERBOSE, 4: ERROR, 5: DEBUG). The caller checks the
+    related flag, e.g. "if DATA: userprint(1, msg)".
+    '''
+    # Loop over the list of arguments starting after the declared type.
+    for arg in args[1:]:
+        # Print each argument on a separate line.
+        print(arg)
     # End of function. Return 1 for success.
     return 1
 
@@ -109,40 +108,41 @@ def inner_from_outer_method3(OB, OE, BE, iteration=5):
         # Calculate the number of edges.
         n = 6*2**i
         # Print loop data to the terminal.
-        msg0 = "-"*24
-        msg1 = "{0}{1}".format("Loop: ", i)
-        msg2 = "{0}{1}".format("Edges: ", n)
-        userprint(1, msg0, msg1, msg2)
+        if DATA:
+            msg0 = "-"*24
+            msg1 = "{0}{1}".format("Loop: ", i)
+            msg2 = "{0}{1}".format("Edges: ", n)
+            userprint(1, msg0, msg1, msg2)
         # No iteration on first loop.
         if i == 0:
             # Calculate the approximation for Pi.
             ac = (BE/OA)*n
             # Print output to the terminal.
-            userprint(3, "{0}{1}".format("BE: ", BE), "{0}{1}".format("OA: ", OA))
+            if VERBOSE: userprint(3, "{0}{1}".format("BE: ", BE), "{0}{1}".format("OA: ", OA))
             # Store value of pi in oldpi.
             oldac = ac
             # Print output to the terminal.
-            userprint(1, "{0}{1}".format("Pi: ", ac))
+            if DATA: userprint(1, "{0}{1}".format("Pi: ", ac))
         else:
             try:
                 # Calculate the length of the hypotenuse and the length of the edge.
                 BF = (BE*OB)/(OB+OE)
                 OF = math.sqrt(OB**2+BF**2)
                 # Print output to the terminal.
-                userprint(3, "{0}{1}".format("BF: ", BF), "{0}{1}".format("OF: ", OF))
+                if VERBOSE: userprint(3, "{0}{1}".format("BF: ", BF), "{0}{1}".format("OF: ", OF))
                 # Store the values for the next iteration.
                 OB = OB+((OA-OF)*math.sqrt(1-(BF**2/OF**2)))
                 BE = BF*OA/OF
                 # Print output to the terminal.
-                userprint(3, "{0}{1}".format("OB: ", OB), "{0}{1}".format("BE: ", BE))
+                if VERBOSE: userprint(3, "{0}{1}".format("OB: ", OB), "{0}{1}".format("BE: ", BE))
                 # Calculate the approximation for Pi.
                 ac = (BE/OA)*n
                 # Print output to the terminal.
-                userprint(1, "{0}{1}".format("Pi: ", ac))
+                if DATA: userprint(1, "{0}{1}".format("Pi: ", ac))
                 # Check whether the value for Pi is increasing.
                 if ac < oldac:
                     # Print an error message to the terminal.
-                    userprint(4, "{0} {1}".format(errmsg0, errmsg))
+                    if ERROR: userprint(4, "{0} {1}".format(errmsg0, errmsg))
                     # Restore the value of ac.
                     ac = oldac
                     # Leave loop.
@@ -151,7 +151,7 @@ def inner_from_outer_method3(OB, OE, BE, iteration=5):
                 oldac = ac
             except OverflowError:
                 # Print an error message to the terminal.
-                userprint(4, "{0} {1}".format(errmsg1, errmsg))
+                if ERROR: userprint(4, "{0} {1}".format(errmsg1, errmsg))
                 # Leave loop.
                 break
     # Return the approximation of the Archimedes constant.
@@ -39,9 +39,6 @@ from decimal import getcontext
 ITERATION = 59
 PRECISION = 86
 
-# Set the precision of the decimal calculation.
-getcontext().prec = PRECISION
-
 # Import the standard Python module math.
 import math
 
@@ -73,19 +70,32 @@ def archimedes_inner_polygon(AB, AC, BC, iteration=5, verbose=True):
     # Return the approximation of Archimedes constant.
     return ac
 
-# Start values 6-gon (hexagon) for the calculation of the inner polygon.
-# OB = Incircle radius
-# OE = Circumcircle radius
-# BE = Half of edge length
-AC = D(3).sqrt()
-AB = D(2)
-BC = D(1)
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Set the precision of the decimal calculation.
+    getcontext().prec = PRECISION
+    # Start values 6-gon (hexagon) for the calculation of the inner polygon.
+    # OB = Incircle radius
+    # OE = Circumcircle radius
+    # BE = Half of edge length
+    AC = D(3).sqrt()
+    AB = D(2)
+    BC = D(1)
+    # Run a simple test.
+    Pi = archimedes_inner_polygon(AB, AC, BC, iteration=ITERATION)
+    print("Precision:", PRECISION)
+    print("Iterations:", ITERATION)
+    print("Ludolph van Ceulen (* 1540; † 1610) calculated 35 places. We do so, too.")
+    print("This calculation is like a simulation of the calculation by a human being.")
+    print("Calculation: {:.35f}".format(Pi))
+    print("Reference:   3.14159265358979323846264338327950288")
+    # End of function. Return None.
+    return None
 
-# Run a simple test.
-Pi = archimedes_inner_polygon(AB, AC, BC, iteration=ITERATION)
-print("Precision:", PRECISION)
-print("Iterations:", ITERATION)
-print("Ludolph van Ceulen (* 1540; † 1610) calculated 35 places. We do so, too.")
-print("This calculation is like a simulation of the calculation by a human being.")
-print("Calculation: {:.35f}".format(Pi))
-print("Reference:   3.14159265358979323846264338327950288")
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
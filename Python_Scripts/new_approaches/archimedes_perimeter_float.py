@@ -4,19 +4,30 @@
 # Import the standard Python module math.
 import math
 
-# Define the start values.
-a0 = 2 * math.sqrt(3)  # half of outer perimeter
-b0 = 3                 # half of inner perimeter
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Define the start values.
+    a0 = 2 * math.sqrt(3)  # half of outer perimeter
+    b0 = 3                 # half of inner perimeter
+    # Run an iteration from 0 to 5 to get 5 values of Pi.
+    for i in range(0, 5):
+        if i == 0:
+            a1 = a0
+            b1 = b0
+        else:
+            a1 = (2*a0*b0)/(a0 + b0)
+            b1 = math.sqrt(b0*a1)
+        b0 = b1
+        a0 = a1
+        ac = (b1 + a1) / 2
+        print(ac)
+    # End of function. Return None.
+    return None
 
-# Run an iteration from 0 to 5 to get 5 values of Pi.
-for i in range(0, 5):
-    if i == 0:
-        a1 = a0
-        b1 = b0
-    else:
-        a1 = (2*a0*b0)/(a0 + b0)
-        b1 = math.sqrt(b0*a1)
-    b0 = b1
-    a0 = a1
-    ac = (b1 + a1) / 2
-    print(ac)
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
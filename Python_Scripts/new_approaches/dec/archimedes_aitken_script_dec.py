@@ -32,9 +32,8 @@ ITERATION = 84
 PRECISION = 152
 ROUNDING = ROUND_HALF_DOWN
 
-# Define and set the user defined context.
+# Define the user defined context.
 local_context = Context(prec=PRECISION, rounding=ROUNDING)
-setcontext(local_context)
 
 # Define a heredoc consisting of Pi with 100 places.
 PI100 = '''
@@ -115,6 +114,8 @@ def archimedes_aitken(iteration):
 # ++++++++++++++++++++
 def main(iteration):
     '''Main script function.'''
+    # Set the user defined context.
+    setcontext(local_context)
     # Declare the global variable.
     global PI100
     # Remove whitespaces from herestring.
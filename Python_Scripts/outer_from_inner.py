@@ -54,15 +54,26 @@ def outer_from_inner_polygon(AB, AC, BC, iteration=5, verbose=True):
     # Return the approximation of Archimedes constant.
     return ac
 
-# Start values 6-gon (hexagon) for the calculation of the inner polygon.
-# OB = Incircle radius
-# OE = Circumcircle radius
-# BE = Half of edge length
-AC = math.sqrt(3)
-AB = 2
-BC = 1
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Start values 6-gon (hexagon) for the calculation of the inner polygon.
+    # OB = Incircle radius
+    # OE = Circumcircle radius
+    # BE = Half of edge length
+    AC = math.sqrt(3)
+    AB = 2
+    BC = 1
+    # Run a simple test.
+    iteration = 15
+    Pi = outer_from_inner_polygon(AB, AC, BC, iteration=iteration)
+    print(Pi)
+    # End of function. Return None.
+    return None
 
-# Run a simple test.
-iteration = 15
-Pi = outer_from_inner_polygon(AB, AC, BC, iteration=iteration)
-print(Pi)
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
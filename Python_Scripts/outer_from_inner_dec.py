@@ -35,10 +35,6 @@ from decimal import Decimal as D
 #from decimal import getcontext, ROUND_DOWN
 from decimal import *
 
-# Set precision.
-getcontext().prec = 204
-getcontext().rounding = ROUND_DOWN
-
 # Define the function for the iterative calculation of Pi.
 def outer_from_inner_polygon(AB, AC, BC, iteration=5, verbose=True):
     '''Archimedes algorithm for calculating the perimeter
@@ -63,16 +59,30 @@ def outer_from_inner_polygon(AB, AC, BC, iteration=5, verbose=True):
     # Return the approximation of Archimedes constant.
     return ac
 
-# Start values 6-gon (hexagon) for the calculation of the inner polygon.
-# OB = Incircle radius
-# OE = Circumcircle radius
-# BE = Half of edge length
-AC = D(3).sqrt()
-AB = D(2)
-BC = D(1)
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Set precision.
+    getcontext().prec = 204
+    getcontext().rounding = ROUND_DOWN
+    # Start values 6-gon (hexagon) for the calculation of the inner polygon.
+    # OB = Incircle radius
+    # OE = Circumcircle radius
+    # BE = Half of edge length
+    AC = D(3).sqrt()
+    AB = D(2)
+    BC = D(1)
+    # Run a simple test.
+    iteration = 167
+    Pi = outer_from_inner_polygon(AB, AC, BC, iteration=iteration)
+    print("{0:.110f}".format(Pi))
+    print("3.1415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679")
+    # End of function. Return None.
+    return None
 
-# Run a simple test.
-iteration = 167
-Pi = outer_from_inner_polygon(AB, AC, BC, iteration=iteration)
-print("{0:.110f}".format(Pi))
-print("3.1415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679")
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()
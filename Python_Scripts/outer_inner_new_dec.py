@@ -38,9 +38,6 @@ from decimal import getcontext
 ITERATION = 59
 PRECISION = 39
 
-# Set the precision of the decimal calculation.
-getcontext().prec = PRECISION
-
 # Define the function for the iterative calculation of Pi.
 def outer_inner_polygon(OA, OC, AC, iteration=4):
     '''Archimedes algorithm for calculating the perimeter of the outer
@@ -68,21 +65,34 @@ def outer_inner_polygon(OA, OC, AC, iteration=4):
     # Return the approximation of Archimedes constant.
     return ac
 
-# Start values for the calculation of the outer polygon.
-# OA = Incircle radius
-# OC = Circumcircle radius
-# AC = Half of edge length
-# Start values 6-gon (hexagon)
-# OA = 1 -> unit circle.
-OA = D(1)
-OC = D(OA)*(D(2)/D(3))*D(3).sqrt()
-AC = D(OA)/(D(3).sqrt())
+# ++++++++++++++++++++
+# Main script function
+# ++++++++++++++++++++
+def main():
+    '''Main script function.'''
+    # Set the precision of the decimal calculation.
+    getcontext().prec = PRECISION
+    # Start values for the calculation of the outer polygon.
+    # OA = Incircle radius
+    # OC = Circumcircle radius
+    # AC = Half of edge length
+    # Start values 6-gon (hexagon)
+    # OA = 1 -> unit circle.
+    OA = D(1)
+    OC = D(OA)*(D(2)/D(3))*D(3).sqrt()
+    AC = D(OA)/(D(3).sqrt())
+    # Run a simple test.
+    Pi = outer_inner_polygon(OA, OC, AC, iteration=ITERATION)
+    print("Precision:", PRECISION)
+    print("Iterations:", ITERATION)
+    print("Ludolph van Ceulen (* 1540; † 1610) calculated 35 places. We do so, too.")
+    print("This calculation is like a simulation of the calculation by a human being.")
+    print("Calculation: {:.35f}".format(Pi))
+    print("Reference:   3.14159265358979323846264338327950288")
+    # End of function. Return None.
+    return None
 
-# Run a simple test.
-Pi = outer_inner_polygon(OA, OC, AC, iteration=ITERATION)
-print("Precision:", PRECISION)
-print("Iterations:", ITERATION)
-print("Ludolph van Ceulen (* 1540; † 1610) calculated 35 places. We do so, too.")
-print("This calculation is like a simulation of the calculation by a human being.")
-print("Calculation: {:.35f}".format(Pi))
-print("Reference:   3.14159265358979323846264338327950288")
+# Execute the script as module or as program.
+if __name__ == '__main__':
+    # Call the main script function.
+    main()